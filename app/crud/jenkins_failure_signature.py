@@ -0,0 +1,187 @@
+from bson import ObjectId
+from pymongo import UpdateOne
+from app.dependencies import (
+    jenkins_log_collection,
+    jenkins_test_collection,
+    jenkins_failure_signature_collection,
+)
+from app.schemas.jenkins_failure_signature import get_jenkins_failure_signature_in_db
+from app.utils.constants import FailureSignature
+
+
+def get_jenkins_log_failure_signatures(failure_signatures: dict[str, dict]) -> dict:
+    # -> Stored on the log document, its count and example tests per signature
+    return {
+        signature: dict(
+            count=failure_signature["count"],
+            test_names=failure_signature["test_names"],
+        )
+        for signature, failure_signature in failure_signatures.items()
+    }
+
+
+def get_failure_signature_examples(
+    jenkins_log_id: str, failure_signature: dict
+) -> list[dict]:
+    return [
+        dict(test_name=test_name, jenkins_log_id=jenkins_log_id)
+        for test_name in failure_signature["test_names"]
+    ]
+
+
+async def update_jenkins_failure_signatures(
+    user_id: str,
+    jenkins_log_updates: list[tuple[str, dict[str, dict], set[str]]],
+) -> None:
+    # -> Every update carries the signatures parsed for one log and the ones
+    #    seen in that log for the first time, which count towards `jenkins_logs`
+    updates = [
+        UpdateOne(
+            {"user_id": user_id, "signature": signature},
+            {
+                "$setOnInsert": {"failure_reason": failure_signature["failure_reason"]},
+                "$inc": {
+                    "count": failure_signature["count"],
+                    "jenkins_logs": int(signature in new_signatures),
+                },
+                # -> The newest examples are kept
+                "$push": {
+                    "examples": {
+                        "$each": get_failure_signature_examples(
+                            jenkins_log_id, failure_signature
+                        ),
+                        "$slice": -FailureSignature.MAX_EXAMPLES,
+                    }
+                },
+            },
+            upsert=True,
+        )
+        for jenkins_log_id, failure_signatures, new_signatures in jenkins_log_updates
+        for signature, failure_signature in failure_signatures.items()
+    ]
+
+    if updates:
+        await jenkins_failure_signature_collection.bulk_write(updates, ordered=False)
+
+
+async def delete_jenkins_failure_signatures(
+    user_id: str, jenkins_log_id: str, failure_signatures: dict[str, dict]
+) -> None:
+    if failure_signatures:
+        await jenkins_failure_signature_collection.bulk_write(
+            [
+                UpdateOne(
+                    {"user_id": user_id, "signature": signature},
+                    {
+                        "$inc": {
+                            "count": -failure_signature["count"],
+                            "jenkins_logs": -1,
+                        },
+                        "$pull": {"examples": {"jenkins_log_id": jenkins_log_id}},
+                    },
+                )
+                for signature, failure_signature in failure_signatures.items()
+            ],
+            ordered=False,
+        )
+
+
+async def get_jenkins_failure_signatures(
+    user_id: str, limit: int, jenkins_log_id: str | None = None
+) -> list[dict] | None:
+    if jenkins_log_id:
+        return await get_jenkins_log_failure_signature_clusters(
+            user_id, jenkins_log_id, limit
+        )
+
+    jenkins_failure_signatures = []
+    async for failure_signature in (
+        jenkins_failure_signature_collection.find(
+            {"user_id": user_id, "count": {"$gt": 0}}
+        )
+        .sort("count", -1)
+        .limit(limit)
+    ):
+        # -> Examples of deleted logs are pulled, a cluster left with fewer
+        #    examples than it could show is refilled once from its remaining
+        #    tests and stored again
+        if len(failure_signature["examples"]) < min(
+            failure_signature["count"], FailureSignature.MAX_EXAMPLES
+        ):
+            failure_signature["examples"] = await refill_failure_signature_examples(
+                user_id, failure_signature["signature"]
+            )
+        jenkins_failure_signatures.append(
+            get_jenkins_failure_signature_in_db(failure_signature)
+        )
+    return jenkins_failure_signatures
+
+
+async def refill_failure_signature_examples(user_id: str, signature: str) -> list[dict]:
+    examples = [
+        dict(
+            test_name=jenkins_test["test_name"],
+            jenkins_log_id=jenkins_test["jenkins_log_id"],
+        )
+        async for jenkins_test in jenkins_test_collection.find(
+            {"user_id": user_id, "failure_signature": signature},
+            projection={"test_name": True, "jenkins_log_id": True},
+        )
+        .sort("_id", -1)
+        .limit(FailureSignature.MAX_EXAMPLES)
+    ][::-1]
+
+    await jenkins_failure_signature_collection.update_one(
+        {"user_id": user_id, "signature": signature},
+        {"$set": {"examples": examples}},
+    )
+    return examples
+
+
+async def get_jenkins_log_failure_signature_clusters(
+    user_id: str, jenkins_log_id: str, limit: int
+) -> list[dict] | None:
+    jenkins_log = await jenkins_log_collection.find_one(
+        {"_id": ObjectId(jenkins_log_id), "user_id": user_id},
+        projection={"failure_signatures": True},
+    )
+    if not jenkins_log:
+        return None
+
+    # -> Counts and examples of one log are stored on the log itself, only
+    #    the normalised reasons are read from the user wide clusters
+    jenkins_log_failure_signatures = sorted(
+        jenkins_log.get("failure_signatures", {}).items(),
+        key=lambda signature_item: signature_item[1]["count"],
+        reverse=True,
+    )[:limit]
+    failure_reasons = {
+        failure_signature["signature"]: failure_signature["failure_reason"]
+        async for failure_signature in jenkins_failure_signature_collection.find(
+            {
+                "user_id": user_id,
+                "signature": {
+                    "$in": [
+                        signature for signature, _ in jenkins_log_failure_signatures
+                    ]
+                },
+            },
+            projection={"signature": True, "failure_reason": True},
+        )
+    }
+
+    return [
+        get_jenkins_failure_signature_in_db(
+            dict(
+                signature=signature,
+                failure_reason=failure_reasons[signature],
+                count=failure_signature["count"],
+                jenkins_logs=1,
+                examples=get_failure_signature_examples(
+                    jenkins_log_id, failure_signature
+                ),
+            )
+        )
+        for signature, failure_signature in jenkins_log_failure_signatures
+        if signature in failure_reasons
+    ]
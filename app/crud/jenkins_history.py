@@ -1,6 +1,8 @@
+from typing import AsyncIterator
 from bson import ObjectId
 from app.dependencies import jenkins_history_collection
 from app.schemas.jenkins_history import get_jenkins_history_in_db
+from app.utils.pagination import get_page_query
 
 
 async def get_jenkins_history_by_id(user_id: str, jenkins_history_id: str) -> dict:
@@ -12,20 +14,31 @@ async def get_jenkins_history_by_id(user_id: str, jenkins_history_id: str) -> di
     return None
 
 
-async def get_all_jenkins_histories(user_id: str) -> list[dict]:
-    jenkins_histories = []
-    async for jenkins_history in jenkins_history_collection.find({"user_id": user_id}):
-        jenkins_histories.append(get_jenkins_history_in_db(jenkins_history))
-    return jenkins_histories
+async def get_all_jenkins_histories(
+    user_id: str, after: str | None = None, limit: int | None = None
+) -> list[dict]:
+    return [
+        jenkins_history
+        async for jenkins_history in iter_jenkins_histories(user_id, after, limit)
+    ]
 
 
-async def delete_jenkins_history_by_id(user_id: str, jenkins_history_id: str) -> dict:
-    jenkins_history = await jenkins_history_collection.find_one(
+def iter_jenkins_histories(
+    user_id: str, after: str | None = None, limit: int | None = None
+) -> AsyncIterator[dict]:
+    cursor = jenkins_history_collection.find(
+        get_page_query({"user_id": user_id}, after)
+    ).sort("_id", 1)
+    if limit:
+        cursor = cursor.limit(limit)
+
+    return (
+        get_jenkins_history_in_db(jenkins_history) async for jenkins_history in cursor
+    )
+
+
+async def delete_jenkins_history_by_id(user_id: str, jenkins_history_id: str) -> bool:
+    deleted_jenkins_history = await jenkins_history_collection.delete_one(
         {"_id": ObjectId(jenkins_history_id), "user_id": user_id}
     )
-    if jenkins_history:
-        await jenkins_history_collection.delete_one(
-            {"_id": ObjectId(jenkins_history_id), "user_id": user_id}
-        )
-        return True
-    return False
+    return deleted_jenkins_history.deleted_count > 0
@@ -1,39 +1,379 @@
-import re
-import requests
+import asyncio
+import hashlib
+import tempfile
 from datetime import datetime
-from requests.exceptions import RequestException
+from typing import AsyncIterable, AsyncIterator
 from bson import ObjectId
 from fastapi import HTTPException, status
-from app.dependencies import jenkins_log_collection, jenkins_history_collection
-from app.models.jenkins_log import ParsedLogData, ChartLogData, JenkinsLogCreateComplete
+from pymongo import ReturnDocument
+from app.dependencies import (
+    jenkins_log_collection,
+    jenkins_history_collection,
+    jenkins_log_bucket,
+)
+from app.crud.jenkins_test import (
+    create_jenkins_tests,
+    get_jenkins_test_documents,
+    get_jenkins_log_test_columns,
+    delete_jenkins_tests_by_log_id,
+)
+from app.crud.jenkins_rollup import update_jenkins_rollups
+from app.crud.jenkins_failure_signature import (
+    get_jenkins_log_failure_signatures,
+    update_jenkins_failure_signatures,
+    delete_jenkins_failure_signatures,
+)
 from app.models.jenkins_history import JenkinsHistoryCreateComplete
-from app.schemas.jenkins_log import get_jenkins_log_in_db
-from app.utils.constants import TestResult, RegexString
+from app.schemas.jenkins_log import (
+    get_jenkins_log_in_db,
+    get_jenkins_log_summary_in_db,
+    get_progressive_jenkins_log_in_db,
+)
+from app.utils.cache import log_result_cache
+from app.utils.codec import encode_parsed_log_data
+from app.utils.constants import (
+    LogParser,
+    LogUpload,
+    LogStorage,
+    LogBatch,
+    LogEvent,
+    JenkinsApi,
+    FailureSignature,
+)
+from app.utils.executor import run_parse_log_segment, run_parse_log_file
+from app.utils.fetcher import open_log_response, iter_response_chunks
+from app.utils.parser import (
+    ParsedLogColumns,
+    LogStreamSplitter,
+    aiter_log_segments,
+    find_log_file_segment,
+)
+from app.utils.pagination import get_page_query
+from app.utils.progress import LogProgress, get_sse_message
+from app.utils.jobs import run_shielded
 from app.utils.timer import timeit
 
 
-async def create_jenkins_log(user_id: str, jenkins_log_data: dict) -> dict:
-    log_data, time_spent = get_log_results(jenkins_log_data["external_url"])
+# -> Progressive polls never read the parsed tests of the log
+PROGRESSIVE_LOG_PROJECTION = {
+    "chart_log_data": True,
+    "user_id": True,
+    "log_offset": True,
+    "log_tail": True,
+    "log_is_header": True,
+    "is_complete": True,
+}
 
-    parsed_log_data, chart_log_data = log_data
-    chart_log_data = chart_log_data.model_dump()
 
-    jenkins_log_data_complete = JenkinsLogCreateComplete(
-        parsed_log_data=parsed_log_data,
-        chart_log_data=chart_log_data,
+async def create_jenkins_log(
+    user_id: str, jenkins_log_data: dict, progress: LogProgress | None = None
+) -> dict:
+    log_results, time_spent = await get_log_results(
+        jenkins_log_data["external_url"], progress
+    )
+
+    # -> Fetching and parsing can be cancelled, saving is not
+    return await run_shielded(save_jenkins_log(user_id, log_results, time_spent))
+
+
+async def iter_jenkins_log_events(
+    user_id: str, jenkins_log_data: dict
+) -> AsyncIterator[str]:
+    progress = LogProgress()
+    task = asyncio.create_task(create_jenkins_log(user_id, jenkins_log_data, progress))
+    task.add_done_callback(progress.close)
+
+    try:
+        async for message in progress.iter_events():
+            yield message
+
+        try:
+            jenkins_log = task.result()
+        except HTTPException as exception:
+            yield get_sse_message(
+                LogEvent.ERROR,
+                dict(status_code=exception.status_code, detail=exception.detail),
+            )
+        except Exception:
+            yield get_sse_message(
+                LogEvent.ERROR,
+                dict(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail="Unable to parse Jenkins log",
+                ),
+            )
+        else:
+            yield get_sse_message(
+                LogEvent.COMPLETE,
+                dict(
+                    id=jenkins_log["id"],
+                    chart_log_data=jenkins_log["chart_log_data"],
+                    user_id=jenkins_log["user_id"],
+                ),
+            )
+    finally:
+        # -> A client that disconnects stops the fetch and parse, a log that
+        #    is already being saved is still saved completely
+        task.cancel()
+
+
+async def create_uploaded_jenkins_log(
+    user_id: str, chunks: AsyncIterable[bytes]
+) -> dict:
+    log_results, time_spent = await get_uploaded_log_results(chunks)
+    return await run_shielded(save_jenkins_log(user_id, log_results, time_spent))
+
+
+async def create_jenkins_logs(user_id: str, external_urls: list[str]) -> list[dict]:
+    semaphore = asyncio.Semaphore(LogBatch.MAX_CONCURRENCY)
+
+    async def get_batch_log_results(external_url: str):
+        async with semaphore:
+            try:
+                return await get_log_results(external_url)
+            except HTTPException as exception:
+                return exception
+            except Exception:
+                return HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail="Unable to parse Jenkins log",
+                )
+
+    # -> Logs are fetched and parsed concurrently, a failed URL is reported
+    #    in its own result instead of failing the whole batch
+    batch_log_results = await asyncio.gather(
+        *(get_batch_log_results(external_url) for external_url in external_urls)
+    )
+
+    jenkins_logs = await run_shielded(
+        save_jenkins_logs(
+            user_id,
+            [
+                log_results
+                for log_results in batch_log_results
+                if not isinstance(log_results, HTTPException)
+            ],
+        )
+    )
+
+    jenkins_logs = iter(jenkins_logs)
+    jenkins_log_results = []
+    for external_url, log_results in zip(external_urls, batch_log_results):
+        if isinstance(log_results, HTTPException):
+            jenkins_log_results.append(
+                dict(
+                    external_url=external_url,
+                    status_code=log_results.status_code,
+                    detail=log_results.detail,
+                )
+            )
+        else:
+            jenkins_log_results.append(
+                dict(
+                    external_url=external_url,
+                    status_code=status.HTTP_200_OK,
+                    jenkins_log=get_jenkins_log_summary_in_db(next(jenkins_logs)),
+                )
+            )
+    return jenkins_log_results
+
+
+async def ingest_progressive_jenkins_log(user_id: str, jenkins_log_data: dict) -> dict:
+    external_url = jenkins_log_data["external_url"]
+
+    jenkins_log = await jenkins_log_collection.find_one(
+        {
+            "user_id": user_id,
+            "external_url": external_url,
+            "log_offset": {"$exists": True},
+        },
+        projection=PROGRESSIVE_LOG_PROJECTION,
+        sort=[("_id", -1)],
+    )
+
+    if jenkins_log and jenkins_log["is_complete"]:
+        return get_progressive_jenkins_log_in_db(jenkins_log, [])
+
+    # -> The log is only created once its first output was fetched and parsed,
+    #    so a bad URL leaves no empty log behind
+    (log_results, log_progress), time_spent = await get_progressive_log_results(
+        external_url,
+        *(
+            (
+                jenkins_log["log_offset"],
+                jenkins_log["log_tail"],
+                jenkins_log["log_is_header"],
+            )
+            if jenkins_log
+            else (0, b"", True)
+        ),
+    )
+    chart_log_data = log_results.get_chart_log_data()
+    failure_signatures = log_results.get_failure_signatures()
+
+    is_created = jenkins_log is None
+    if is_created:
+        test_count = 0
+        jenkins_log = dict(
+            chart_log_data=chart_log_data,
+            failure_signatures=get_jenkins_log_failure_signatures(failure_signatures),
+            user_id=user_id,
+            external_url=external_url,
+            **log_progress,
+        )
+        await jenkins_log_collection.insert_one(jenkins_log)
+        new_signatures = set(failure_signatures)
+    else:
+        test_count = sum(jenkins_log["chart_log_data"].values())
+        jenkins_log = await update_progressive_jenkins_log(
+            jenkins_log, log_progress, chart_log_data, failure_signatures
+        )
+        # -> A signature whose log count equals this poll's count was first
+        #    seen in this poll
+        new_signatures = {
+            signature
+            for signature, failure_signature in failure_signatures.items()
+            if jenkins_log["failure_signatures"][signature]["count"]
+            == failure_signature["count"]
+        }
+
+    # -> Tests of a running build only live in the tests collection, so the
+    #    log document does not grow with the console
+    jenkins_log_id = str(jenkins_log["_id"])
+    time_executed = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    await create_jenkins_tests(
+        get_jenkins_test_documents(
+            user_id, jenkins_log_id, time_executed, log_results, test_count
+        )
+    )
+    await update_jenkins_rollups(
+        user_id, [(jenkins_log["_id"], chart_log_data, int(is_created))]
+    )
+    await update_jenkins_failure_signatures(
+        user_id, [(jenkins_log_id, failure_signatures, new_signatures)]
+    )
+
+    if is_created:
+        await jenkins_history_collection.insert_one(
+            JenkinsHistoryCreateComplete(
+                time_executed=time_executed,
+                time_spent=round(time_spent, 2),
+                jenkins_log_id=jenkins_log_id,
+                user_id=user_id,
+            ).model_dump()
+        )
+    else:
+        await jenkins_history_collection.update_one(
+            {"jenkins_log_id": jenkins_log_id, "user_id": user_id},
+            {
+                "$set": {"time_executed": time_executed},
+                "$inc": {"time_spent": round(time_spent, 2)},
+            },
+        )
+
+    # -> A finished build no longer grows, so its tests are moved to the
+    #    encoded storage like any other parsed log
+    if jenkins_log["is_complete"]:
+        await jenkins_log_collection.update_one(
+            {"_id": jenkins_log["_id"]},
+            {
+                "$set": await encode_jenkins_log_data(
+                    await get_jenkins_log_test_columns(user_id, jenkins_log_id)
+                ),
+                "$unset": {"log_tail": ""},
+            },
+        )
+
+    return get_progressive_jenkins_log_in_db(jenkins_log, log_results.to_documents())
+
+
+async def update_progressive_jenkins_log(
+    jenkins_log: dict,
+    log_progress: dict,
+    chart_log_data: dict,
+    failure_signatures: dict[str, dict],
+) -> dict:
+    jenkins_log_update = {
+        "$inc": {
+            **{
+                f"chart_log_data.{field}": count
+                for field, count in chart_log_data.items()
+            },
+            **{
+                f"failure_signatures.{signature}.count": failure_signature["count"]
+                for signature, failure_signature in failure_signatures.items()
+            },
+        },
+        "$set": log_progress,
+    }
+    if failure_signatures:
+        jenkins_log_update["$push"] = {
+            f"failure_signatures.{signature}.test_names": {
+                "$each": failure_signature["test_names"],
+                "$slice": FailureSignature.MAX_EXAMPLES,
+            }
+            for signature, failure_signature in failure_signatures.items()
+        }
+
+    # -> The offset acts as a guard against two polls appending the same
+    #    output, and only the counters are read back
+    updated_jenkins_log = await jenkins_log_collection.find_one_and_update(
+        {"_id": jenkins_log["_id"], "log_offset": jenkins_log["log_offset"]},
+        jenkins_log_update,
+        projection=dict(PROGRESSIVE_LOG_PROJECTION, failure_signatures=True),
+        return_document=ReturnDocument.AFTER,
+    )
+
+    if not updated_jenkins_log:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Parsed Jenkins log is being updated by another request",
+        )
+    return updated_jenkins_log
+
+
+async def save_jenkins_log(
+    user_id: str, log_results: ParsedLogColumns, time_spent: float
+) -> dict:
+    # -> Parsed columns go straight to BSON documents, pydantic models are only
+    #    built for the response
+    failure_signatures = log_results.get_failure_signatures()
+    jenkins_log_data_complete = dict(
+        **await encode_jenkins_log_data(log_results),
+        chart_log_data=log_results.get_chart_log_data(),
+        failure_signatures=get_jenkins_log_failure_signatures(failure_signatures),
         user_id=user_id,
     )
-    jenkins_log_data_complete = jenkins_log_data_complete.model_dump()
 
-    # -> Insert parsed Jenkins log
+    # -> Insert parsed Jenkins log, the response is built from the parsed
+    #    columns instead of reading the document back
     jenkins_log = await jenkins_log_collection.insert_one(jenkins_log_data_complete)
-    created_jenkins_log = await jenkins_log_collection.find_one(
-        {"_id": ObjectId(jenkins_log.inserted_id)}
+    created_jenkins_log = dict(
+        _id=jenkins_log.inserted_id,
+        parsed_log_data=log_results.to_documents(),
+        chart_log_data=jenkins_log_data_complete["chart_log_data"],
+        user_id=user_id,
+    )
+
+    # -> Insert one document per test, so results can be queried across builds
+    time_executed = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    await create_jenkins_tests(
+        get_jenkins_test_documents(
+            user_id, str(jenkins_log.inserted_id), time_executed, log_results
+        )
+    )
+    await update_jenkins_rollups(
+        user_id,
+        [(jenkins_log.inserted_id, jenkins_log_data_complete["chart_log_data"], 1)],
+    )
+    await update_jenkins_failure_signatures(
+        user_id,
+        [(str(jenkins_log.inserted_id), failure_signatures, set(failure_signatures))],
     )
 
     # -> Insert Jenkins log history
     jenkins_history_data_complete = JenkinsHistoryCreateComplete(
-        time_executed=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        time_executed=time_executed,
         time_spent=round(time_spent, 2),
         jenkins_log_id=str(jenkins_log.inserted_id),
         user_id=user_id,
@@ -45,100 +385,340 @@ async def create_jenkins_log(user_id: str, jenkins_log_data: dict) -> dict:
     return get_jenkins_log_in_db(created_jenkins_log)
 
 
+async def save_jenkins_logs(
+    user_id: str, batch_log_results: list[tuple[ParsedLogColumns, float]]
+) -> list[dict]:
+    if not batch_log_results:
+        return []
+
+    batch_failure_signatures = [
+        log_results.get_failure_signatures() for log_results, _ in batch_log_results
+    ]
+    jenkins_logs = [
+        dict(
+            **await encode_jenkins_log_data(log_results),
+            chart_log_data=log_results.get_chart_log_data(),
+            failure_signatures=get_jenkins_log_failure_signatures(failure_signatures),
+            user_id=user_id,
+        )
+        for (log_results, _), failure_signatures in zip(
+            batch_log_results, batch_failure_signatures
+        )
+    ]
+
+    # -> One insert_many per collection for the whole batch, insert_many sets
+    #    the generated _id on every document
+    await jenkins_log_collection.insert_many(jenkins_logs)
+
+    time_executed = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    await create_jenkins_tests(
+        [
+            jenkins_test
+            for jenkins_log, (log_results, _) in zip(jenkins_logs, batch_log_results)
+            for jenkins_test in get_jenkins_test_documents(
+                user_id, str(jenkins_log["_id"]), time_executed, log_results
+            )
+        ]
+    )
+    await update_jenkins_rollups(
+        user_id,
+        [
+            (jenkins_log["_id"], jenkins_log["chart_log_data"], 1)
+            for jenkins_log in jenkins_logs
+        ],
+    )
+    await update_jenkins_failure_signatures(
+        user_id,
+        [
+            (str(jenkins_log["_id"]), failure_signatures, set(failure_signatures))
+            for jenkins_log, failure_signatures in zip(
+                jenkins_logs, batch_failure_signatures
+            )
+        ],
+    )
+
+    await jenkins_history_collection.insert_many(
+        [
+            JenkinsHistoryCreateComplete(
+                time_executed=time_executed,
+                time_spent=round(time_spent, 2),
+                jenkins_log_id=str(jenkins_log["_id"]),
+                user_id=user_id,
+            ).model_dump()
+            for jenkins_log, (_, time_spent) in zip(jenkins_logs, batch_log_results)
+        ]
+    )
+
+    return jenkins_logs
+
+
 async def get_jenkins_log_by_id(user_id: str, jenkins_log_id: str) -> dict:
     jenkins_log = await jenkins_log_collection.find_one(
         {"_id": ObjectId(jenkins_log_id), "user_id": user_id}
     )
     if jenkins_log:
-        return get_jenkins_log_in_db(jenkins_log)
+        return get_jenkins_log_in_db(await load_jenkins_log_data(jenkins_log))
     return None
 
 
-async def get_all_jenkins_logs(user_id: str) -> list[dict]:
-    jenkins_logs = []
-    async for jenkins_log in jenkins_log_collection.find({"user_id": user_id}):
-        jenkins_logs.append(get_jenkins_log_in_db(jenkins_log))
-    return jenkins_logs
+async def get_all_jenkins_logs(
+    user_id: str, after: str | None = None, limit: int | None = None
+) -> list[dict]:
+    return [
+        jenkins_log async for jenkins_log in iter_jenkins_logs(user_id, after, limit)
+    ]
+
+
+def iter_jenkins_logs(
+    user_id: str, after: str | None = None, limit: int | None = None
+) -> AsyncIterator[dict]:
+    cursor = jenkins_log_collection.find(
+        get_page_query({"user_id": user_id}, after)
+    ).sort("_id", 1)
+    if limit:
+        cursor = cursor.limit(limit)
+
+    # -> The cursor is checked before anything is streamed, and logs are
+    #    decoded one at a time as it yields them
+    return (
+        get_jenkins_log_in_db(await load_jenkins_log_data(jenkins_log))
+        async for jenkins_log in cursor
+    )
+
+
+async def get_all_jenkins_log_summaries(
+    user_id: str, after: str | None = None, limit: int | None = None
+) -> list[dict]:
+    return [
+        jenkins_log
+        async for jenkins_log in iter_jenkins_log_summaries(user_id, after, limit)
+    ]
+
+
+def iter_jenkins_log_summaries(
+    user_id: str, after: str | None = None, limit: int | None = None
+) -> AsyncIterator[dict]:
+    # -> The projection leaves parsed tests on the server, neither the
+    #    encoded payload nor the GridFS file is read
+    cursor = jenkins_log_collection.find(
+        get_page_query({"user_id": user_id}, after),
+        projection={"chart_log_data": True, "user_id": True},
+    ).sort("_id", 1)
+    if limit:
+        cursor = cursor.limit(limit)
+
+    return (get_jenkins_log_summary_in_db(jenkins_log) async for jenkins_log in cursor)
 
 
 async def delete_jenkins_log_by_id(user_id: str, jenkins_log_id: str) -> bool:
-    jenkins_log = await jenkins_log_collection.find_one(
-        {"_id": ObjectId(jenkins_log_id), "user_id": user_id}
+    jenkins_log = await jenkins_log_collection.find_one_and_delete(
+        {"_id": ObjectId(jenkins_log_id), "user_id": user_id},
+        projection={
+            "chart_log_data": True,
+            "failure_signatures": True,
+            "parsed_log_data_file_id": True,
+        },
     )
     if jenkins_log:
-        await jenkins_log_collection.delete_one(
-            {"_id": ObjectId(jenkins_log_id), "user_id": user_id}
+        await update_jenkins_rollups(
+            user_id,
+            [
+                (
+                    jenkins_log["_id"],
+                    {
+                        field: -count
+                        for field, count in jenkins_log["chart_log_data"].items()
+                    },
+                    -1,
+                )
+            ],
+        )
+        await delete_jenkins_failure_signatures(
+            user_id, jenkins_log_id, jenkins_log.get("failure_signatures", {})
         )
         await jenkins_history_collection.delete_one(
             {"jenkins_log_id": jenkins_log_id, "user_id": user_id}
         )
+        await delete_jenkins_tests_by_log_id(user_id, jenkins_log_id)
+        if file_id := jenkins_log.get("parsed_log_data_file_id"):
+            await jenkins_log_bucket.delete(file_id)
         return True
     return False
 
 
-def clean_traceback_msg(string: str) -> str:
-    return re.sub(pattern=RegexString.TEST_HESH, repl="", string=string)
+async def encode_jenkins_log_data(log_results: ParsedLogColumns) -> dict:
+    parsed_log_data_encoded = encode_parsed_log_data(log_results)
+
+    # -> Payloads that could push the document towards the 16 MB limit are
+    #    stored in GridFS and only referenced from the document
+    if len(parsed_log_data_encoded) > LogStorage.GRIDFS_THRESHOLD:
+        file_id = await jenkins_log_bucket.upload_from_stream(
+            "parsed_log_data", parsed_log_data_encoded
+        )
+        return dict(parsed_log_data_file_id=file_id)
 
+    return dict(parsed_log_data_encoded=parsed_log_data_encoded)
 
-def parse_traceback_msg(pattern: str, data: str) -> str:
-    return clean_traceback_msg(
-        re.search(pattern=pattern, string=data, flags=re.DOTALL).group(1)
-    )
+
+async def load_jenkins_log_data(jenkins_log: dict) -> dict:
+    if file_id := jenkins_log.get("parsed_log_data_file_id"):
+        grid_out = await jenkins_log_bucket.open_download_stream(file_id)
+        jenkins_log["parsed_log_data_encoded"] = await grid_out.read()
+    elif "parsed_log_data_encoded" not in jenkins_log:
+        # -> A running progressive build has its tests in the tests collection
+        jenkins_log["parsed_log_data"] = (
+            await get_jenkins_log_test_columns(
+                jenkins_log["user_id"], str(jenkins_log["_id"])
+            )
+        ).to_documents()
+    return jenkins_log
+
+
+async def parse_log_chunks(
+    chunks: AsyncIterable[bytes], progress: LogProgress | None = None
+) -> ParsedLogColumns:
+    log_results = ParsedLogColumns()
+
+    async for segment in aiter_log_segments(chunks, LogParser.BATCH_SIZE):
+        segment_results = await run_parse_log_segment(segment)
+        if progress:
+            progress.parsed(segment_results)
+        log_results.extend(segment_results)
+
+    return log_results
+
+
+async def parse_spooled_log(path: str) -> ParsedLogColumns:
+    if segment := find_log_file_segment(path):
+        return await run_parse_log_file(path, *segment)
+    return ParsedLogColumns()
+
+
+async def spool_log_chunks(
+    chunks: AsyncIterable[bytes], log_file: "tempfile._TemporaryFileWrapper"
+) -> None:
+    async for chunk in chunks:
+        log_file.write(chunk)
+    log_file.flush()
+
+
+async def iter_uploaded_chunks(chunks: AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+    content_size = 0
+
+    async for chunk in chunks:
+        content_size += len(chunk)
+        if content_size > LogUpload.MAX_SIZE:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail="Uploaded log exceeds the maximum allowed size",
+            )
+        yield chunk
+
+
+def get_conditional_headers(cache_entry: dict | None) -> dict:
+    headers = {}
+
+    if cache_entry and cache_entry["etag"]:
+        headers["If-None-Match"] = cache_entry["etag"]
+    if cache_entry and cache_entry["last_modified"]:
+        headers["If-Modified-Since"] = cache_entry["last_modified"]
+
+    return headers
 
 
 @timeit
-def get_log_results(log_url: str) -> tuple[list[ParsedLogData], ChartLogData]:
-    log_results = []
-    chart_log_results = ChartLogData(
-        passed=0, failed=0, errored=0, skipped=0, blocked=0
+async def get_log_results(
+    log_url: str, progress: LogProgress | None = None
+) -> ParsedLogColumns:
+    cache_entry = await log_result_cache.get(log_url)
+    headers = get_conditional_headers(cache_entry)
+    content_hash = hashlib.sha256()
+
+    async with open_log_response(log_url, headers) as response:
+        if cache_entry and response.status_code == status.HTTP_304_NOT_MODIFIED:
+            log_result_cache.record("not_modified_hits")
+            if progress:
+                progress.parsed(cache_entry["parsed_log_data"])
+            return cache_entry["parsed_log_data"]
+
+        chunks = iter_response_chunks(response, content_hash)
+        if progress:
+            chunks = progress.aiter_fetched(chunks)
+
+        if cache_entry and not headers:
+            # -> Without validators only the content hash tells whether the
+            #    console has changed, so it is spooled before being parsed
+            with tempfile.NamedTemporaryFile(dir=LogUpload.SPOOL_DIR) as log_file:
+                await spool_log_chunks(chunks, log_file)
+
+                if content_hash.hexdigest() == cache_entry["content_hash"]:
+                    log_result_cache.record("content_hash_hits")
+                    log_results = cache_entry["parsed_log_data"]
+                    if progress:
+                        progress.parsed(log_results)
+                    return log_results
+
+                log_results = await parse_spooled_log(log_file.name)
+                if progress:
+                    progress.parsed(log_results)
+        else:
+            log_results = await parse_log_chunks(chunks, progress)
+
+    log_result_cache.record("misses")
+    await log_result_cache.put(
+        log_url,
+        dict(
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+            content_hash=content_hash.hexdigest(),
+            parsed_log_data=log_results,
+        ),
     )
 
-    try:
-        response = requests.get(url=log_url)
-        response.raise_for_status()
-    except RequestException:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Unable to get data from external API",
-        )
+    return log_results
 
-    content_data = response.content.decode(encoding="utf-8")
 
-    content_data_with_header_list = content_data.split(RegexString.TEST_SEPARATOR)
-    content_data_list = content_data_with_header_list[1:]
+@timeit
+async def get_progressive_log_results(
+    external_url: str, log_offset: int, log_tail: bytes, log_is_header: bool
+) -> tuple[ParsedLogColumns, dict]:
+    log_results = ParsedLogColumns()
+    splitter = LogStreamSplitter(LogParser.BATCH_SIZE, log_tail, log_is_header)
+    content_size = 0
 
-    for content_data in content_data_list:
-        test_name = re.search(pattern=RegexString.TEST_NAME, string=content_data).group(
-            1
-        )
-        test_result = re.search(
-            pattern=RegexString.TEST_RESULT, string=content_data
-        ).group(1)
+    async with open_log_response(
+        f"{external_url.rstrip('/')}/{JenkinsApi.PROGRESSIVE_TEXT}",
+        params={"start": log_offset},
+    ) as response:
+        async for chunk in iter_response_chunks(response):
+            content_size += len(chunk)
+            if (segment := splitter.feed(chunk)) is not None:
+                log_results.extend(await run_parse_log_segment(segment))
 
-        if test_result == TestResult.PASS:
-            chart_log_results.passed += 1
-            test_reason = f"There are no reason (res: {test_result})"
-        elif test_result == TestResult.FAIL:
-            chart_log_results.failed += 1
-            test_reason = parse_traceback_msg(
-                pattern=RegexString.TEST_FAIL, data=content_data
-            )
-        elif test_result == TestResult.ERROR:
-            chart_log_results.errored += 1
-            test_reason = parse_traceback_msg(
-                pattern=RegexString.TEST_ERROR, data=content_data
-            )
-        elif test_result == TestResult.BLOCKED:
-            chart_log_results.blocked += 1
-            test_reason = f"There are no reason (res: {test_result})"
-        elif test_result == TestResult.SKIPPED:
-            chart_log_results.skipped += 1
-            test_reason = f"There are no reason (res: {test_result})"
-
-        log_results.append(
-            ParsedLogData(
-                test_name=test_name, test_result=test_result, test_reason=test_reason
-            )
+        text_size = response.headers.get(JenkinsApi.TEXT_SIZE_HEADER)
+        is_complete = (
+            response.headers.get(JenkinsApi.MORE_DATA_HEADER, "").lower() != "true"
         )
 
-    return log_results, chart_log_results
+    # -> A running build keeps its trailing block unparsed until more output
+    #    arrives, a finished one parses it as the last test
+    if (segment := splitter.close() if is_complete else splitter.flush()) is not None:
+        log_results.extend(await run_parse_log_segment(segment))
+
+    log_progress = dict(
+        log_offset=int(text_size) if text_size else log_offset + content_size,
+        log_tail=splitter.tail,
+        log_is_header=splitter.is_header,
+        is_complete=is_complete,
+    )
+
+    return log_results, log_progress
+
+
+@timeit
+async def get_uploaded_log_results(chunks: AsyncIterable[bytes]) -> ParsedLogColumns:
+    # -> The upload is spooled to disk and parsed over an mmap of that file,
+    #    so it never has to be held in the Python heap
+    with tempfile.NamedTemporaryFile(dir=LogUpload.SPOOL_DIR) as log_file:
+        await spool_log_chunks(iter_uploaded_chunks(chunks), log_file)
+        return await parse_spooled_log(log_file.name)
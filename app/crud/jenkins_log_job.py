@@ -0,0 +1,147 @@
+import time
+import asyncio
+from datetime import datetime, timedelta, timezone
+from bson import ObjectId
+from fastapi import HTTPException, status
+from app.crud.jenkins_log import create_jenkins_log
+from app.dependencies import jenkins_log_job_collection
+from app.schemas.jenkins_log_job import get_jenkins_log_job_in_db
+from app.utils.constants import JobStatus, LogJob
+from app.utils.jobs import instance_id, run_in_background
+
+
+async def create_jenkins_log_job(user_id: str, jenkins_log_data: dict) -> dict:
+    jenkins_log_job = dict(
+        external_url=jenkins_log_data["external_url"],
+        status=JobStatus.QUEUED,
+        status_code=None,
+        detail=None,
+        time_created=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        time_started=None,
+        time_finished=None,
+        time_spent=None,
+        jenkins_log_id=None,
+        user_id=user_id,
+        instance_id=instance_id,
+        lease_expires=get_lease_expires(),
+    )
+    await jenkins_log_job_collection.insert_one(jenkins_log_job)
+
+    run_in_background(
+        run_jenkins_log_job(jenkins_log_job["_id"], user_id, jenkins_log_data)
+    )
+
+    return get_jenkins_log_job_in_db(jenkins_log_job)
+
+
+async def run_jenkins_log_job(
+    jenkins_log_job_id: ObjectId, user_id: str, jenkins_log_data: dict
+) -> None:
+    await jenkins_log_job_collection.update_one(
+        {"_id": jenkins_log_job_id},
+        {
+            "$set": {
+                "status": JobStatus.RUNNING,
+                "time_started": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            }
+        },
+    )
+
+    start_time = time.perf_counter()
+    try:
+        jenkins_log = await create_jenkins_log(user_id, jenkins_log_data)
+        job_result = dict(
+            status=JobStatus.COMPLETED,
+            status_code=status.HTTP_200_OK,
+            jenkins_log_id=jenkins_log["id"],
+        )
+    except HTTPException as exception:
+        job_result = dict(
+            status=JobStatus.FAILED,
+            status_code=exception.status_code,
+            detail=exception.detail,
+        )
+    except Exception:
+        job_result = dict(
+            status=JobStatus.FAILED,
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Unable to parse Jenkins log",
+        )
+    except asyncio.CancelledError:
+        # -> Cancelled on shutdown, the job still reaches a final status
+        await finish_jenkins_log_job(
+            jenkins_log_job_id, get_interrupted_job_result(), start_time
+        )
+        raise
+
+    await finish_jenkins_log_job(jenkins_log_job_id, job_result, start_time)
+
+
+async def finish_jenkins_log_job(
+    jenkins_log_job_id: ObjectId, job_result: dict, start_time: float
+) -> None:
+    await jenkins_log_job_collection.update_one(
+        {"_id": jenkins_log_job_id},
+        {
+            "$set": dict(
+                job_result,
+                time_finished=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                time_spent=round(time.perf_counter() - start_time, 2),
+            )
+        },
+    )
+
+
+def get_interrupted_job_result() -> dict:
+    return dict(
+        status=JobStatus.FAILED,
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Jenkins log job was interrupted by a server shutdown",
+    )
+
+
+def get_lease_expires() -> datetime:
+    return datetime.now(timezone.utc) + timedelta(seconds=LogJob.LEASE_SECONDS)
+
+
+async def renew_jenkins_log_job_leases() -> None:
+    # -> Every instance keeps extending the leases of its own unfinished jobs,
+    #    a lease left to expire belongs to an instance that stopped without
+    #    finishing them, nothing will run those jobs anymore
+    await jenkins_log_job_collection.update_many(
+        {
+            "instance_id": instance_id,
+            "status": {"$in": [JobStatus.QUEUED, JobStatus.RUNNING]},
+        },
+        {"$set": {"lease_expires": get_lease_expires()}},
+    )
+    await fail_interrupted_jenkins_log_jobs(
+        {"lease_expires": {"$lt": datetime.now(timezone.utc)}}
+    )
+
+
+async def fail_instance_jenkins_log_jobs() -> None:
+    # -> Jobs of this instance still unfinished after shutdown were cancelled
+    #    while queued
+    await fail_interrupted_jenkins_log_jobs({"instance_id": instance_id})
+
+
+async def fail_interrupted_jenkins_log_jobs(job_filter: dict) -> None:
+    await jenkins_log_job_collection.update_many(
+        dict(job_filter, status={"$in": [JobStatus.QUEUED, JobStatus.RUNNING]}),
+        {
+            "$set": dict(
+                get_interrupted_job_result(),
+                time_finished=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            )
+        },
+    )
+
+
+async def get_jenkins_log_job_by_id(user_id: str, jenkins_log_job_id: str) -> dict:
+    jenkins_log_job = await jenkins_log_job_collection.find_one(
+        {"_id": ObjectId(jenkins_log_job_id), "user_id": user_id}
+    )
+    if jenkins_log_job:
+        return get_jenkins_log_job_in_db(jenkins_log_job)
+    return None
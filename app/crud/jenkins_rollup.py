@@ -0,0 +1,137 @@
+import asyncio
+from collections import Counter, defaultdict
+from bson import ObjectId
+from pymongo import ReplaceOne, UpdateOne
+from app.dependencies import jenkins_log_collection, jenkins_rollup_collection
+from app.schemas.jenkins_rollup import get_jenkins_rollup_in_db
+from app.utils.parser import CHART_FIELDS
+
+
+def get_rollup_day(jenkins_log_id: ObjectId) -> str:
+    # -> The day is taken from the log id, so a deleted log is always
+    #    subtracted from the bucket it was added to
+    return jenkins_log_id.generation_time.strftime("%Y-%m-%d")
+
+
+async def update_jenkins_rollups(
+    user_id: str, jenkins_log_updates: list[tuple[ObjectId, dict, int]]
+) -> None:
+    increments = defaultdict(Counter)
+    for jenkins_log_id, chart_log_data, jenkins_logs in jenkins_log_updates:
+        for day in (None, get_rollup_day(jenkins_log_id)):
+            increments[day].update(
+                {
+                    f"chart_log_data.{field}": count
+                    for field, count in chart_log_data.items()
+                },
+                jenkins_logs=jenkins_logs,
+            )
+
+    # -> Totals (day None) and daily buckets are updated with $inc in one
+    #    round trip, creating them on first use
+    if increments:
+        await jenkins_rollup_collection.bulk_write(
+            [
+                UpdateOne(
+                    {"user_id": user_id, "day": day},
+                    {"$inc": dict(increment)},
+                    upsert=True,
+                )
+                for day, increment in increments.items()
+            ],
+            ordered=False,
+        )
+
+
+async def get_jenkins_rollup(user_id: str, days: int) -> dict:
+    jenkins_rollup = await jenkins_rollup_collection.find_one(
+        {"user_id": user_id, "day": None}
+    ) or dict(chart_log_data=dict.fromkeys(CHART_FIELDS.values(), 0), jenkins_logs=0)
+
+    daily = []
+    async for jenkins_rollup_daily in (
+        jenkins_rollup_collection.find({"user_id": user_id, "day": {"$ne": None}})
+        .sort("day", -1)
+        .limit(days)
+    ):
+        daily.append(get_jenkins_rollup_in_db(jenkins_rollup_daily))
+
+    return dict(
+        chart_log_data=jenkins_rollup["chart_log_data"],
+        jenkins_logs=jenkins_rollup["jenkins_logs"],
+        daily=daily,
+    )
+
+
+async def rebuild_jenkins_rollups(user_id: str | None = None) -> None:
+    query = {"user_id": user_id} if user_id else {}
+
+    # -> Daily buckets are summed by Mongo from the stored chart data, the
+    #    totals are the sum of the (few) daily buckets
+    jenkins_rollups = {}
+    async for jenkins_rollup_daily in jenkins_log_collection.aggregate(
+        [
+            {"$match": query},
+            {
+                "$group": {
+                    "_id": {
+                        "user_id": "$user_id",
+                        "day": {
+                            "$dateToString": {
+                                "format": "%Y-%m-%d",
+                                "date": {"$toDate": "$_id"},
+                            }
+                        },
+                    },
+                    "jenkins_logs": {"$sum": 1},
+                    **{
+                        field: {"$sum": f"$chart_log_data.{field}"}
+                        for field in CHART_FIELDS.values()
+                    },
+                }
+            },
+        ]
+    ):
+        user_day = jenkins_rollup_daily["_id"]
+        for day in (None, user_day["day"]):
+            jenkins_rollup = jenkins_rollups.setdefault(
+                (user_day["user_id"], day),
+                dict(
+                    user_id=user_day["user_id"],
+                    day=day,
+                    chart_log_data=dict.fromkeys(CHART_FIELDS.values(), 0),
+                    jenkins_logs=0,
+                ),
+            )
+            jenkins_rollup["jenkins_logs"] += jenkins_rollup_daily["jenkins_logs"]
+            for field in CHART_FIELDS.values():
+                jenkins_rollup["chart_log_data"][field] += jenkins_rollup_daily[field]
+
+    # -> Every recomputed bucket is replaced in place, so readers never see
+    #    the rollups missing, only buckets left without logs are deleted
+    if jenkins_rollups:
+        await jenkins_rollup_collection.bulk_write(
+            [
+                ReplaceOne(
+                    {"user_id": user_id, "day": day}, jenkins_rollup, upsert=True
+                )
+                for (user_id, day), jenkins_rollup in jenkins_rollups.items()
+            ],
+            ordered=False,
+        )
+
+    stale_rollup_ids = [
+        jenkins_rollup["_id"]
+        async for jenkins_rollup in jenkins_rollup_collection.find(
+            query, projection={"user_id": True, "day": True}
+        )
+        if (jenkins_rollup["user_id"], jenkins_rollup["day"]) not in jenkins_rollups
+    ]
+    if stale_rollup_ids:
+        await jenkins_rollup_collection.delete_many({"_id": {"$in": stale_rollup_ids}})
+
+
+if __name__ == "__main__":
+    # -> Rebuilds the rollups of all users, e.g. after logs were imported or
+    #    deleted outside of the API
+    asyncio.run(rebuild_jenkins_rollups())
@@ -0,0 +1,289 @@
+import re
+from datetime import datetime
+from bson import ObjectId
+from app.dependencies import jenkins_log_collection, jenkins_test_collection
+from app.utils.constants import TestResult, TestSearch
+from app.schemas.jenkins_test import (
+    get_jenkins_test_in_db,
+    get_jenkins_test_search_in_db,
+)
+from app.utils.pagination import get_page_query
+from app.utils.parser import ParsedLogColumns, get_test_failure_signature
+
+
+def get_jenkins_test_documents(
+    user_id: str,
+    jenkins_log_id: str,
+    time_executed: str,
+    log_results: ParsedLogColumns,
+    first_test_index: int = 0,
+) -> list[dict]:
+    jenkins_tests = log_results.to_documents()
+    # -> The index keeps the console order of a log written over several polls
+    for test_index, jenkins_test in enumerate(jenkins_tests, first_test_index):
+        jenkins_test.update(
+            time_executed=time_executed,
+            jenkins_log_id=jenkins_log_id,
+            user_id=user_id,
+            test_index=test_index,
+        )
+        # -> Text indexes are sparse, so only failures carrying this field are
+        #    indexed for search, the signature finds examples of a cluster
+        if jenkins_test["test_result"] in (TestResult.FAIL, TestResult.ERROR):
+            jenkins_test["failure_reason"] = jenkins_test["test_reason"]
+            jenkins_test["failure_signature"] = get_test_failure_signature(
+                jenkins_test["test_reason"]
+            )[0]
+    return jenkins_tests
+
+
+async def create_jenkins_tests(jenkins_tests: list[dict]) -> None:
+    if jenkins_tests:
+        await jenkins_test_collection.insert_many(jenkins_tests, ordered=False)
+
+
+async def get_jenkins_log_test_columns(
+    user_id: str, jenkins_log_id: str
+) -> ParsedLogColumns:
+    return ParsedLogColumns.from_documents(
+        await jenkins_test_collection.find(
+            {"user_id": user_id, "jenkins_log_id": jenkins_log_id},
+            projection={"test_name": True, "test_result": True, "test_reason": True},
+        )
+        .sort("test_index", 1)
+        .to_list(None)
+    )
+
+
+async def get_all_jenkins_tests(
+    user_id: str, test_name: str, test_result: str | None, limit: int
+) -> list[dict]:
+    query = {"user_id": user_id, "test_name": test_name}
+    if test_result:
+        query["test_result"] = test_result
+
+    jenkins_tests = []
+    async for jenkins_test in (
+        jenkins_test_collection.find(query)
+        .sort([("time_executed", -1), ("_id", -1)])
+        .limit(limit)
+    ):
+        jenkins_tests.append(get_jenkins_test_in_db(jenkins_test))
+    return jenkins_tests
+
+
+async def search_jenkins_tests(
+    user_id: str,
+    search: str,
+    test_result: str | None = None,
+    time_from: datetime | None = None,
+    time_to: datetime | None = None,
+    after: str | None = None,
+    limit: int = 100,
+) -> list[dict]:
+    query = {"user_id": user_id, "$text": {"$search": search}}
+    if test_result:
+        query["test_result"] = test_result
+    if time_from or time_to:
+        query["time_executed"] = {}
+        if time_from:
+            query["time_executed"]["$gte"] = time_from.strftime("%Y-%m-%d %H:%M:%S")
+        if time_to:
+            query["time_executed"]["$lte"] = time_to.strftime("%Y-%m-%d %H:%M:%S")
+
+    jenkins_tests = []
+    async for jenkins_test in (
+        jenkins_test_collection.find(
+            get_page_query(query, after, descending=True),
+            projection={"test_reason": False},
+        )
+        .sort("_id", -1)
+        .limit(limit)
+    ):
+        jenkins_tests.append(
+            get_jenkins_test_search_in_db(
+                jenkins_test, get_reason_snippet(jenkins_test["failure_reason"], search)
+            )
+        )
+    return jenkins_tests
+
+
+def get_reason_snippet(reason: str, search: str) -> str:
+    match = re.search(
+        "|".join(re.escape(word) for word in search.split()), reason, re.IGNORECASE
+    )
+    start = max((match.start() if match else 0) - TestSearch.SNIPPET_SIZE // 4, 0)
+    return reason[start : start + TestSearch.SNIPPET_SIZE]
+
+
+async def get_flaky_jenkins_tests(
+    user_id: str, builds: int, min_flip_rate: float, limit: int
+) -> list[dict]:
+    jenkins_log_ids = [
+        str(jenkins_log["_id"])
+        async for jenkins_log in jenkins_log_collection.find(
+            {"user_id": user_id}, projection={"_id": True}
+        )
+        .sort("_id", -1)
+        .limit(builds)
+    ]
+
+    # -> A flip is a failed outcome next to a passed one in build order
+    outcome = {"$arrayElemAt": ["$outcomes", "$$this"]}
+    previous_outcome = {"$arrayElemAt": ["$outcomes", {"$subtract": ["$$this", 1]}]}
+    flips = {
+        "$reduce": {
+            "input": {"$range": [1, {"$size": "$outcomes"}]},
+            "initialValue": 0,
+            "in": {
+                "$add": [
+                    "$$value",
+                    {"$cond": [{"$ne": [outcome, previous_outcome]}, 1, 0]},
+                ]
+            },
+        }
+    }
+
+    # -> Outcomes are scored inside Mongo, only test names and results of the
+    #    last builds are read and one small document per test is returned.
+    #    Log ids are ObjectId strings, so their order is the build order
+    jenkins_tests = []
+    async for jenkins_test in jenkins_test_collection.aggregate(
+        [
+            {
+                "$match": {
+                    "user_id": user_id,
+                    "jenkins_log_id": {"$in": jenkins_log_ids},
+                    "test_result": {
+                        "$in": [TestResult.PASS, TestResult.FAIL, TestResult.ERROR]
+                    },
+                }
+            },
+            {"$sort": {"jenkins_log_id": 1}},
+            {
+                "$group": {
+                    "_id": "$test_name",
+                    "outcomes": {"$push": {"$ne": ["$test_result", TestResult.PASS]}},
+                }
+            },
+            {
+                "$project": {
+                    "_id": False,
+                    "test_name": "$_id",
+                    "runs": {"$size": "$outcomes"},
+                    "failures": {
+                        "$size": {"$filter": {"input": "$outcomes", "cond": "$$this"}}
+                    },
+                    "flips": flips,
+                }
+            },
+            {
+                "$addFields": {
+                    "failure_rate": {"$divide": ["$failures", "$runs"]},
+                    "flip_rate": {
+                        "$cond": [
+                            {"$gt": ["$runs", 1]},
+                            {"$divide": ["$flips", {"$subtract": ["$runs", 1]}]},
+                            0,
+                        ]
+                    },
+                }
+            },
+            {"$match": {"flips": {"$gt": 0}, "flip_rate": {"$gte": min_flip_rate}}},
+            {"$sort": {"flip_rate": -1, "failure_rate": -1, "test_name": 1}},
+            {"$limit": limit},
+        ],
+        allowDiskUse=True,
+    ):
+        jenkins_tests.append(jenkins_test)
+    return jenkins_tests
+
+
+async def get_jenkins_tests_diff(
+    user_id: str, base_jenkins_log_id: str, head_jenkins_log_id: str
+) -> dict | None:
+    jenkins_log_ids = [base_jenkins_log_id, head_jenkins_log_id]
+    if await jenkins_log_collection.count_documents(
+        {"_id": {"$in": [ObjectId(id) for id in jenkins_log_ids]}, "user_id": user_id}
+    ) != len(set(jenkins_log_ids)):
+        return None
+
+    def get_log_outcome(jenkins_log_id: str) -> dict:
+        return {
+            "$max": {
+                "$cond": [
+                    {"$eq": ["$jenkins_log_id", jenkins_log_id]},
+                    {"result": "$test_result", "reason": "$test_reason"},
+                    None,
+                ]
+            }
+        }
+
+    jenkins_tests_diff = dict(
+        base_jenkins_log_id=base_jenkins_log_id,
+        head_jenkins_log_id=head_jenkins_log_id,
+        newly_failing=[],
+        newly_passing=[],
+        added=[],
+        removed=[],
+        changed_reasons=[],
+        changed_results=[],
+    )
+
+    # -> Both builds are joined by test name inside Mongo and only tests whose
+    #    result or reason differ are returned
+    async for jenkins_test in jenkins_test_collection.aggregate(
+        [
+            {
+                "$match": {
+                    "user_id": user_id,
+                    "jenkins_log_id": {"$in": jenkins_log_ids},
+                }
+            },
+            {
+                "$group": {
+                    "_id": "$test_name",
+                    "base": get_log_outcome(base_jenkins_log_id),
+                    "head": get_log_outcome(head_jenkins_log_id),
+                }
+            },
+            {"$match": {"$expr": {"$ne": ["$base", "$head"]}}},
+            {"$sort": {"_id": 1}},
+        ]
+    ):
+        base, head = jenkins_test["base"] or {}, jenkins_test["head"] or {}
+        jenkins_tests_diff[get_diff_kind(base, head)].append(
+            dict(
+                test_name=jenkins_test["_id"],
+                base_test_result=base.get("result"),
+                base_test_reason=base.get("reason"),
+                head_test_result=head.get("result"),
+                head_test_reason=head.get("reason"),
+            )
+        )
+    return jenkins_tests_diff
+
+
+def get_diff_kind(base: dict, head: dict) -> str:
+    is_base_failed = base.get("result") in (TestResult.FAIL, TestResult.ERROR)
+    is_head_failed = head.get("result") in (TestResult.FAIL, TestResult.ERROR)
+
+    if not base:
+        return "added"
+    if not head:
+        return "removed"
+    if is_head_failed and not is_base_failed:
+        return "newly_failing"
+    if is_base_failed and head["result"] == TestResult.PASS:
+        return "newly_passing"
+    # -> A failure turning into an error is a result change, even when both
+    #    carry the same reason
+    if base["result"] != head["result"]:
+        return "changed_results"
+    return "changed_reasons"
+
+
+async def delete_jenkins_tests_by_log_id(user_id: str, jenkins_log_id: str) -> None:
+    await jenkins_test_collection.delete_many(
+        {"jenkins_log_id": jenkins_log_id, "user_id": user_id}
+    )
@@ -1,12 +1,13 @@
 from bson import ObjectId
+from pymongo import ReturnDocument
 from app.dependencies import user_collection
 from app.schemas.user import get_user_in_db
 
 
 async def create_user(user_data: dict) -> dict:
-    user = await user_collection.insert_one(user_data)
-    created_user = await user_collection.find_one({"_id": ObjectId(user.inserted_id)})
-    return get_user_in_db(created_user)
+    # -> insert_one sets the generated _id on the inserted document
+    await user_collection.insert_one(user_data)
+    return get_user_in_db(user_data)
 
 
 async def get_user_by_id(user_id: str) -> dict:
@@ -23,6 +24,15 @@ async def get_user_by_username(username: str) -> dict:
     return None
 
 
+async def get_user_token_version(user_id: str) -> int | None:
+    user = await user_collection.find_one(
+        {"_id": ObjectId(user_id)}, projection={"token_version": True}
+    )
+    if user:
+        return user.get("token_version", 0)
+    return None
+
+
 async def get_all_users() -> list[dict]:
     users = []
     async for user in user_collection.find():
@@ -30,25 +40,26 @@ async def get_all_users() -> list[dict]:
     return users
 
 
-async def update_user_by_id(user_id: int, data: dict) -> bool:
+async def update_user_by_id(user_id: str, data: dict) -> dict:
     if not data:
-        return False
+        return None
 
-    user = await user_collection.find_one({"_id": ObjectId(user_id)})
+    updated_user = await user_collection.find_one_and_update(
+        {"_id": ObjectId(user_id)},
+        {"$set": data, "$inc": {"token_version": 1}},
+        return_document=ReturnDocument.AFTER,
+    )
+    if updated_user:
+        return get_user_in_db(updated_user)
+    return None
 
-    if user:
-        updated_user = await user_collection.update_one(
-            {"_id": ObjectId(user_id)}, {"$set": data}
-        )
-        if updated_user:
-            return True
 
-    return False
+async def revoke_user_tokens(user_id: str) -> None:
+    await user_collection.update_one(
+        {"_id": ObjectId(user_id)}, {"$inc": {"token_version": 1}}
+    )
 
 
 async def delete_user_by_id(user_id: str) -> bool:
-    user = await user_collection.find_one({"_id": ObjectId(user_id)})
-    if user:
-        await user_collection.delete_one({"_id": ObjectId(user_id)})
-        return True
-    return False
+    deleted_user = await user_collection.delete_one({"_id": ObjectId(user_id)})
+    return deleted_user.deleted_count > 0
@@ -1,14 +1,115 @@
 import os
+import httpx
 from dotenv import load_dotenv
-from motor.motor_asyncio import AsyncIOMotorClient
-from app.utils.constants import Dependencies as DP
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorGridFSBucket
+from pymongo import ASCENDING, DESCENDING, TEXT, IndexModel
+from app.utils.constants import Dependencies as DP, LogFetcher
+from app.utils.monitoring import command_counter
 
 
 load_dotenv()
 
-client = AsyncIOMotorClient(os.getenv("MONGO_URI"))
+client = AsyncIOMotorClient(os.getenv("MONGO_URI"), event_listeners=[command_counter])
 database = client.get_database(DP.DB_NAME)
 
 user_collection = database.get_collection(DP.USER_COLLECTION)
 jenkins_log_collection = database.get_collection(DP.JENKINS_LOG_COLLECTION)
 jenkins_history_collection = database.get_collection(DP.JENKINS_HISTORY_COLLECTION)
+jenkins_log_cache_collection = database.get_collection(DP.JENKINS_LOG_CACHE_COLLECTION)
+jenkins_test_collection = database.get_collection(DP.JENKINS_TEST_COLLECTION)
+jenkins_log_job_collection = database.get_collection(DP.JENKINS_LOG_JOB_COLLECTION)
+jenkins_rollup_collection = database.get_collection(DP.JENKINS_ROLLUP_COLLECTION)
+jenkins_failure_signature_collection = database.get_collection(
+    DP.JENKINS_FAILURE_SIGNATURE_COLLECTION
+)
+jenkins_log_bucket = AsyncIOMotorGridFSBucket(
+    database, bucket_name=DP.JENKINS_LOG_BUCKET
+)
+
+# -> Every query issued by the CRUD layer is served by one of these indexes,
+#    they are applied at startup and creating an existing index is a no-op
+collection_indexes = [
+    (user_collection, [IndexModel([("username", ASCENDING)], unique=True)]),
+    (
+        jenkins_log_collection,
+        [
+            IndexModel([("user_id", ASCENDING), ("_id", ASCENDING)]),
+            IndexModel(
+                [
+                    ("user_id", ASCENDING),
+                    ("external_url", ASCENDING),
+                    ("_id", ASCENDING),
+                ]
+            ),
+        ],
+    ),
+    (
+        jenkins_history_collection,
+        [
+            IndexModel([("user_id", ASCENDING), ("_id", ASCENDING)]),
+            IndexModel([("user_id", ASCENDING), ("jenkins_log_id", ASCENDING)]),
+        ],
+    ),
+    (
+        jenkins_test_collection,
+        [
+            IndexModel(
+                [
+                    ("user_id", ASCENDING),
+                    ("test_name", ASCENDING),
+                    ("time_executed", DESCENDING),
+                    ("_id", DESCENDING),
+                ]
+            ),
+            IndexModel([("user_id", ASCENDING), ("test_result", ASCENDING)]),
+            IndexModel(
+                [
+                    ("user_id", ASCENDING),
+                    ("jenkins_log_id", ASCENDING),
+                    ("test_index", ASCENDING),
+                ]
+            ),
+            IndexModel(
+                [
+                    ("user_id", ASCENDING),
+                    ("failure_signature", ASCENDING),
+                    ("_id", DESCENDING),
+                ]
+            ),
+            IndexModel([("user_id", ASCENDING), ("failure_reason", TEXT)]),
+        ],
+    ),
+    (
+        jenkins_log_job_collection,
+        [
+            IndexModel([("instance_id", ASCENDING), ("status", ASCENDING)]),
+            IndexModel([("status", ASCENDING), ("lease_expires", ASCENDING)]),
+        ],
+    ),
+    (
+        jenkins_rollup_collection,
+        [IndexModel([("user_id", ASCENDING), ("day", DESCENDING)], unique=True)],
+    ),
+    (
+        jenkins_failure_signature_collection,
+        [
+            IndexModel([("user_id", ASCENDING), ("signature", ASCENDING)], unique=True),
+            IndexModel([("user_id", ASCENDING), ("count", DESCENDING)]),
+        ],
+    ),
+]
+
+
+async def create_indexes() -> None:
+    for collection, indexes in collection_indexes:
+        await collection.create_indexes(indexes)
+
+
+http_client = httpx.AsyncClient(
+    timeout=httpx.Timeout(LogFetcher.READ_TIMEOUT, connect=LogFetcher.CONNECT_TIMEOUT),
+    limits=httpx.Limits(
+        max_connections=LogFetcher.MAX_CONNECTIONS,
+        max_keepalive_connections=LogFetcher.MAX_KEEPALIVE_CONNECTIONS,
+    ),
+    follow_redirects=True,
+)
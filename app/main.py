@@ -2,11 +2,21 @@ import os
 from dotenv import load_dotenv
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.dependencies import client, database
-from app.utils.constants import Dependencies as DP
+from app.dependencies import client, database, http_client, create_indexes
+from app.utils.constants import Dependencies as DP, Authentication, LogJob
+from app.utils.executor import start_parser_executor, shutdown_parser_executor
+from app.utils.jobs import run_periodically, shutdown_background_jobs
+from app.crud.jenkins_log_job import (
+    fail_instance_jenkins_log_jobs,
+    renew_jenkins_log_job_leases,
+)
 from app.routers.users import user_router
 from app.routers.jenkins_logs import jenkins_log_router
 from app.routers.jenkins_histories import jenkins_history_router
+from app.routers.jenkins_tests import jenkins_test_router
+from app.routers.jenkins_log_jobs import jenkins_log_job_router
+from app.routers.jenkins_rollups import jenkins_rollup_router
+from app.routers.jenkins_failure_signatures import jenkins_failure_signature_router
 
 
 load_dotenv()
@@ -19,6 +29,10 @@ app = FastAPI(
 app.include_router(user_router)
 app.include_router(jenkins_log_router)
 app.include_router(jenkins_history_router)
+app.include_router(jenkins_test_router)
+app.include_router(jenkins_log_job_router)
+app.include_router(jenkins_rollup_router)
+app.include_router(jenkins_failure_signature_router)
 
 app.add_middleware(
     CORSMiddleware,
@@ -35,9 +49,18 @@ async def startup_db_client():
         raise IndentationError(
             f"Unable to establish connection to database '{DP.DB_NAME}'"
         )
+    if not Authentication.SECRET_KEY:
+        raise RuntimeError("AUTH_SECRET_KEY must be set to sign session tokens")
+    await create_indexes()
+    run_periodically(renew_jenkins_log_job_leases, LogJob.HEARTBEAT_SECONDS)
+    start_parser_executor()
 
 
 @app.on_event("shutdown")
 async def shutdown_db_client():
+    await shutdown_background_jobs()
+    await fail_instance_jenkins_log_jobs()
     client.drop_database(DP.DB_NAME)
     client.close()
+    await http_client.aclose()
+    shutdown_parser_executor()
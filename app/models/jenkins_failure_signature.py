@@ -0,0 +1,15 @@
+from pydantic import BaseModel
+from typing import List
+
+
+class JenkinsFailureSignatureExample(BaseModel):
+    test_name: str
+    jenkins_log_id: str
+
+
+class JenkinsFailureSignatureResponse(BaseModel):
+    signature: str
+    failure_reason: str
+    count: int
+    jenkins_logs: int
+    examples: List[JenkinsFailureSignatureExample]
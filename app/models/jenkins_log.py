@@ -1,11 +1,16 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import List
+from app.utils.constants import LogBatch
 
 
 class JenkinsLogCreate(BaseModel):
     external_url: str
 
 
+class JenkinsLogBatchCreate(BaseModel):
+    external_urls: List[str] = Field(min_length=1, max_length=LogBatch.MAX_URLS)
+
+
 class ParsedLogData(BaseModel):
     test_name: str
     test_result: str
@@ -31,3 +36,31 @@ class JenkinsLogResponse(BaseModel):
     parsed_log_data: List[ParsedLogData]
     chart_log_data: ChartLogData
     user_id: str
+
+
+class JenkinsLogSummaryResponse(BaseModel):
+    id: str
+    chart_log_data: ChartLogData
+    user_id: str
+
+
+class JenkinsLogBatchResponse(BaseModel):
+    external_url: str
+    status_code: int
+    detail: str | None = None
+    jenkins_log: JenkinsLogSummaryResponse | None = None
+
+
+class JenkinsLogProgressiveResponse(JenkinsLogResponse):
+    log_offset: int
+    is_complete: bool
+
+
+class JenkinsLogCacheResponse(BaseModel):
+    hits: int
+    not_modified_hits: int
+    content_hash_hits: int
+    shared_loads: int
+    misses: int
+    entries: int
+    tests: int
@@ -0,0 +1,15 @@
+from pydantic import BaseModel
+
+
+class JenkinsLogJobResponse(BaseModel):
+    id: str
+    external_url: str
+    status: str
+    status_code: int | None
+    detail: str | None
+    time_created: str
+    time_started: str | None
+    time_finished: str | None
+    time_spent: float | None
+    jenkins_log_id: str | None
+    user_id: str
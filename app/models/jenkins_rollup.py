@@ -0,0 +1,15 @@
+from pydantic import BaseModel
+from typing import List
+from app.models.jenkins_log import ChartLogData
+
+
+class JenkinsRollupDailyResponse(BaseModel):
+    day: str
+    chart_log_data: ChartLogData
+    jenkins_logs: int
+
+
+class JenkinsRollupResponse(BaseModel):
+    chart_log_data: ChartLogData
+    jenkins_logs: int
+    daily: List[JenkinsRollupDailyResponse]
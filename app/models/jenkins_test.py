@@ -0,0 +1,49 @@
+from pydantic import BaseModel
+from typing import List
+
+
+class JenkinsTestResponse(BaseModel):
+    id: str
+    test_name: str
+    test_result: str
+    test_reason: str
+    time_executed: str
+    jenkins_log_id: str
+    user_id: str
+
+
+class JenkinsTestSearchResponse(BaseModel):
+    id: str
+    test_name: str
+    test_result: str
+    snippet: str
+    time_executed: str
+    jenkins_log_id: str
+
+
+class JenkinsTestFlakinessResponse(BaseModel):
+    test_name: str
+    runs: int
+    failures: int
+    flips: int
+    failure_rate: float
+    flip_rate: float
+
+
+class JenkinsTestDiff(BaseModel):
+    test_name: str
+    base_test_result: str | None
+    base_test_reason: str | None
+    head_test_result: str | None
+    head_test_reason: str | None
+
+
+class JenkinsLogDiffResponse(BaseModel):
+    base_jenkins_log_id: str
+    head_jenkins_log_id: str
+    newly_failing: List[JenkinsTestDiff]
+    newly_passing: List[JenkinsTestDiff]
+    added: List[JenkinsTestDiff]
+    removed: List[JenkinsTestDiff]
+    changed_reasons: List[JenkinsTestDiff]
+    changed_results: List[JenkinsTestDiff]
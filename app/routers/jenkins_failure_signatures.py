@@ -0,0 +1,32 @@
+from typing import Annotated, List
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from app.models.user import UserResponse
+from app.models.jenkins_failure_signature import JenkinsFailureSignatureResponse
+from app.crud.jenkins_failure_signature import get_jenkins_failure_signatures
+from app.utils.authentication import get_current_active_user
+
+
+jenkins_failure_signature_router = APIRouter()
+
+
+@jenkins_failure_signature_router.get(
+    "/jenkins-failure-signatures/me",
+    response_model=List[JenkinsFailureSignatureResponse],
+    tags=["jenkins-failure-signatures"],
+    description="Get the most frequent failure clusters with example tests",
+)
+async def get_jenkins_failure_signatures_router(
+    current_user: Annotated[UserResponse, Depends(get_current_active_user)],
+    jenkins_log_id: str | None = None,
+    limit: Annotated[int, Query(ge=1, le=100)] = 10,
+):
+    failure_signatures = await get_jenkins_failure_signatures(
+        current_user["id"], limit, jenkins_log_id
+    )
+    if failure_signatures is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Parsed Jenkins log not found",
+        )
+
+    return failure_signatures
@@ -1,14 +1,21 @@
 from typing import Annotated
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from fastapi.responses import JSONResponse
 from app.models.user import UserResponse
 from app.models.jenkins_history import JenkinsHistoryResponse
 from app.crud.jenkins_history import (
     get_jenkins_history_by_id,
     get_all_jenkins_histories,
+    iter_jenkins_histories,
     delete_jenkins_history_by_id,
 )
 from app.utils.authentication import get_current_active_user
+from app.utils.constants import Pagination
+from app.utils.pagination import (
+    get_next_cursor,
+    get_ndjson_response,
+    is_ndjson_requested,
+)
 
 
 jenkins_history_router = APIRouter()
@@ -37,12 +44,31 @@ async def get_jenkins_history_router(
     "/jenkins-histories/me",
     response_model=list[JenkinsHistoryResponse],
     tags=["jenkins-histories"],
-    description="Get all Jenkins histories",
+    description=(
+        "Get all Jenkins histories, paginated with 'limit' and the 'after' cursor "
+        f"from the {Pagination.NEXT_CURSOR_HEADER} header, "
+        f"or streamed as '{Pagination.NDJSON_MEDIA_TYPE}'"
+    ),
 )
 async def get_jenkins_histories_router(
-    current_user: Annotated[UserResponse, Depends(get_current_active_user)]
+    request: Request,
+    response: Response,
+    current_user: Annotated[UserResponse, Depends(get_current_active_user)],
+    after: str | None = None,
+    limit: Annotated[int | None, Query(ge=1, le=Pagination.MAX_LIMIT)] = None,
 ):
-    return await get_all_jenkins_histories(current_user["id"])
+    if is_ndjson_requested(request):
+        return get_ndjson_response(
+            iter_jenkins_histories(current_user["id"], after, limit)
+        )
+
+    jenkins_histories = await get_all_jenkins_histories(
+        current_user["id"], after, limit
+    )
+    if next_cursor := get_next_cursor(jenkins_histories, limit):
+        response.headers[Pagination.NEXT_CURSOR_HEADER] = next_cursor
+
+    return jenkins_histories
 
 
 @jenkins_history_router.delete(
@@ -0,0 +1,28 @@
+from typing import Annotated
+from fastapi import APIRouter, Depends, HTTPException, status
+from app.models.user import UserResponse
+from app.models.jenkins_log_job import JenkinsLogJobResponse
+from app.crud.jenkins_log_job import get_jenkins_log_job_by_id
+from app.utils.authentication import get_current_active_user
+
+
+jenkins_log_job_router = APIRouter()
+
+
+@jenkins_log_job_router.get(
+    "/jenkins-log-jobs/me/{id}",
+    response_model=JenkinsLogJobResponse,
+    tags=["jenkins-log-jobs"],
+    description="Get status of a background Jenkins log parsing job by id",
+)
+async def get_jenkins_log_job_router(
+    id: str, current_user: Annotated[UserResponse, Depends(get_current_active_user)]
+):
+    jenkins_log_job_in_system = await get_jenkins_log_job_by_id(current_user["id"], id)
+
+    if not jenkins_log_job_in_system:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Jenkins log job not found"
+        )
+
+    return jenkins_log_job_in_system
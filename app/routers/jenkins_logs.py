@@ -1,15 +1,42 @@
 from typing import Annotated
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import JSONResponse, StreamingResponse
 from app.models.user import UserResponse
-from app.models.jenkins_log import JenkinsLogCreate, JenkinsLogResponse
+from app.models.jenkins_log import (
+    JenkinsLogCreate,
+    JenkinsLogBatchCreate,
+    JenkinsLogBatchResponse,
+    JenkinsLogResponse,
+    JenkinsLogSummaryResponse,
+    JenkinsLogProgressiveResponse,
+    JenkinsLogCacheResponse,
+)
+from app.models.jenkins_log_job import JenkinsLogJobResponse
+from app.models.jenkins_test import JenkinsLogDiffResponse
+from app.crud.jenkins_test import get_jenkins_tests_diff
+from app.crud.jenkins_log_job import create_jenkins_log_job
 from app.crud.jenkins_log import (
     create_jenkins_log,
+    create_uploaded_jenkins_log,
+    create_jenkins_logs,
+    iter_jenkins_log_events,
+    ingest_progressive_jenkins_log,
     get_jenkins_log_by_id,
     get_all_jenkins_logs,
+    iter_jenkins_logs,
+    get_all_jenkins_log_summaries,
+    iter_jenkins_log_summaries,
     delete_jenkins_log_by_id,
 )
 from app.utils.authentication import get_current_active_user
+from app.utils.cache import log_result_cache
+from app.utils.constants import Pagination, LogEvent
+from app.utils.pagination import (
+    get_next_cursor,
+    get_ndjson_response,
+    is_ndjson_requested,
+)
+from app.utils.serialization import get_fast_json_response
 
 
 jenkins_log_router = APIRouter()
@@ -18,16 +45,150 @@ jenkins_log_router = APIRouter()
 @jenkins_log_router.post(
     "/jenkins-logs/me",
     response_model=JenkinsLogResponse,
+    responses={status.HTTP_202_ACCEPTED: {"model": JenkinsLogJobResponse}},
     tags=["jenkins-logs"],
-    description="Create new parsed Jenkins log",
+    description=(
+        "Create new parsed Jenkins log, with 'background' the log is parsed by "
+        "a background job which is returned right away"
+    ),
 )
 async def create_jenkins_log_router(
     jenkins_log: JenkinsLogCreate,
     current_user: Annotated[UserResponse, Depends(get_current_active_user)],
+    background: bool = False,
 ):
     jenkins_log_data = jenkins_log.model_dump()
 
-    return await create_jenkins_log(current_user["id"], jenkins_log_data)
+    if background:
+        jenkins_log_job = await create_jenkins_log_job(
+            current_user["id"], jenkins_log_data
+        )
+        return JSONResponse(
+            content=jenkins_log_job,
+            status_code=status.HTTP_202_ACCEPTED,
+            headers={"Location": f"/jenkins-log-jobs/me/{jenkins_log_job['id']}"},
+        )
+
+    return get_fast_json_response(
+        await create_jenkins_log(current_user["id"], jenkins_log_data)
+    )
+
+
+@jenkins_log_router.get(
+    "/jenkins-logs/me/events",
+    tags=["jenkins-logs"],
+    description=(
+        "Create new parsed Jenkins log while streaming parse progress and failed "
+        "tests as Server-Sent Events"
+    ),
+    response_class=StreamingResponse,
+    responses={status.HTTP_200_OK: {"content": {LogEvent.MEDIA_TYPE: {}}}},
+)
+async def stream_jenkins_log_events_router(
+    external_url: str,
+    current_user: Annotated[UserResponse, Depends(get_current_active_user)],
+):
+    return StreamingResponse(
+        iter_jenkins_log_events(current_user["id"], {"external_url": external_url}),
+        media_type=LogEvent.MEDIA_TYPE,
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
+@jenkins_log_router.post(
+    "/jenkins-logs/me/batch",
+    response_model=list[JenkinsLogBatchResponse],
+    tags=["jenkins-logs"],
+    description="Create parsed Jenkins logs for several external URLs at once",
+)
+async def create_jenkins_logs_router(
+    jenkins_logs: JenkinsLogBatchCreate,
+    current_user: Annotated[UserResponse, Depends(get_current_active_user)],
+):
+    return await create_jenkins_logs(current_user["id"], jenkins_logs.external_urls)
+
+
+@jenkins_log_router.post(
+    "/jenkins-logs/me/upload",
+    response_model=JenkinsLogResponse,
+    tags=["jenkins-logs"],
+    description="Create new parsed Jenkins log from an uploaded raw console",
+    openapi_extra={
+        "requestBody": {
+            "content": {
+                "application/octet-stream": {
+                    "schema": {"type": "string", "format": "binary"}
+                }
+            },
+            "required": True,
+        }
+    },
+)
+async def upload_jenkins_log_router(
+    request: Request,
+    current_user: Annotated[UserResponse, Depends(get_current_active_user)],
+):
+    return get_fast_json_response(
+        await create_uploaded_jenkins_log(current_user["id"], request.stream())
+    )
+
+
+@jenkins_log_router.post(
+    "/jenkins-logs/me/progressive",
+    response_model=JenkinsLogProgressiveResponse,
+    tags=["jenkins-logs"],
+    description=(
+        "Parse output appended to a running Jenkins build since last poll, "
+        "returning the newly parsed tests and the totals so far"
+    ),
+)
+async def ingest_progressive_jenkins_log_router(
+    jenkins_log: JenkinsLogCreate,
+    current_user: Annotated[UserResponse, Depends(get_current_active_user)],
+):
+    jenkins_log_data = jenkins_log.model_dump()
+
+    return await ingest_progressive_jenkins_log(current_user["id"], jenkins_log_data)
+
+
+@jenkins_log_router.get(
+    "/jenkins-logs/cache",
+    response_model=JenkinsLogCacheResponse,
+    tags=["jenkins-logs"],
+    description="Get hit and miss counters of the parsed Jenkins log cache",
+)
+async def get_jenkins_log_cache_router(
+    current_user: Annotated[UserResponse, Depends(get_current_active_user)]
+):
+    return log_result_cache.get_stats()
+
+
+@jenkins_log_router.get(
+    "/jenkins-logs/me/summary",
+    response_model=list[JenkinsLogSummaryResponse],
+    tags=["jenkins-logs"],
+    description=(
+        "Get chart data of all parsed Jenkins logs without parsed tests, "
+        "paginated and streamed like the full listing"
+    ),
+)
+async def get_jenkins_log_summaries_router(
+    request: Request,
+    response: Response,
+    current_user: Annotated[UserResponse, Depends(get_current_active_user)],
+    after: str | None = None,
+    limit: Annotated[int | None, Query(ge=1, le=Pagination.MAX_LIMIT)] = None,
+):
+    if is_ndjson_requested(request):
+        return get_ndjson_response(
+            iter_jenkins_log_summaries(current_user["id"], after, limit)
+        )
+
+    jenkins_logs = await get_all_jenkins_log_summaries(current_user["id"], after, limit)
+    if next_cursor := get_next_cursor(jenkins_logs, limit):
+        response.headers[Pagination.NEXT_CURSOR_HEADER] = next_cursor
+
+    return jenkins_logs
 
 
 @jenkins_log_router.get(
@@ -46,19 +207,55 @@ async def get_jenkins_log_router(
             status_code=status.HTTP_404_NOT_FOUND, detail="Parsed Jenkins log not found"
         )
 
-    return jenkins_log_in_system
+    return get_fast_json_response(jenkins_log_in_system)
+
+
+@jenkins_log_router.get(
+    "/jenkins-logs/me/{id}/diff/{head_id}",
+    response_model=JenkinsLogDiffResponse,
+    tags=["jenkins-logs"],
+    description="Get tests which changed between two parsed Jenkins logs",
+)
+async def get_jenkins_log_diff_router(
+    id: str,
+    head_id: str,
+    current_user: Annotated[UserResponse, Depends(get_current_active_user)],
+):
+    jenkins_log_diff = await get_jenkins_tests_diff(current_user["id"], id, head_id)
+
+    if not jenkins_log_diff:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Parsed Jenkins log not found"
+        )
+
+    return jenkins_log_diff
 
 
 @jenkins_log_router.get(
     "/jenkins-logs/me",
     response_model=list[JenkinsLogResponse],
     tags=["jenkins-logs"],
-    description="Get all parsed Jenkins logs",
+    description=(
+        "Get all parsed Jenkins logs, paginated with 'limit' and the 'after' cursor "
+        f"from the {Pagination.NEXT_CURSOR_HEADER} header, "
+        f"or streamed as '{Pagination.NDJSON_MEDIA_TYPE}'"
+    ),
 )
 async def get_jenkins_logs_router(
-    current_user: Annotated[UserResponse, Depends(get_current_active_user)]
+    request: Request,
+    response: Response,
+    current_user: Annotated[UserResponse, Depends(get_current_active_user)],
+    after: str | None = None,
+    limit: Annotated[int | None, Query(ge=1, le=Pagination.MAX_LIMIT)] = None,
 ):
-    return await get_all_jenkins_logs(current_user["id"])
+    if is_ndjson_requested(request):
+        return get_ndjson_response(iter_jenkins_logs(current_user["id"], after, limit))
+
+    jenkins_logs = await get_all_jenkins_logs(current_user["id"], after, limit)
+    if next_cursor := get_next_cursor(jenkins_logs, limit):
+        response.headers[Pagination.NEXT_CURSOR_HEADER] = next_cursor
+
+    return get_fast_json_response(jenkins_logs, response)
 
 
 @jenkins_log_router.delete(
@@ -0,0 +1,37 @@
+from typing import Annotated
+from fastapi import APIRouter, Depends, Query
+from app.models.user import UserResponse
+from app.models.jenkins_rollup import JenkinsRollupResponse
+from app.crud.jenkins_rollup import get_jenkins_rollup, rebuild_jenkins_rollups
+from app.utils.authentication import get_current_active_user
+
+
+jenkins_rollup_router = APIRouter()
+
+
+@jenkins_rollup_router.get(
+    "/jenkins-rollups/me",
+    response_model=JenkinsRollupResponse,
+    tags=["jenkins-rollups"],
+    description="Get test result totals over all parsed Jenkins logs and per day",
+)
+async def get_jenkins_rollup_router(
+    current_user: Annotated[UserResponse, Depends(get_current_active_user)],
+    days: Annotated[int, Query(ge=1, le=366)] = 30,
+):
+    return await get_jenkins_rollup(current_user["id"], days)
+
+
+@jenkins_rollup_router.post(
+    "/jenkins-rollups/me/rebuild",
+    response_model=JenkinsRollupResponse,
+    tags=["jenkins-rollups"],
+    description="Recompute test result totals from the stored parsed Jenkins logs",
+)
+async def rebuild_jenkins_rollup_router(
+    current_user: Annotated[UserResponse, Depends(get_current_active_user)],
+    days: Annotated[int, Query(ge=1, le=366)] = 30,
+):
+    await rebuild_jenkins_rollups(current_user["id"])
+
+    return await get_jenkins_rollup(current_user["id"], days)
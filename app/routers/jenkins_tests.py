@@ -0,0 +1,86 @@
+from datetime import datetime
+from typing import Annotated
+from fastapi import APIRouter, Depends, Query, Response
+from app.models.user import UserResponse
+from app.models.jenkins_test import (
+    JenkinsTestResponse,
+    JenkinsTestSearchResponse,
+    JenkinsTestFlakinessResponse,
+)
+from app.crud.jenkins_test import (
+    get_all_jenkins_tests,
+    search_jenkins_tests,
+    get_flaky_jenkins_tests,
+)
+from app.utils.authentication import get_current_active_user
+from app.utils.constants import Pagination
+from app.utils.pagination import get_next_cursor
+
+
+jenkins_test_router = APIRouter()
+
+
+@jenkins_test_router.get(
+    "/jenkins-tests/me",
+    response_model=list[JenkinsTestResponse],
+    tags=["jenkins-tests"],
+    description="Get results of one test across parsed Jenkins logs, latest first",
+)
+async def get_jenkins_tests_router(
+    test_name: str,
+    current_user: Annotated[UserResponse, Depends(get_current_active_user)],
+    test_result: str | None = None,
+    limit: Annotated[int, Query(ge=1, le=1000)] = 100,
+):
+    return await get_all_jenkins_tests(
+        current_user["id"], test_name, test_result, limit
+    )
+
+
+@jenkins_test_router.get(
+    "/jenkins-tests/me/flaky",
+    response_model=list[JenkinsTestFlakinessResponse],
+    tags=["jenkins-tests"],
+    description=(
+        "Get tests which flip between passing and failing over the last builds, "
+        "most flaky first"
+    ),
+)
+async def get_flaky_jenkins_tests_router(
+    current_user: Annotated[UserResponse, Depends(get_current_active_user)],
+    builds: Annotated[int, Query(ge=2, le=1000)] = 50,
+    min_flip_rate: Annotated[float, Query(ge=0, le=1)] = 0,
+    limit: Annotated[int, Query(ge=1, le=1000)] = 100,
+):
+    return await get_flaky_jenkins_tests(
+        current_user["id"], builds, min_flip_rate, limit
+    )
+
+
+@jenkins_test_router.get(
+    "/jenkins-tests/me/search",
+    response_model=list[JenkinsTestSearchResponse],
+    tags=["jenkins-tests"],
+    description=(
+        "Search failure reasons of failed and errored tests, latest first, "
+        "paginated with 'limit' and the 'after' cursor from the "
+        f"{Pagination.NEXT_CURSOR_HEADER} header"
+    ),
+)
+async def search_jenkins_tests_router(
+    search: Annotated[str, Query(min_length=1)],
+    response: Response,
+    current_user: Annotated[UserResponse, Depends(get_current_active_user)],
+    test_result: str | None = None,
+    time_from: datetime | None = None,
+    time_to: datetime | None = None,
+    after: str | None = None,
+    limit: Annotated[int, Query(ge=1, le=Pagination.MAX_LIMIT)] = 100,
+):
+    jenkins_tests = await search_jenkins_tests(
+        current_user["id"], search, test_result, time_from, time_to, after, limit
+    )
+    if next_cursor := get_next_cursor(jenkins_tests, limit):
+        response.headers[Pagination.NEXT_CURSOR_HEADER] = next_cursor
+
+    return jenkins_tests
@@ -8,12 +8,15 @@ from app.crud.user import (
     get_user_by_username,
     get_all_users,
     update_user_by_id,
+    revoke_user_tokens,
     delete_user_by_id,
 )
+from app.utils.constants import Authentication
 from app.utils.authentication import (
     get_current_active_user,
     is_credentials,
     create_basic_token,
+    create_session_token,
     check_password_strength,
 )
 
@@ -63,10 +66,14 @@ async def login_router(user: UserLogin):
             detail="Incorrect username or password",
         )
 
-    token = create_basic_token(user.username, user.password)
+    token = create_session_token(user_in_system)
 
     return JSONResponse(
-        content={"access_token": token, "token_type": "basic"},
+        content={
+            "access_token": token,
+            "token_type": "bearer",
+            "expires_in": Authentication.TOKEN_TTL,
+        },
         status_code=status.HTTP_200_OK,
     )
 
@@ -75,6 +82,8 @@ async def login_router(user: UserLogin):
 async def logout_router(
     current_user: Annotated[UserResponse, Depends(get_current_active_user)]
 ):
+    await revoke_user_tokens(current_user["id"])
+
     return JSONResponse(
         content={"message": "Logged out successfully"}, status_code=status.HTTP_200_OK
     )
@@ -135,7 +144,7 @@ async def update_user_router(
 ):
     user_in_system = await get_user_by_username(user.username)
 
-    if user_in_system and user_in_system != current_user:
+    if user_in_system and user_in_system["id"] != current_user["id"]:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="The user with this username already exists in the system",
@@ -153,9 +162,7 @@ async def update_user_router(
     user_data = user.model_dump(exclude={"password"}, exclude_unset=True)
     user_data["hashed_credentials"] = create_basic_token(user.username, user.password)
 
-    await update_user_by_id(current_user["id"], user_data)
-
-    return await get_user_by_id(current_user["id"])
+    return await update_user_by_id(current_user["id"], user_data)
 
 
 @user_router.delete("/users/me", tags=["users"], description="Delete current user (me)")
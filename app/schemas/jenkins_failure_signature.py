@@ -0,0 +1,8 @@
+def get_jenkins_failure_signature_in_db(failure_signature) -> dict:
+    return dict(
+        signature=failure_signature["signature"],
+        failure_reason=failure_signature["failure_reason"],
+        count=failure_signature["count"],
+        jenkins_logs=failure_signature["jenkins_logs"],
+        examples=failure_signature["examples"],
+    )
@@ -1,7 +1,33 @@
+from app.utils.codec import decode_parsed_log_data
+
+
+def get_parsed_log_data_in_db(log) -> list[dict]:
+    if "parsed_log_data_encoded" in log:
+        return decode_parsed_log_data(log["parsed_log_data_encoded"]).to_documents()
+    return log["parsed_log_data"]
+
+
 def get_jenkins_log_in_db(log) -> dict:
     return dict(
         id=str(log["_id"]),
-        parsed_log_data=log["parsed_log_data"],
+        parsed_log_data=get_parsed_log_data_in_db(log),
         chart_log_data=log["chart_log_data"],
         user_id=log["user_id"],
     )
+
+
+def get_jenkins_log_summary_in_db(log) -> dict:
+    return dict(
+        id=str(log["_id"]),
+        chart_log_data=log["chart_log_data"],
+        user_id=log["user_id"],
+    )
+
+
+def get_progressive_jenkins_log_in_db(log, parsed_log_data: list[dict]) -> dict:
+    return dict(
+        get_jenkins_log_summary_in_db(log),
+        parsed_log_data=parsed_log_data,
+        log_offset=log["log_offset"],
+        is_complete=log["is_complete"],
+    )
@@ -0,0 +1,14 @@
+def get_jenkins_log_job_in_db(job) -> dict:
+    return dict(
+        id=str(job["_id"]),
+        external_url=job["external_url"],
+        status=job["status"],
+        status_code=job["status_code"],
+        detail=job["detail"],
+        time_created=job["time_created"],
+        time_started=job["time_started"],
+        time_finished=job["time_finished"],
+        time_spent=job["time_spent"],
+        jenkins_log_id=job["jenkins_log_id"],
+        user_id=job["user_id"],
+    )
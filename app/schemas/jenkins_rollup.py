@@ -0,0 +1,6 @@
+def get_jenkins_rollup_in_db(rollup) -> dict:
+    return dict(
+        day=rollup["day"],
+        chart_log_data=rollup["chart_log_data"],
+        jenkins_logs=rollup["jenkins_logs"],
+    )
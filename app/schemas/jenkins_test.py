@@ -0,0 +1,21 @@
+def get_jenkins_test_in_db(test) -> dict:
+    return dict(
+        id=str(test["_id"]),
+        test_name=test["test_name"],
+        test_result=test["test_result"],
+        test_reason=test["test_reason"],
+        time_executed=test["time_executed"],
+        jenkins_log_id=test["jenkins_log_id"],
+        user_id=test["user_id"],
+    )
+
+
+def get_jenkins_test_search_in_db(test, snippet: str) -> dict:
+    return dict(
+        id=str(test["_id"]),
+        test_name=test["test_name"],
+        test_result=test["test_result"],
+        snippet=snippet,
+        time_executed=test["time_executed"],
+        jenkins_log_id=test["jenkins_log_id"],
+    )
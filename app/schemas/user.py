@@ -5,4 +5,5 @@ def get_user_in_db(user) -> dict:
         email=user["email"],
         hashed_credentials=user["hashed_credentials"],
         is_active=user["is_active"],
+        token_version=user.get("token_version", 0),
     )
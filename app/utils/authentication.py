@@ -1,20 +1,37 @@
 import re
+import hmac
+import json
+import time
 import string
 import base64
+import hashlib
 from typing import Annotated
 from fastapi import Depends, HTTPException, status
-from fastapi.security import HTTPBasic, HTTPBasicCredentials
+from fastapi.security import (
+    HTTPAuthorizationCredentials,
+    HTTPBasic,
+    HTTPBasicCredentials,
+    HTTPBearer,
+)
 from app.models.user import UserResponse
-from app.crud.user import get_user_by_username
+from app.crud.user import get_user_by_username, get_user_token_version
+from app.utils.constants import Authentication
 
 
-security = HTTPBasic()
+security = HTTPBasic(auto_error=False)
+bearer_security = HTTPBearer(auto_error=False)
 
 
 async def get_current_user(
-    credentials: Annotated[HTTPBasicCredentials, Depends(security)]
+    credentials: Annotated[HTTPBasicCredentials | None, Depends(security)],
+    bearer_credentials: Annotated[
+        HTTPAuthorizationCredentials | None, Depends(bearer_security)
+    ],
 ):
-    user_in_system = await get_user_by_username(credentials.username)
+    if bearer_credentials:
+        return await get_session_token_user(bearer_credentials.credentials)
+
+    user_in_system = credentials and await get_user_by_username(credentials.username)
     if not user_in_system or not is_credentials(
         user_in_system, credentials.username, credentials.password
     ):
@@ -36,9 +53,32 @@ async def get_current_active_user(
     return current_user
 
 
+async def get_session_token_user(token: str) -> dict:
+    payload = verify_session_token(token)
+
+    # -> The signature proves the payload, so the database is only asked
+    #    whether the token was revoked once it is close to expiry
+    if (
+        payload
+        and payload["exp"] - time.time() < Authentication.TOKEN_REVALIDATION_WINDOW
+    ):
+        if await get_user_token_version(payload["sub"]) != payload["ver"]:
+            payload = None
+
+    if not payload:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid authentication credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return dict(id=payload["sub"], is_active=payload["active"])
+
+
 def is_credentials(user, username: str, password: str) -> bool:
     if user:
-        return user["hashed_credentials"] == create_basic_token(username, password)
+        return hmac.compare_digest(
+            user["hashed_credentials"], create_basic_token(username, password)
+        )
     return False
 
 
@@ -52,6 +92,49 @@ def create_basic_token(username: str, password: str) -> str:
     return base64_message
 
 
+def create_session_token(user: dict) -> str:
+    payload = dict(
+        sub=user["id"],
+        active=user["is_active"],
+        ver=user["token_version"],
+        exp=int(time.time()) + Authentication.TOKEN_TTL,
+    )
+    payload_message = encode_token_part(
+        json.dumps(payload, separators=(",", ":")).encode()
+    )
+
+    return f"{payload_message}.{get_token_signature(payload_message)}"
+
+
+def verify_session_token(token: str) -> dict | None:
+    payload_message, _, signature = token.partition(".")
+    if not hmac.compare_digest(
+        signature.encode(), get_token_signature(payload_message).encode()
+    ):
+        return None
+
+    payload = json.loads(decode_token_part(payload_message))
+    if payload["exp"] <= time.time():
+        return None
+    return payload
+
+
+def get_token_signature(payload_message: str) -> str:
+    return encode_token_part(
+        hmac.digest(
+            Authentication.SECRET_KEY.encode(), payload_message.encode(), hashlib.sha256
+        )
+    )
+
+
+def encode_token_part(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).decode("ascii").rstrip("=")
+
+
+def decode_token_part(message: str) -> bytes:
+    return base64.urlsafe_b64decode(message + "=" * (-len(message) % 4))
+
+
 def check_password_strength(password: str) -> bool:
     requirements = [
         len(password) > 8,
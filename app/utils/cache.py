@@ -0,0 +1,98 @@
+from collections import OrderedDict
+from pymongo.errors import DocumentTooLarge
+from motor.motor_asyncio import AsyncIOMotorCollection
+from app.dependencies import jenkins_log_cache_collection
+from app.utils.codec import encode_parsed_log_data, decode_parsed_log_data
+from app.utils.constants import LogCache
+
+
+class LogResultCache:
+    """
+    Parse results of Jenkins consoles keyed by their URL, together with the
+    `ETag`, `Last-Modified` and content hash they were parsed from. Entries live
+    in a memory LRU bounded by the total number of tests, backed by an optional
+    Mongo collection shared by all workers
+    """
+
+    def __init__(
+        self, max_tests: int, collection: AsyncIOMotorCollection | None = None
+    ):
+        self.max_tests = max_tests
+        self.collection = collection
+        self.entries = OrderedDict()
+        self.tests = 0
+        self.stats = dict(
+            not_modified_hits=0, content_hash_hits=0, shared_loads=0, misses=0
+        )
+
+    def get_stats(self) -> dict:
+        return dict(
+            **self.stats,
+            hits=self.stats["not_modified_hits"] + self.stats["content_hash_hits"],
+            entries=len(self.entries),
+            tests=self.tests,
+        )
+
+    def record(self, outcome: str) -> None:
+        self.stats[outcome] += 1
+
+    async def get(self, log_url: str) -> dict | None:
+        if log_url in self.entries:
+            self.entries.move_to_end(log_url)
+            return self.entries[log_url]
+
+        if self.collection is None:
+            return None
+
+        document = await self.collection.find_one({"_id": log_url})
+        if not document:
+            return None
+
+        self.record("shared_loads")
+        entry = dict(
+            etag=document["etag"],
+            last_modified=document["last_modified"],
+            content_hash=document["content_hash"],
+            parsed_log_data=decode_parsed_log_data(document["parsed_log_data_encoded"]),
+        )
+        self.store(log_url, entry)
+
+        return entry
+
+    async def put(self, log_url: str, entry: dict) -> None:
+        self.store(log_url, entry)
+
+        if self.collection is None:
+            return
+
+        document = dict(
+            etag=entry["etag"],
+            last_modified=entry["last_modified"],
+            content_hash=entry["content_hash"],
+            parsed_log_data_encoded=encode_parsed_log_data(entry["parsed_log_data"]),
+        )
+        try:
+            await self.collection.replace_one({"_id": log_url}, document, upsert=True)
+        except DocumentTooLarge:
+            # -> The shared tier is best effort, the memory tier still holds it
+            pass
+
+    def store(self, log_url: str, entry: dict) -> None:
+        if log_url in self.entries:
+            self.tests -= len(self.entries.pop(log_url)["parsed_log_data"])
+
+        if len(entry["parsed_log_data"]) > self.max_tests:
+            return
+
+        self.entries[log_url] = entry
+        self.tests += len(entry["parsed_log_data"])
+
+        while self.tests > self.max_tests:
+            _, evicted_entry = self.entries.popitem(last=False)
+            self.tests -= len(evicted_entry["parsed_log_data"])
+
+
+log_result_cache = LogResultCache(
+    max_tests=LogCache.MAX_TESTS,
+    collection=jenkins_log_cache_collection if LogCache.IS_SHARED else None,
+)
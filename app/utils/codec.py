@@ -0,0 +1,91 @@
+import sys
+import json
+import zlib
+import struct
+from array import array
+from app.utils.constants import LogStorage
+from app.utils.parser import ParsedLogColumns
+
+
+CODEC_VERSION = 1
+CODEC_HEADER = struct.Struct("<BII")
+
+
+def get_array_bytes(values: array) -> bytes:
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def get_array_from_bytes(typecode: str, data: bytes) -> array:
+    values = array(typecode)
+    values.frombytes(data)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+def encode_parsed_log_data(parsed_log_columns: ParsedLogColumns) -> bytes:
+    """
+    Dictionary-encodes test names and reasons (each distinct string is stored
+    once and referenced by index) and compresses the whole payload
+    """
+    strings = {}
+    test_names = array(
+        "I",
+        (
+            strings.setdefault(name, len(strings))
+            for name in parsed_log_columns.test_names
+        ),
+    )
+    test_reasons = array(
+        "I",
+        (
+            strings.setdefault(reason, len(strings))
+            for reason in parsed_log_columns.test_reasons
+        ),
+    )
+    dictionary = json.dumps(list(strings), ensure_ascii=False).encode("utf-8")
+
+    return zlib.compress(
+        b"".join(
+            (
+                CODEC_HEADER.pack(
+                    CODEC_VERSION, len(parsed_log_columns), len(dictionary)
+                ),
+                dictionary,
+                get_array_bytes(test_names),
+                get_array_bytes(test_reasons),
+                parsed_log_columns.test_results.tobytes(),
+            )
+        ),
+        LogStorage.COMPRESSION_LEVEL,
+    )
+
+
+def decode_parsed_log_data(payload: bytes) -> ParsedLogColumns:
+    data = zlib.decompress(payload)
+
+    version, tests, dictionary_size = CODEC_HEADER.unpack_from(data)
+    if version != CODEC_VERSION:
+        raise ValueError(f"Unsupported parsed log data codec version '{version}'")
+
+    offset = CODEC_HEADER.size
+    strings = json.loads(data[offset : offset + dictionary_size])
+    offset += dictionary_size
+
+    index_size = tests * array("I").itemsize
+    test_names = get_array_from_bytes("I", data[offset : offset + index_size])
+    offset += index_size
+    test_reasons = get_array_from_bytes("I", data[offset : offset + index_size])
+    offset += index_size
+
+    parsed_log_columns = ParsedLogColumns()
+    parsed_log_columns.test_names = [strings[index] for index in test_names]
+    parsed_log_columns.test_reasons = [strings[index] for index in test_reasons]
+    parsed_log_columns.test_results = get_array_from_bytes(
+        "B", data[offset : offset + tests]
+    )
+
+    return parsed_log_columns
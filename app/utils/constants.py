@@ -1,8 +1,27 @@
+import os
+from dotenv import load_dotenv
+
+
+load_dotenv()
+
+
 class Dependencies:
     DB_NAME = "jenkins-log-parser-db"
     USER_COLLECTION = "users"
     JENKINS_LOG_COLLECTION = "jenkins-logs"
     JENKINS_HISTORY_COLLECTION = "jenkins-histories"
+    JENKINS_LOG_CACHE_COLLECTION = "jenkins-log-cache"
+    JENKINS_TEST_COLLECTION = "jenkins-tests"
+    JENKINS_LOG_JOB_COLLECTION = "jenkins-log-jobs"
+    JENKINS_ROLLUP_COLLECTION = "jenkins-rollups"
+    JENKINS_FAILURE_SIGNATURE_COLLECTION = "jenkins-failure-signatures"
+    JENKINS_LOG_BUCKET = "jenkins-logs-fs"
+
+
+class JenkinsApi:
+    PROGRESSIVE_TEXT = "logText/progressiveText"
+    TEXT_SIZE_HEADER = "X-Text-Size"
+    MORE_DATA_HEADER = "X-More-Data"
 
 
 class TestResult:
@@ -13,13 +32,112 @@ class TestResult:
     SKIPPED = "Skipped"
 
 
+class JobStatus:
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
 class RegexString:
     TEST_SEPARATOR = r"Starting setUp"
 
-    TEST_NAME = r"tid: (.*)\u001b"
-    TEST_RESULT = r"res: (Pass|Fail|Error|Blocked|Skipped)\u001b"
+    TEST_NAME = r"tid: (.*)\x1b"
+    TEST_RESULT = r"res: (Pass|Fail|Error|Blocked|Skipped)\x1b"
 
-    TEST_HESH = r"\n|\d{2}:\d{2}:\d{2}"
+    # -> Same matches as `\n|\d{2}:\d{2}:\d{2}`, but the leading character class
+    #    lets the regex engine skip ahead instead of trying both branches
+    TEST_HESH = r"[\n\d](?:(?<=\n)|(?<=\d)\d:\d{2}:\d{2})"
 
     TEST_FAIL = r'Adding "Failure Message: (.*?)" to the TestRail custom message'
     TEST_ERROR = r'Adding "Failure Message: (.*?)" to the TestRail custom message'
+
+    # -> Masks applied in order when grouping failure reasons, so the same
+    #    failure in different builds gets the same signature
+    FAILURE_UUID = r"\b[0-9a-fA-F]{8}(?:-[0-9a-fA-F]{4}){3}-[0-9a-fA-F]{12}\b"
+    FAILURE_ADDRESS = r"\b0x[0-9a-fA-F]+\b|\b\d{1,3}(?:\.\d{1,3}){3}(?::\d+)?\b"
+    FAILURE_ID = r"\b(?=[0-9a-fA-F]*\d)[0-9a-fA-F]{8,}\b"
+    FAILURE_NUMBER = r"\d+"
+
+
+class LogParser:
+    CHUNK_SIZE = int(os.getenv("LOG_PARSER_CHUNK_SIZE", 1024 * 1024))
+    BATCH_SIZE = int(os.getenv("LOG_PARSER_BATCH_SIZE", 8 * 1024 * 1024))
+    MAX_WORKERS = int(os.getenv("LOG_PARSER_MAX_WORKERS", os.cpu_count() or 1))
+    SHARDS = int(os.getenv("LOG_PARSER_SHARDS", max(MAX_WORKERS, 1)))
+    OFFLOAD_THRESHOLD = int(os.getenv("LOG_PARSER_OFFLOAD_THRESHOLD", 4 * 1024 * 1024))
+    SHARED_MEMORY_DIR = os.getenv(
+        "LOG_PARSER_SHARED_MEMORY_DIR",
+        "/dev/shm" if os.path.isdir("/dev/shm") else None,
+    )
+
+
+class LogFetcher:
+    CONNECT_TIMEOUT = float(os.getenv("LOG_FETCHER_CONNECT_TIMEOUT", 10))
+    READ_TIMEOUT = float(os.getenv("LOG_FETCHER_READ_TIMEOUT", 60))
+    MAX_CONNECTIONS = int(os.getenv("LOG_FETCHER_MAX_CONNECTIONS", 100))
+    MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("LOG_FETCHER_MAX_KEEPALIVE", 20))
+    MAX_RESPONSE_SIZE = int(os.getenv("LOG_FETCHER_MAX_RESPONSE_SIZE", 4 * 1024**3))
+
+
+class LogBatch:
+    MAX_CONCURRENCY = int(os.getenv("LOG_BATCH_MAX_CONCURRENCY", 8))
+    MAX_URLS = int(os.getenv("LOG_BATCH_MAX_URLS", 200))
+
+
+class LogJob:
+    MAX_WORKERS = int(os.getenv("LOG_JOB_MAX_WORKERS", 4))
+    LEASE_SECONDS = int(os.getenv("LOG_JOB_LEASE_SECONDS", 60))
+    HEARTBEAT_SECONDS = int(os.getenv("LOG_JOB_HEARTBEAT_SECONDS", 20))
+
+
+class LogUpload:
+    SPOOL_DIR = os.getenv("LOG_UPLOAD_SPOOL_DIR")
+    MAX_SIZE = int(os.getenv("LOG_UPLOAD_MAX_SIZE", 4 * 1024**3))
+
+
+class LogCache:
+    MAX_TESTS = int(os.getenv("LOG_CACHE_MAX_TESTS", 1_000_000))
+    IS_SHARED = os.getenv("LOG_CACHE_SHARED", "false").lower() == "true"
+
+
+class LogStorage:
+    COMPRESSION_LEVEL = int(os.getenv("LOG_STORAGE_COMPRESSION_LEVEL", 6))
+    GRIDFS_THRESHOLD = int(os.getenv("LOG_STORAGE_GRIDFS_THRESHOLD", 8 * 1024 * 1024))
+
+
+class FailureSignature:
+    MAX_EXAMPLES = int(os.getenv("FAILURE_SIGNATURE_MAX_EXAMPLES", 5))
+    CACHE_SIZE = int(os.getenv("FAILURE_SIGNATURE_CACHE_SIZE", 4096))
+
+
+class Serialization:
+    # -> Parsed logs are returned without response model validation and
+    #    encoded with orjson when it is installed
+    FAST_JSON = os.getenv("SERIALIZATION_FAST_JSON", "false").lower() == "true"
+
+
+class Pagination:
+    NDJSON_MEDIA_TYPE = "application/x-ndjson"
+    NEXT_CURSOR_HEADER = "X-Next-Cursor"
+    MAX_LIMIT = int(os.getenv("PAGINATION_MAX_LIMIT", 1000))
+
+
+class TestSearch:
+    SNIPPET_SIZE = int(os.getenv("TEST_SEARCH_SNIPPET_SIZE", 160))
+
+
+class Authentication:
+    # -> Every worker has to sign tokens with the same key that survives
+    #    restarts, so there is no generated fallback and startup fails without it
+    SECRET_KEY = os.getenv("AUTH_SECRET_KEY")
+    TOKEN_TTL = int(os.getenv("AUTH_TOKEN_TTL", 60 * 60))
+    TOKEN_REVALIDATION_WINDOW = int(os.getenv("AUTH_TOKEN_REVALIDATION_WINDOW", 5 * 60))
+
+
+class LogEvent:
+    MEDIA_TYPE = "text/event-stream"
+    PROGRESS = "progress"
+    FAILURE = "failure"
+    COMPLETE = "complete"
+    ERROR = "error"
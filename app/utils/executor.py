@@ -0,0 +1,78 @@
+import os
+import mmap
+import asyncio
+import tempfile
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from app.utils.constants import LogParser
+from app.utils.parser import (
+    ParsedLogColumns,
+    parse_log_segment,
+    parse_log_file,
+    shard_log_segment,
+)
+
+
+parser_executor: ProcessPoolExecutor | None = None
+
+
+def start_parser_executor() -> None:
+    global parser_executor
+
+    if LogParser.MAX_WORKERS > 0:
+        parser_executor = ProcessPoolExecutor(
+            max_workers=LogParser.MAX_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+
+
+def shutdown_parser_executor() -> None:
+    global parser_executor
+
+    if parser_executor is not None:
+        parser_executor.shutdown(cancel_futures=True)
+        parser_executor = None
+
+
+async def run_parse_log_file(
+    path: str, start: int = 0, end: int | None = None
+) -> ParsedLogColumns:
+    if end is None:
+        end = os.path.getsize(path)
+
+    if parser_executor is None or end - start < LogParser.OFFLOAD_THRESHOLD:
+        return parse_log_file(path, start, end)
+
+    with open(path, "rb") as log_file, mmap.mmap(
+        log_file.fileno(), 0, access=mmap.ACCESS_READ
+    ) as data:
+        shards = shard_log_segment(data, LogParser.SHARDS, start, end)
+
+    loop = asyncio.get_running_loop()
+    shard_results = await asyncio.gather(
+        *(
+            loop.run_in_executor(
+                parser_executor, parse_log_file, path, shard_start, shard_end
+            )
+            for shard_start, shard_end in shards
+        )
+    )
+
+    parsed_log_columns = ParsedLogColumns()
+    for shard_result in shard_results:
+        parsed_log_columns.extend(shard_result)
+
+    return parsed_log_columns
+
+
+async def run_parse_log_segment(segment: bytes) -> ParsedLogColumns:
+    if parser_executor is None or len(segment) < LogParser.OFFLOAD_THRESHOLD:
+        return parse_log_segment(segment)
+
+    # -> Workers map the segment from a tmpfs file instead of unpickling it,
+    #    and send back compact columns rather than pydantic models
+    with tempfile.NamedTemporaryFile(dir=LogParser.SHARED_MEMORY_DIR) as shared_file:
+        shared_file.write(segment)
+        shared_file.flush()
+
+        return await run_parse_log_file(shared_file.name, 0, len(segment))
@@ -0,0 +1,50 @@
+import httpx
+import hashlib
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+from fastapi import HTTPException, status
+from app.dependencies import http_client
+from app.utils.constants import LogParser, LogFetcher
+
+
+def check_response_size(content_size: int) -> None:
+    if content_size > LogFetcher.MAX_RESPONSE_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="External log exceeds the maximum allowed size",
+        )
+
+
+@asynccontextmanager
+async def open_log_response(
+    log_url: str, headers: dict | None = None, params: dict | None = None
+) -> AsyncIterator[httpx.Response]:
+    try:
+        async with http_client.stream(
+            "GET", log_url, headers=headers, params=params
+        ) as response:
+            if response.status_code != status.HTTP_304_NOT_MODIFIED:
+                response.raise_for_status()
+
+            if content_length := response.headers.get("Content-Length"):
+                check_response_size(int(content_length))
+
+            yield response
+    except (httpx.HTTPError, httpx.InvalidURL):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Unable to get data from external API",
+        )
+
+
+async def iter_response_chunks(
+    response: httpx.Response, content_hash: "hashlib._Hash | None" = None
+) -> AsyncIterator[bytes]:
+    content_size = 0
+
+    async for chunk in response.aiter_bytes(chunk_size=LogParser.CHUNK_SIZE):
+        content_size += len(chunk)
+        check_response_size(content_size)
+        if content_hash is not None:
+            content_hash.update(chunk)
+        yield chunk
@@ -0,0 +1,60 @@
+import asyncio
+from typing import Awaitable, Callable, Coroutine
+from bson import ObjectId
+from app.utils.constants import LogJob
+
+
+# -> Identifies the jobs run by this process among every running instance
+instance_id = str(ObjectId())
+job_semaphore = asyncio.Semaphore(LogJob.MAX_WORKERS)
+job_tasks: set[asyncio.Task] = set()
+shielded_tasks: set[asyncio.Task] = set()
+periodic_tasks: set[asyncio.Task] = set()
+
+
+def run_in_background(coroutine: Coroutine) -> None:
+    # -> Running tasks are referenced until done, so they are not garbage
+    #    collected mid-flight and can be cancelled on shutdown
+    task = asyncio.create_task(run_bounded(coroutine))
+    job_tasks.add(task)
+    task.add_done_callback(job_tasks.discard)
+
+
+async def run_bounded(coroutine: Coroutine) -> None:
+    try:
+        async with job_semaphore:
+            await coroutine
+    finally:
+        # -> A job cancelled while queued was never started, its status is
+        #    fixed once the shutdown that cancelled it is done
+        coroutine.close()
+
+
+async def run_shielded(coroutine: Coroutine) -> object:
+    # -> Cancelling the caller leaves the coroutine running to completion,
+    #    so writes spanning several collections are never cut halfway
+    task = asyncio.create_task(coroutine)
+    shielded_tasks.add(task)
+    task.add_done_callback(shielded_tasks.discard)
+    return await asyncio.shield(task)
+
+
+def run_periodically(function: Callable[[], Awaitable], interval: float) -> None:
+    async def run_forever() -> None:
+        while True:
+            await function()
+            await asyncio.sleep(interval)
+
+    task = asyncio.create_task(run_forever())
+    periodic_tasks.add(task)
+    task.add_done_callback(periodic_tasks.discard)
+
+
+async def shutdown_background_jobs() -> None:
+    for task in periodic_tasks:
+        task.cancel()
+    await asyncio.gather(*periodic_tasks, return_exceptions=True)
+    for task in job_tasks:
+        task.cancel()
+    await asyncio.gather(*job_tasks, return_exceptions=True)
+    await asyncio.gather(*shielded_tasks, return_exceptions=True)
@@ -0,0 +1,34 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+from pymongo import monitoring
+
+
+# -> Motor copies the context into its executor threads, so commands are
+#    attributed to the request or test that issued them
+command_names: ContextVar[list[str] | None] = ContextVar("command_names", default=None)
+
+
+class CommandCounter(monitoring.CommandListener):
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        if (commands := command_names.get()) is not None:
+            commands.append(event.command_name)
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        pass
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        pass
+
+
+command_counter = CommandCounter()
+
+
+@contextmanager
+def count_commands() -> Iterator[list[str]]:
+    commands = []
+    token = command_names.set(commands)
+    try:
+        yield commands
+    finally:
+        command_names.reset(token)
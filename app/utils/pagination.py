@@ -0,0 +1,51 @@
+import base64
+import binascii
+from typing import AsyncIterable, AsyncIterator
+from bson import ObjectId
+from bson.errors import InvalidId
+from fastapi import HTTPException, Request, status
+from fastapi.responses import StreamingResponse
+from app.utils.constants import Pagination
+from app.utils.serialization import dumps_json
+
+
+def encode_cursor(document_id: str) -> str:
+    return base64.urlsafe_b64encode(ObjectId(document_id).binary).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> ObjectId:
+    try:
+        return ObjectId(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (binascii.Error, InvalidId, TypeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid pagination cursor"
+        )
+
+
+def get_page_query(query: dict, after: str | None, descending: bool = False) -> dict:
+    # -> Keyset pagination: the next page starts right after the last _id seen,
+    #    so every page is an index range scan instead of a growing skip
+    if after:
+        return dict(query, _id={"$lt" if descending else "$gt": decode_cursor(after)})
+    return query
+
+
+def get_next_cursor(documents: list[dict], limit: int | None) -> str | None:
+    if limit and len(documents) == limit:
+        return encode_cursor(documents[-1]["id"])
+    return None
+
+
+def is_ndjson_requested(request: Request) -> bool:
+    return Pagination.NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+async def iter_ndjson(documents: AsyncIterable[dict]) -> AsyncIterator[bytes]:
+    async for document in documents:
+        yield dumps_json(document) + b"\n"
+
+
+def get_ndjson_response(documents: AsyncIterable[dict]) -> StreamingResponse:
+    return StreamingResponse(
+        iter_ndjson(documents), media_type=Pagination.NDJSON_MEDIA_TYPE
+    )
@@ -0,0 +1,326 @@
+import re
+import mmap
+import hashlib
+from array import array
+from functools import lru_cache
+from typing import AsyncIterable, AsyncIterator, Iterable, Iterator
+from app.utils.constants import TestResult, RegexString, FailureSignature
+
+
+# -> Patterns are compiled once and applied to raw bytes, only the extracted
+#    fields are ever decoded
+TEST_SEPARATOR = RegexString.TEST_SEPARATOR.encode("utf-8")
+TEST_SEPARATOR_PATTERN = re.compile(re.escape(TEST_SEPARATOR))
+TEST_NAME_PATTERN = re.compile(RegexString.TEST_NAME.encode("utf-8"))
+TEST_RESULT_PATTERN = re.compile(RegexString.TEST_RESULT.encode("utf-8"))
+TEST_FAIL_PATTERN = re.compile(RegexString.TEST_FAIL.encode("utf-8"), re.DOTALL)
+TEST_ERROR_PATTERN = re.compile(RegexString.TEST_ERROR.encode("utf-8"), re.DOTALL)
+TEST_HESH_PATTERN = re.compile(RegexString.TEST_HESH)
+TEST_HESH_BYTES_PATTERN = re.compile(RegexString.TEST_HESH.encode("utf-8"))
+FAILURE_REASON_MASKS = (
+    (re.compile(RegexString.FAILURE_UUID), "<id>"),
+    (re.compile(RegexString.FAILURE_ADDRESS), "<address>"),
+    (re.compile(RegexString.FAILURE_ID), "<id>"),
+    (re.compile(RegexString.FAILURE_NUMBER), "<n>"),
+)
+
+TEST_RESULT_CODES = (
+    TestResult.PASS,
+    TestResult.FAIL,
+    TestResult.ERROR,
+    TestResult.BLOCKED,
+    TestResult.SKIPPED,
+)
+TEST_RESULTS = {result.encode("utf-8"): result for result in TEST_RESULT_CODES}
+TEST_CODES = {result: code for code, result in enumerate(TEST_RESULT_CODES)}
+TEST_REASON_PATTERNS = {
+    TestResult.FAIL: TEST_FAIL_PATTERN,
+    TestResult.ERROR: TEST_ERROR_PATTERN,
+}
+TEST_NO_REASONS = {
+    result: f"There are no reason (res: {result})" for result in TEST_RESULTS.values()
+}
+
+CHART_FIELDS = {
+    TestResult.PASS: "passed",
+    TestResult.FAIL: "failed",
+    TestResult.ERROR: "errored",
+    TestResult.BLOCKED: "blocked",
+    TestResult.SKIPPED: "skipped",
+}
+
+
+class ParsedLogColumns:
+    """
+    Parsed tests stored column by column, with results kept as one byte codes
+    into `TEST_RESULT_CODES`. It replaces per-test `ParsedLogData` models in the
+    parse loop and between processes, models are only built on demand
+    """
+
+    __slots__ = ("test_names", "test_results", "test_reasons")
+
+    def __init__(self):
+        self.test_names = []
+        self.test_results = array("B")
+        self.test_reasons = []
+
+    def __len__(self) -> int:
+        return len(self.test_names)
+
+    def __iter__(self) -> Iterator[tuple[str, str, str]]:
+        for test_name, test_code, test_reason in zip(
+            self.test_names, self.test_results, self.test_reasons
+        ):
+            yield test_name, TEST_RESULT_CODES[test_code], test_reason
+
+    def append(self, test_name: str, test_code: int, test_reason: str) -> None:
+        self.test_names.append(test_name)
+        self.test_results.append(test_code)
+        self.test_reasons.append(test_reason)
+
+    def extend(self, parsed_log_columns: "ParsedLogColumns") -> None:
+        self.test_names.extend(parsed_log_columns.test_names)
+        self.test_results.extend(parsed_log_columns.test_results)
+        self.test_reasons.extend(parsed_log_columns.test_reasons)
+
+    def get_chart_log_data(self) -> dict:
+        return {
+            CHART_FIELDS[test_result]: self.test_results.count(test_code)
+            for test_code, test_result in enumerate(TEST_RESULT_CODES)
+        }
+
+    def get_failure_signatures(self) -> dict[str, dict]:
+        failure_signatures = {}
+        failure_codes = (TEST_CODES[TestResult.FAIL], TEST_CODES[TestResult.ERROR])
+        for test_name, test_code, test_reason in zip(
+            self.test_names, self.test_results, self.test_reasons
+        ):
+            if test_code not in failure_codes:
+                continue
+
+            signature, failure_reason = get_test_failure_signature(test_reason)
+            failure_signature = failure_signatures.setdefault(
+                signature,
+                dict(failure_reason=failure_reason, count=0, test_names=[]),
+            )
+            failure_signature["count"] += 1
+            if len(failure_signature["test_names"]) < FailureSignature.MAX_EXAMPLES:
+                failure_signature["test_names"].append(test_name)
+        return failure_signatures
+
+    def to_documents(self) -> list[dict]:
+        return [
+            dict(test_name=test_name, test_result=test_result, test_reason=test_reason)
+            for test_name, test_result, test_reason in self
+        ]
+
+    @classmethod
+    def from_documents(cls, documents: Iterable[dict]) -> "ParsedLogColumns":
+        parsed_log_columns = cls()
+        for document in documents:
+            parsed_log_columns.append(
+                document["test_name"],
+                TEST_RESULT_CODES.index(document["test_result"]),
+                document["test_reason"],
+            )
+        return parsed_log_columns
+
+
+class LogStreamSplitter:
+    """
+    Cuts a chunked Jenkins console into segments of complete test blocks,
+    carrying only the incomplete `Starting setUp` block across chunk boundaries.
+    A segment is only released once it holds at least `batch_size` bytes.
+    The carried `tail` and `is_header` state can be persisted and restored
+    """
+
+    def __init__(self, batch_size: int = 0, tail: bytes = b"", is_header: bool = True):
+        self.batch_size = batch_size
+        self.buffer = bytearray(tail)
+        self.is_header = is_header
+        self.last_separator = -1 if is_header else self.buffer.rfind(TEST_SEPARATOR)
+
+    @property
+    def tail(self) -> bytes:
+        return bytes(self.buffer)
+
+    def feed(self, chunk: bytes) -> bytes | None:
+        search_from = max(len(self.buffer) - len(TEST_SEPARATOR) + 1, 0)
+        self.buffer += chunk
+
+        if self.is_header:
+            position = self.buffer.find(TEST_SEPARATOR, search_from)
+            if position == -1:
+                # -> The console header is never parsed, so keep only the bytes
+                #    that may still turn out to be the start of a separator
+                del self.buffer[: max(len(self.buffer) - len(TEST_SEPARATOR) + 1, 0)]
+                return None
+
+            del self.buffer[: position + len(TEST_SEPARATOR)]
+            self.is_header = False
+            search_from = 0
+
+        position = self.buffer.rfind(TEST_SEPARATOR, search_from)
+        if position != -1:
+            self.last_separator = position
+
+        if self.last_separator < self.batch_size:
+            return None
+
+        return self.flush()
+
+    def flush(self) -> bytes | None:
+        if self.last_separator == -1:
+            return None
+
+        segment = bytes(self.buffer[: self.last_separator])
+        del self.buffer[: self.last_separator + len(TEST_SEPARATOR)]
+        self.last_separator = -1
+
+        return segment
+
+    def close(self) -> bytes | None:
+        if self.is_header:
+            return None
+
+        segment = bytes(self.buffer)
+        self.buffer.clear()
+        self.last_separator = -1
+
+        return segment
+
+
+def clean_traceback_msg(string: str) -> str:
+    return TEST_HESH_PATTERN.sub("", string)
+
+
+def normalize_failure_reason(failure_reason: str) -> str:
+    for pattern, mask in FAILURE_REASON_MASKS:
+        failure_reason = pattern.sub(mask, failure_reason)
+    return " ".join(failure_reason.split())
+
+
+def get_failure_signature(failure_reason: str) -> str:
+    return hashlib.blake2b(failure_reason.encode("utf-8"), digest_size=8).hexdigest()
+
+
+@lru_cache(maxsize=FailureSignature.CACHE_SIZE)
+def get_test_failure_signature(test_reason: str) -> tuple[str, str]:
+    # -> Failures of one build mostly repeat a few reasons, which are normalised
+    #    once for the log document and again for every stored test
+    failure_reason = normalize_failure_reason(test_reason)
+    return get_failure_signature(failure_reason), failure_reason
+
+
+def parse_traceback_msg(pattern: re.Pattern, data: bytes, start: int, end: int) -> str:
+    traceback_msg = pattern.search(data, start, end).group(1)
+
+    # -> `\d` only differs between bytes and str patterns for non-ASCII digits
+    if traceback_msg.isascii():
+        return str(TEST_HESH_BYTES_PATTERN.sub(b"", traceback_msg), encoding="utf-8")
+    return clean_traceback_msg(str(traceback_msg, encoding="utf-8"))
+
+
+def parse_test_block(data: bytes, start: int, end: int) -> tuple[str, int, str]:
+    test_name = str(TEST_NAME_PATTERN.search(data, start, end).group(1), "utf-8")
+    test_result = TEST_RESULTS[TEST_RESULT_PATTERN.search(data, start, end).group(1)]
+
+    if test_result in TEST_REASON_PATTERNS:
+        test_reason = parse_traceback_msg(
+            TEST_REASON_PATTERNS[test_result], data, start, end
+        )
+    else:
+        test_reason = TEST_NO_REASONS[test_result]
+
+    return test_name, TEST_CODES[test_result], test_reason
+
+
+def iter_test_block_spans(
+    data: bytes, start: int = 0, end: int | None = None
+) -> Iterator[tuple[int, int]]:
+    """
+    Yields the (start, end) offsets of every test block in a segment, i.e. a
+    byte range that starts right after a separator and holds no header
+    """
+    end = len(data) if end is None else end
+    block_start = start
+
+    for separator in TEST_SEPARATOR_PATTERN.finditer(data, start, end):
+        yield block_start, separator.start()
+        block_start = separator.end()
+
+    yield block_start, end
+
+
+def parse_log_segment(
+    data: bytes, start: int = 0, end: int | None = None
+) -> ParsedLogColumns:
+    parsed_log_columns = ParsedLogColumns()
+
+    for block_start, block_end in iter_test_block_spans(data, start, end):
+        parsed_log_columns.append(*parse_test_block(data, block_start, block_end))
+
+    return parsed_log_columns
+
+
+def shard_log_segment(
+    data: bytes, shards: int, start: int = 0, end: int | None = None
+) -> list[tuple[int, int]]:
+    """
+    Cuts a segment into at most `shards` byte ranges of roughly equal size,
+    each of them aligned to a `Starting setUp` separator
+    """
+    end = len(data) if end is None else end
+    ranges = []
+    shard_start = start
+
+    for index in range(1, shards):
+        target = start + (end - start) * index // shards
+        separator = TEST_SEPARATOR_PATTERN.search(data, max(target, shard_start), end)
+        if separator is None:
+            break
+        ranges.append((shard_start, separator.start()))
+        shard_start = separator.end()
+
+    ranges.append((shard_start, end))
+
+    return ranges
+
+
+def find_log_file_segment(path: str) -> tuple[int, int] | None:
+    """
+    Returns the byte range of a console file that follows its header, or
+    `None` when the console holds no tests
+    """
+    with open(path, "rb") as log_file:
+        log_file.seek(0, 2)
+        if not log_file.tell():
+            return None
+
+        with mmap.mmap(log_file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            position = data.find(TEST_SEPARATOR)
+            if position == -1:
+                return None
+            return position + len(TEST_SEPARATOR), len(data)
+
+
+def parse_log_file(
+    path: str, start: int = 0, end: int | None = None
+) -> ParsedLogColumns:
+    with open(path, "rb") as log_file, mmap.mmap(
+        log_file.fileno(), 0, access=mmap.ACCESS_READ
+    ) as data:
+        return parse_log_segment(data, start, end)
+
+
+async def aiter_log_segments(
+    chunks: AsyncIterable[bytes], batch_size: int = 0
+) -> AsyncIterator[bytes]:
+    splitter = LogStreamSplitter(batch_size)
+
+    async for chunk in chunks:
+        if (segment := splitter.feed(chunk)) is not None:
+            yield segment
+
+    if (segment := splitter.close()) is not None:
+        yield segment
@@ -0,0 +1,61 @@
+import json
+import asyncio
+from typing import AsyncIterable, AsyncIterator
+from app.utils.constants import LogEvent, TestResult
+from app.utils.parser import ParsedLogColumns, CHART_FIELDS
+
+
+class LogProgress:
+    """Collects progress of one log parse and queues it as Server-Sent Events"""
+
+    def __init__(self) -> None:
+        self.bytes_fetched = 0
+        self.tests_parsed = 0
+        self.chart_log_data = dict.fromkeys(CHART_FIELDS.values(), 0)
+        self.events: asyncio.Queue[str | None] = asyncio.Queue()
+
+    async def aiter_fetched(self, chunks: AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+        async for chunk in chunks:
+            self.bytes_fetched += len(chunk)
+            yield chunk
+
+    def parsed(self, log_results: ParsedLogColumns) -> None:
+        # -> Failures are pushed as soon as their segment is parsed, before
+        #    the rest of the console is fetched
+        for test_name, test_result, test_reason in log_results:
+            if test_result in (TestResult.FAIL, TestResult.ERROR):
+                self.put(
+                    LogEvent.FAILURE,
+                    dict(
+                        test_name=test_name,
+                        test_result=test_result,
+                        test_reason=test_reason,
+                    ),
+                )
+
+        self.tests_parsed += len(log_results)
+        for field, count in log_results.get_chart_log_data().items():
+            self.chart_log_data[field] += count
+
+        self.put(
+            LogEvent.PROGRESS,
+            dict(
+                bytes_fetched=self.bytes_fetched,
+                tests_parsed=self.tests_parsed,
+                chart_log_data=self.chart_log_data,
+            ),
+        )
+
+    def put(self, event: str, data: dict) -> None:
+        self.events.put_nowait(get_sse_message(event, data))
+
+    def close(self, *_: object) -> None:
+        self.events.put_nowait(None)
+
+    async def iter_events(self) -> AsyncIterator[str]:
+        while (message := await self.events.get()) is not None:
+            yield message
+
+
+def get_sse_message(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
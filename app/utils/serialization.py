@@ -0,0 +1,36 @@
+import json
+from typing import Any
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from app.utils.constants import Serialization
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps_json(content: Any) -> bytes:
+    if orjson:
+        return orjson.dumps(content)
+    return json.dumps(
+        content, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        return dumps_json(content)
+
+
+def get_fast_json_response(content: Any, response: Response | None = None) -> Any:
+    if not Serialization.FAST_JSON:
+        return content
+
+    # -> Returning a response skips the response model validation, the content
+    #    is built by our schemas from documents validated on insert. The model
+    #    still describes the route in the OpenAPI schema
+    fast_json_response = FastJSONResponse(content)
+    if response:
+        fast_json_response.headers.raw.extend(response.headers.raw)
+    return fast_json_response
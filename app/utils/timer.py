@@ -1,7 +1,18 @@
 import time
+import inspect
 
 
 def timeit(func: "function") -> "function":
+    if inspect.iscoroutinefunction(func):
+
+        async def async_wrapper(*args: object, **kwargs: object) -> "function":
+            start_time = time.time()
+            result = await func(*args, **kwargs)
+            elapsed_time = time.time() - start_time
+            return result, elapsed_time
+
+        return async_wrapper
+
     def wrapper(*args: object, **kwargs: object) -> "function":
         start_time = time.time()
         result = func(*args, **kwargs)
@@ -0,0 +1,92 @@
+import gc
+import re
+import sys
+import time
+from app.utils.constants import TestResult, RegexString
+from app.utils.parser import TEST_SEPARATOR, ParsedLogColumns, parse_log_segment
+
+
+BENCHMARK_RESULTS = (
+    TestResult.PASS,
+    TestResult.FAIL,
+    TestResult.ERROR,
+    TestResult.SKIPPED,
+)
+
+
+def get_benchmark_console(tests: int) -> bytes:
+    lines = ["Started by user admin\n"]
+    for index in range(tests):
+        test_result = BENCHMARK_RESULTS[index % len(BENCHMARK_RESULTS)]
+        lines.append("12:00:01 Starting setUp\n")
+        lines.append(f"12:00:01 \u001b[32mtid: test_case_{index}\u001b[0m\n")
+        lines.append("12:00:02 some test output\n")
+        if test_result in (TestResult.FAIL, TestResult.ERROR):
+            lines.append(
+                '12:00:03 Adding "Failure Message: Traceback\n'
+                f'12:00:03 AssertionError: {index} != {index + 1}" '
+                "to the TestRail custom message\n"
+            )
+        lines.append(f"12:00:04 \u001b[1mres: {test_result}\u001b[0m\n")
+    lines.append("Finished: UNSTABLE\n")
+    return "".join(lines).encode("utf-8")
+
+
+def parse_console_reference(content: bytes) -> list[tuple[str, str, str]]:
+    # -> The parser before test blocks were searched in place: the console is
+    #    decoded and split, and every block is searched with str patterns
+    log_results = []
+    for content_data in content.decode("utf-8").split(RegexString.TEST_SEPARATOR)[1:]:
+        test_name = re.search(r"tid: (.*)\u001b", content_data).group(1)
+        test_result = re.search(
+            r"res: (Pass|Fail|Error|Blocked|Skipped)\u001b", content_data
+        ).group(1)
+        if test_result in (TestResult.FAIL, TestResult.ERROR):
+            test_reason = re.sub(
+                r"\n|\d{2}:\d{2}:\d{2}",
+                "",
+                re.search(RegexString.TEST_FAIL, content_data, re.DOTALL).group(1),
+            )
+        else:
+            test_reason = f"There are no reason (res: {test_result})"
+        log_results.append((test_name, test_result, test_reason))
+    return log_results
+
+
+def parse_console(content: bytes) -> ParsedLogColumns:
+    return parse_log_segment(
+        content, content.index(TEST_SEPARATOR) + len(TEST_SEPARATOR)
+    )
+
+
+# -> Compares the current console parser with the reference one on the same
+#    synthetic console, run with `python -m benchmarks.parser [tests]`
+def main(tests: int, repeats: int = 5) -> None:
+    content = get_benchmark_console(tests)
+    if list(parse_console(content)) != parse_console_reference(content):
+        raise AssertionError("Parsers disagree on the benchmark console")
+
+    best_times = {}
+    for parse in (parse_console_reference, parse_console):
+        elapsed_times = []
+        for _ in range(repeats):
+            # -> Collector pauses depend on everything else the process holds
+            gc.disable()
+            start_time = time.perf_counter()
+            parse(content)
+            elapsed_times.append(time.perf_counter() - start_time)
+            gc.enable()
+        best_times[parse] = min(elapsed_times)
+        print(
+            f"{parse.__name__}: {best_times[parse] * 1000:.1f} ms, "
+            f"{tests / best_times[parse]:,.0f} tests/s"
+        )
+
+    print(
+        f"{tests} tests, speedup: "
+        f"{best_times[parse_console_reference] / best_times[parse_console]:.2f}x"
+    )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,62 @@
+import sys
+import time
+import asyncio
+from bson import ObjectId
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute, serialize_response
+from app.main import app
+from app.utils.constants import TestResult
+from app.utils.serialization import FastJSONResponse, orjson
+
+
+def get_route(path: str, method: str) -> APIRoute:
+    return next(
+        route
+        for route in app.routes
+        if route.path == path and method in getattr(route, "methods", ())
+    )
+
+
+def get_benchmark_jenkins_log(tests: int) -> dict:
+    return dict(
+        id=str(ObjectId()),
+        parsed_log_data=[
+            dict(
+                test_name=f"test_case_{index}",
+                test_result=TestResult.FAIL,
+                test_reason=f"AssertionError: {index} != {index + 1}",
+            )
+            for index in range(tests)
+        ],
+        chart_log_data=dict(passed=0, failed=tests, errored=0, skipped=0, blocked=0),
+        user_id=str(ObjectId()),
+    )
+
+
+# -> Compares FastAPI's default serialisation of a parsed Jenkins log with the
+#    `SERIALIZATION_FAST_JSON` path, run with `python -m benchmarks.serialization`
+async def main(tests: int, repeats: int = 5) -> None:
+    jenkins_log = get_benchmark_jenkins_log(tests)
+    response_field = get_route("/jenkins-logs/me/{id}", "GET").response_field
+
+    async def render_default() -> bytes:
+        return JSONResponse(
+            await serialize_response(field=response_field, response_content=jenkins_log)
+        ).body
+
+    async def render_fast() -> bytes:
+        return FastJSONResponse(jenkins_log).body
+
+    for render in (render_default, render_fast):
+        elapsed_times = []
+        for _ in range(repeats):
+            start_time = time.perf_counter()
+            await render()
+            elapsed_times.append(time.perf_counter() - start_time)
+        print(f"{render.__name__}: {min(elapsed_times) * 1000:.1f} ms")
+
+    print(f"{tests} tests, encoder: {'orjson' if orjson else 'json'}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000))
@@ -1,3 +1,8 @@
+import httpx
+from contextlib import asynccontextmanager
+from fastapi import HTTPException, status
+
+
 get_headers = lambda hashed_credentials: {
     "Authorization": f"Basic {hashed_credentials}"
 }
@@ -5,3 +10,63 @@ get_headers = lambda hashed_credentials: {
 swapped_in_half = (
     lambda string: f"{string[len(string) // 2 :]}{string[: len(string) // 2]}"
 )
+
+
+def build_jenkins_log(tests: list[tuple[str, str, str]]) -> bytes:
+    lines = [
+        "Started by user admin\n",
+        "Running in Durability level: MAX_SURVIVABILITY\n",
+    ]
+    for test_name, test_result, test_reason in tests:
+        lines.append("12:00:01 Starting setUp\n")
+        lines.append(f"12:00:01 \u001b[32mtid: {test_name}\u001b[0m\n")
+        lines.append("12:00:02 some test output ✓\n")
+        if test_reason:
+            lines.append(
+                f'12:00:03 Adding "Failure Message: {test_reason}" '
+                "to the TestRail custom message\n"
+            )
+        lines.append(f"12:00:04 \u001b[1mres: {test_result}\u001b[0m\n")
+    lines.append("Finished: UNSTABLE\n")
+    return "".join(lines).encode("utf-8")
+
+
+def get_open_log_response(consoles: dict[str, bytes]):
+    # -> Serves consoles by URL prefix in place of the external Jenkins API
+    @asynccontextmanager
+    async def open_log_response(
+        log_url: str, headers: dict | None = None, params: dict | None = None
+    ):
+        for external_url, console in consoles.items():
+            if log_url.startswith(external_url):
+                yield httpx.Response(status.HTTP_200_OK, content=console)
+                return
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Unable to get data from external API",
+        )
+
+    return open_log_response
+
+
+def get_open_progressive_log_response(console: bytes, poll_size: int):
+    # -> Serves a running build whose console grows by `poll_size` bytes on
+    #    every poll, like the progressiveText API
+    text_size = 0
+
+    @asynccontextmanager
+    async def open_log_response(
+        log_url: str, headers: dict | None = None, params: dict | None = None
+    ):
+        nonlocal text_size
+        text_size = min(len(console), text_size + poll_size)
+        response_headers = {"X-Text-Size": str(text_size)}
+        if text_size < len(console):
+            response_headers["X-More-Data"] = "true"
+        yield httpx.Response(
+            status.HTTP_200_OK,
+            content=console[params["start"] : text_size],
+            headers=response_headers,
+        )
+
+    return open_log_response
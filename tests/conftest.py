@@ -3,6 +3,11 @@ import asyncio
 import pytest
 import pytest_asyncio
 from dotenv import load_dotenv
+
+# -> Set before the app is imported, the signing key is read once at import
+load_dotenv()
+os.environ.setdefault("AUTH_SECRET_KEY", "test-auth-secret-key")
+
 from httpx import AsyncClient
 from pymongo import MongoClient
 from app.main import app
@@ -10,9 +15,6 @@ from app.utils.constants import Dependencies as DP
 from mongoengine import connect, disconnect
 
 
-load_dotenv()
-
-
 @pytest.fixture(scope="session")
 def event_loop():
     loop = asyncio.new_event_loop()
@@ -0,0 +1,132 @@
+import pytest
+from datetime import datetime
+from bson import ObjectId
+from httpx import AsyncClient
+from app.dependencies import (
+    create_indexes,
+    user_collection,
+    jenkins_log_collection,
+    jenkins_history_collection,
+    jenkins_test_collection,
+    jenkins_log_job_collection,
+    jenkins_rollup_collection,
+    jenkins_failure_signature_collection,
+)
+
+
+user_id = str(ObjectId())
+jenkins_log_id = str(ObjectId())
+
+# -> Filters and sorts issued by the CRUD layer, listing all users is the only
+#    query that scans a collection by design
+crud_queries = [
+    (user_collection, {"_id": ObjectId(user_id)}, None),
+    (user_collection, {"username": "kuser"}, None),
+    (
+        jenkins_log_collection,
+        {"_id": ObjectId(jenkins_log_id), "user_id": user_id},
+        None,
+    ),
+    (jenkins_log_collection, {"user_id": user_id}, [("_id", 1)]),
+    (
+        jenkins_log_collection,
+        {"user_id": user_id, "_id": {"$gt": ObjectId(jenkins_log_id)}},
+        [("_id", 1)],
+    ),
+    (
+        jenkins_log_collection,
+        {
+            "user_id": user_id,
+            "external_url": "http://192.168.0.112:8000/jenkins/101/log-file-txt",
+            "log_offset": {"$exists": True},
+        },
+        [("_id", -1)],
+    ),
+    (jenkins_history_collection, {"_id": ObjectId(), "user_id": user_id}, None),
+    (jenkins_history_collection, {"user_id": user_id}, [("_id", 1)]),
+    (
+        jenkins_history_collection,
+        {"jenkins_log_id": jenkins_log_id, "user_id": user_id},
+        None,
+    ),
+    (
+        jenkins_test_collection,
+        {"user_id": user_id, "test_name": "test_login", "test_result": "Fail"},
+        [("time_executed", -1), ("_id", -1)],
+    ),
+    (
+        jenkins_test_collection,
+        {"jenkins_log_id": jenkins_log_id, "user_id": user_id},
+        None,
+    ),
+    (
+        jenkins_test_collection,
+        {"user_id": user_id, "jenkins_log_id": jenkins_log_id},
+        [("test_index", 1)],
+    ),
+    (
+        jenkins_test_collection,
+        {"user_id": user_id, "failure_signature": "signature"},
+        [("_id", -1)],
+    ),
+    (
+        jenkins_test_collection,
+        {"user_id": user_id, "$text": {"$search": "refused"}},
+        [("_id", -1)],
+    ),
+    (jenkins_log_job_collection, {"_id": ObjectId(), "user_id": user_id}, None),
+    (
+        jenkins_log_job_collection,
+        {"instance_id": "instance", "status": {"$in": ["queued", "running"]}},
+        None,
+    ),
+    (
+        jenkins_log_job_collection,
+        {
+            "lease_expires": {"$lt": datetime(2024, 1, 1)},
+            "status": {"$in": ["queued", "running"]},
+        },
+        None,
+    ),
+    (jenkins_rollup_collection, {"user_id": user_id, "day": None}, None),
+    (
+        jenkins_rollup_collection,
+        {"user_id": user_id, "day": {"$ne": None}},
+        [("day", -1)],
+    ),
+    (
+        jenkins_failure_signature_collection,
+        {"user_id": user_id, "count": {"$gt": 0}},
+        [("count", -1)],
+    ),
+    (
+        jenkins_failure_signature_collection,
+        {"user_id": user_id, "signature": {"$in": ["113557c8392d23d7"]}},
+        None,
+    ),
+]
+
+
+def get_plan_stages(plan) -> list[str]:
+    if isinstance(plan, list):
+        return [stage for value in plan for stage in get_plan_stages(value)]
+    if isinstance(plan, dict):
+        return [plan["stage"]] * ("stage" in plan) + get_plan_stages(
+            list(plan.values())
+        )
+    return []
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("collection, query, sort", crud_queries)
+async def test_crud_query_uses_index(
+    async_client: AsyncClient, collection, query, sort
+):
+    await create_indexes()
+
+    cursor = collection.find(query)
+    if sort:
+        cursor = cursor.sort(sort)
+    plan = await cursor.explain()
+
+    assert "COLLSCAN" not in get_plan_stages(plan["queryPlanner"]["winningPlan"])
@@ -0,0 +1,142 @@
+import pytest
+from httpx import AsyncClient
+from fastapi import status
+from app.dependencies import jenkins_failure_signature_collection
+from app.utils.constants import FailureSignature
+from tests.ancillary import get_headers, build_jenkins_log
+
+
+test_user_data = {
+    "username": "suser",
+    "email": "suser@gmail.com",
+    "password": "Suser123_",
+    "is_active": True,
+}
+
+
+@pytest.mark.asyncio
+async def test_get_jenkins_failure_signatures(async_client: AsyncClient):
+    response_user = await async_client.post("/users", json=test_user_data)
+    hashed_credentials = response_user.json()["hashed_credentials"]
+
+    jenkins_log_ids = []
+    for test_results in (
+        [
+            ("test_login", "Fail", "Timeout after 30s on 10.0.0.1"),
+            ("test_logout", "Error", "Timeout after 45s on 10.0.0.2"),
+            ("test_upload", "Fail", "AssertionError: 1 != 2"),
+        ],
+        [
+            ("test_login", "Fail", "Timeout after 12s on 10.0.0.3"),
+            ("test_upload", "Pass", None),
+        ],
+    ):
+        response_upload = await async_client.post(
+            "/jenkins-logs/me/upload",
+            content=build_jenkins_log(test_results),
+            headers=get_headers(hashed_credentials),
+        )
+        jenkins_log_ids.append(response_upload.json()["id"])
+
+    response_get = await async_client.get(
+        "/jenkins-failure-signatures/me", headers=get_headers(hashed_credentials)
+    )
+
+    assert response_get.status_code == status.HTTP_200_OK
+    assert [
+        (
+            failure_signature["failure_reason"],
+            failure_signature["count"],
+            failure_signature["jenkins_logs"],
+        )
+        for failure_signature in response_get.json()
+    ] == [
+        ("Timeout after <n>s on <address>", 3, 2),
+        ("AssertionError: <n> != <n>", 1, 1),
+    ]
+    assert response_get.json()[0]["examples"][0] == {
+        "test_name": "test_login",
+        "jenkins_log_id": jenkins_log_ids[0],
+    }
+
+    await async_client.delete(
+        f"/jenkins-logs/me/{jenkins_log_ids[0]}",
+        headers=get_headers(hashed_credentials),
+    )
+
+    response_get_log = await async_client.get(
+        "/jenkins-failure-signatures/me",
+        params={"jenkins_log_id": jenkins_log_ids[1]},
+        headers=get_headers(hashed_credentials),
+    )
+
+    assert response_get_log.status_code == status.HTTP_200_OK
+    assert response_get_log.json() == [
+        {
+            "signature": response_get.json()[0]["signature"],
+            "failure_reason": "Timeout after <n>s on <address>",
+            "count": 1,
+            "jenkins_logs": 1,
+            "examples": [
+                {"test_name": "test_login", "jenkins_log_id": jenkins_log_ids[1]}
+            ],
+        }
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_jenkins_failure_signature_examples(
+    async_client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(FailureSignature, "MAX_EXAMPLES", 2)
+
+    response_user = await async_client.post("/users", json=test_user_data)
+    hashed_credentials = response_user.json()["hashed_credentials"]
+
+    jenkins_log_ids = []
+    for test_names in (["test_login", "test_logout"], ["test_upload", "test_remove"]):
+        response_upload = await async_client.post(
+            "/jenkins-logs/me/upload",
+            content=build_jenkins_log(
+                [(test_name, "Fail", "KeyError: 42") for test_name in test_names]
+            ),
+            headers=get_headers(hashed_credentials),
+        )
+        jenkins_log_ids.append(response_upload.json()["id"])
+
+    response_get = await async_client.get(
+        "/jenkins-failure-signatures/me", headers=get_headers(hashed_credentials)
+    )
+    response_get_log = await async_client.get(
+        "/jenkins-failure-signatures/me",
+        params={"jenkins_log_id": jenkins_log_ids[0]},
+        headers=get_headers(hashed_credentials),
+    )
+
+    # -> The newest examples are kept for the user, one log shows its own
+    assert response_get.json()[0]["examples"] == [
+        {"test_name": "test_upload", "jenkins_log_id": jenkins_log_ids[1]},
+        {"test_name": "test_remove", "jenkins_log_id": jenkins_log_ids[1]},
+    ]
+    assert response_get_log.json()[0]["examples"] == [
+        {"test_name": "test_login", "jenkins_log_id": jenkins_log_ids[0]},
+        {"test_name": "test_logout", "jenkins_log_id": jenkins_log_ids[0]},
+    ]
+
+    await async_client.delete(
+        f"/jenkins-logs/me/{jenkins_log_ids[1]}",
+        headers=get_headers(hashed_credentials),
+    )
+
+    response_get = await async_client.get(
+        "/jenkins-failure-signatures/me", headers=get_headers(hashed_credentials)
+    )
+
+    failure_signature = await jenkins_failure_signature_collection.find_one(
+        {"signature": response_get.json()[0]["signature"]}
+    )
+
+    assert response_get.json()[0]["count"] == 2
+    assert response_get.json()[0]["examples"] == response_get_log.json()[0]["examples"]
+    # -> Refilled examples are stored, the next read finds them on the cluster
+    assert failure_signature["examples"] == response_get.json()[0]["examples"]
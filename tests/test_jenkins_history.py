@@ -1,7 +1,7 @@
 import pytest
 from httpx import AsyncClient
 from fastapi import status
-from tests.ancillary import get_headers, swapped_in_half
+from tests.ancillary import get_headers, swapped_in_half, build_jenkins_log
 
 
 test_user_data = {
@@ -102,3 +102,41 @@ async def test_delete_jenkins_history_pan(async_client: AsyncClient):
         actual_response_msg
         == f"The Jenkins history with id '{jenkins_history_id}' is deleted successfully"
     )
+
+
+@pytest.mark.asyncio
+async def test_get_jenkins_histories_paginated(async_client: AsyncClient):
+    response_user = await async_client.post("/users", json=test_user_data)
+    hashed_credentials = response_user.json()["hashed_credentials"]
+
+    for test_name in ("test_first", "test_second", "test_third"):
+        await async_client.post(
+            "/jenkins-logs/me/upload",
+            content=build_jenkins_log([(test_name, "Pass", None)]),
+            headers=get_headers(hashed_credentials),
+        )
+
+    response_first = await async_client.get(
+        "/jenkins-histories/me",
+        params={"limit": 2},
+        headers=get_headers(hashed_credentials),
+    )
+    response_second = await async_client.get(
+        "/jenkins-histories/me",
+        params={"limit": 2, "after": response_first.headers["X-Next-Cursor"]},
+        headers=get_headers(hashed_credentials),
+    )
+
+    assert response_first.status_code == status.HTTP_200_OK
+    assert len(response_first.json()) == 2
+    assert len(response_second.json()) == 1
+    assert "X-Next-Cursor" not in response_second.headers
+
+    # -> Negative scenario
+    response_invalid = await async_client.get(
+        "/jenkins-histories/me",
+        params={"after": "invalid"},
+        headers=get_headers(hashed_credentials),
+    )
+
+    assert response_invalid.status_code == status.HTTP_400_BAD_REQUEST
@@ -1,7 +1,18 @@
+import json
+import asyncio
 import pytest
 from httpx import AsyncClient
 from fastapi import status
-from tests.ancillary import get_headers, swapped_in_half
+from app.crud import jenkins_log
+from app.utils.constants import LogStorage
+from app.utils.jobs import shielded_tasks
+from tests.ancillary import (
+    get_headers,
+    swapped_in_half,
+    build_jenkins_log,
+    get_open_log_response,
+    get_open_progressive_log_response,
+)
 
 
 test_user_data = {
@@ -11,6 +22,12 @@ test_user_data = {
     "is_active": True,
 }
 
+# -> A test block without a result marker cannot be parsed
+malformed_jenkins_log = (
+    b"Started by user admin\n12:00:01 Starting setUp\n"
+    b"12:00:01 \x1b[32mtid: test_login\x1b[0m\nFinished\n"
+)
+
 
 @pytest.mark.asyncio
 async def test_create_jenkins_log_positive(async_client: AsyncClient):
@@ -50,6 +67,376 @@ async def test_create_jenkins_log_negative(async_client: AsyncClient):
     assert response_create.status_code == status.HTTP_400_BAD_REQUEST
 
 
+@pytest.mark.asyncio
+async def test_create_jenkins_logs_batch(async_client: AsyncClient):
+    response_user = await async_client.post("/users", json=test_user_data)
+    hashed_credentials = response_user.json()["hashed_credentials"]
+
+    response_create = await async_client.post(
+        "/jenkins-logs/me/batch",
+        json={
+            "external_urls": [
+                "http://192.168.0.112:8000/jenkins/101/log-file-txt",
+                "http://192.168.0.112:8000/jenkins/000/log-file-txt",
+            ]
+        },
+        headers=get_headers(hashed_credentials),
+    )
+    jenkins_log_results = response_create.json()
+
+    assert response_create.status_code == status.HTTP_200_OK
+    assert [
+        jenkins_log_result["status_code"] for jenkins_log_result in jenkins_log_results
+    ] == [status.HTTP_200_OK, status.HTTP_400_BAD_REQUEST]
+    assert jenkins_log_results[0]["jenkins_log"]["chart_log_data"] == {
+        "passed": 66,
+        "failed": 7,
+        "errored": 11,
+        "skipped": 1,
+        "blocked": 0,
+    }
+
+    response_histories = await async_client.get(
+        "/jenkins-histories/me", headers=get_headers(hashed_credentials)
+    )
+
+    assert len(response_histories.json()) == 1
+
+
+@pytest.mark.asyncio
+async def test_stream_jenkins_log_events(async_client: AsyncClient):
+    response_user = await async_client.post("/users", json=test_user_data)
+    hashed_credentials = response_user.json()["hashed_credentials"]
+
+    events = []
+    async with async_client.stream(
+        "GET",
+        "/jenkins-logs/me/events",
+        params={"external_url": "http://192.168.0.112:8000/jenkins/101/log-file-txt"},
+        headers=get_headers(hashed_credentials),
+    ) as response_stream:
+        async for line in response_stream.aiter_lines():
+            if line.startswith("event: "):
+                event = line.removeprefix("event: ")
+            elif line.startswith("data: "):
+                events.append((event, json.loads(line.removeprefix("data: "))))
+
+    expected_chart_log_data = {
+        "passed": 66,
+        "failed": 7,
+        "errored": 11,
+        "skipped": 1,
+        "blocked": 0,
+    }
+
+    assert response_stream.status_code == status.HTTP_200_OK
+    assert len([event for event, _ in events if event == "failure"]) == 18
+    assert events[-2][0] == "progress"
+    assert events[-2][1]["tests_parsed"] == 85
+    assert events[-2][1]["chart_log_data"] == expected_chart_log_data
+    assert events[-1][0] == "complete"
+    assert events[-1][1]["chart_log_data"] == expected_chart_log_data
+
+
+@pytest.mark.asyncio
+async def test_stream_jenkins_log_events_malformed(
+    async_client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+):
+    external_url = "http://192.168.0.112:8000/jenkins/202/log-file-txt"
+    monkeypatch.setattr(
+        jenkins_log,
+        "open_log_response",
+        get_open_log_response({external_url: malformed_jenkins_log}),
+    )
+
+    response_user = await async_client.post("/users", json=test_user_data)
+    hashed_credentials = response_user.json()["hashed_credentials"]
+
+    async with async_client.stream(
+        "GET",
+        "/jenkins-logs/me/events",
+        params={"external_url": external_url},
+        headers=get_headers(hashed_credentials),
+    ) as response_stream:
+        lines = [line async for line in response_stream.aiter_lines() if line]
+
+    assert response_stream.status_code == status.HTTP_200_OK
+    assert lines[-2:] == [
+        "event: error",
+        'data: {"status_code": 500, "detail": "Unable to parse Jenkins log"}',
+    ]
+
+
+@pytest.mark.asyncio
+async def test_create_jenkins_log_cancelled_while_saving(
+    async_client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+):
+    external_url = "http://192.168.0.112:8000/jenkins/201/log-file-txt"
+    monkeypatch.setattr(
+        jenkins_log,
+        "open_log_response",
+        get_open_log_response(
+            {external_url: build_jenkins_log([("test_login", "Fail", "Error")])}
+        ),
+    )
+
+    saving = asyncio.Event()
+    save_jenkins_log = jenkins_log.save_jenkins_log
+
+    async def save_jenkins_log_after_cancel(*args: object) -> dict:
+        saving.set()
+        await asyncio.sleep(0.1)
+        return await save_jenkins_log(*args)
+
+    monkeypatch.setattr(jenkins_log, "save_jenkins_log", save_jenkins_log_after_cancel)
+
+    response_user = await async_client.post("/users", json=test_user_data)
+    hashed_credentials = response_user.json()["hashed_credentials"]
+
+    # -> Cancelling like a disconnected client once the log is being saved
+    task = asyncio.create_task(
+        jenkins_log.create_jenkins_log(
+            response_user.json()["id"], {"external_url": external_url}
+        )
+    )
+    await saving.wait()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    await asyncio.gather(*shielded_tasks)
+
+    response_histories = await async_client.get(
+        "/jenkins-histories/me", headers=get_headers(hashed_credentials)
+    )
+    response_rollup = await async_client.get(
+        "/jenkins-rollups/me", headers=get_headers(hashed_credentials)
+    )
+
+    assert len(response_histories.json()) == 1
+    assert response_rollup.json()["jenkins_logs"] == 1
+    assert response_rollup.json()["chart_log_data"]["failed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_create_jenkins_logs_batch_cancelled_while_saving(
+    async_client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+):
+    external_urls = [
+        "http://192.168.0.112:8000/jenkins/201/log-file-txt",
+        "http://192.168.0.112:8000/jenkins/202/log-file-txt",
+    ]
+    monkeypatch.setattr(
+        jenkins_log,
+        "open_log_response",
+        get_open_log_response(
+            {
+                external_url: build_jenkins_log([("test_login", "Fail", "Error")])
+                for external_url in external_urls
+            }
+        ),
+    )
+
+    saving = asyncio.Event()
+    save_jenkins_logs = jenkins_log.save_jenkins_logs
+
+    async def save_jenkins_logs_after_cancel(*args: object) -> list[dict]:
+        saving.set()
+        await asyncio.sleep(0.1)
+        return await save_jenkins_logs(*args)
+
+    monkeypatch.setattr(
+        jenkins_log, "save_jenkins_logs", save_jenkins_logs_after_cancel
+    )
+
+    response_user = await async_client.post("/users", json=test_user_data)
+    hashed_credentials = response_user.json()["hashed_credentials"]
+
+    # -> Cancelling like a disconnected client once the batch is being saved
+    task = asyncio.create_task(
+        jenkins_log.create_jenkins_logs(response_user.json()["id"], external_urls)
+    )
+    await saving.wait()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    await asyncio.gather(*shielded_tasks)
+
+    response_histories = await async_client.get(
+        "/jenkins-histories/me", headers=get_headers(hashed_credentials)
+    )
+    response_rollup = await async_client.get(
+        "/jenkins-rollups/me", headers=get_headers(hashed_credentials)
+    )
+
+    assert len(response_histories.json()) == len(external_urls)
+    assert response_rollup.json()["jenkins_logs"] == len(external_urls)
+
+
+@pytest.mark.asyncio
+async def test_upload_jenkins_log(async_client: AsyncClient):
+    response_user = await async_client.post("/users", json=test_user_data)
+    hashed_credentials = response_user.json()["hashed_credentials"]
+
+    response_upload = await async_client.post(
+        "/jenkins-logs/me/upload",
+        content=build_jenkins_log(
+            [
+                ("test_login", "Pass", None),
+                ("test_logout", "Fail", "AssertionError"),
+                ("test_upload", "Skipped", None),
+            ]
+        ),
+        headers=get_headers(hashed_credentials),
+    )
+
+    actual_chart_log_data = response_upload.json()["chart_log_data"]
+    expected_chart_log_data = {
+        "passed": 1,
+        "failed": 1,
+        "errored": 0,
+        "skipped": 1,
+        "blocked": 0,
+    }
+
+    assert response_upload.status_code == status.HTTP_200_OK
+    assert actual_chart_log_data == expected_chart_log_data
+
+
+@pytest.mark.asyncio
+async def test_get_jenkins_logs_ndjson(async_client: AsyncClient):
+    response_user = await async_client.post("/users", json=test_user_data)
+    hashed_credentials = response_user.json()["hashed_credentials"]
+
+    for test_name in ("test_first", "test_second"):
+        await async_client.post(
+            "/jenkins-logs/me/upload",
+            content=build_jenkins_log([(test_name, "Pass", None)]),
+            headers=get_headers(hashed_credentials),
+        )
+
+    response_get = await async_client.get(
+        "/jenkins-logs/me",
+        headers=dict(get_headers(hashed_credentials), Accept="application/x-ndjson"),
+    )
+    jenkins_logs = [json.loads(line) for line in response_get.text.splitlines()]
+
+    assert response_get.status_code == status.HTTP_200_OK
+    assert response_get.headers["content-type"] == "application/x-ndjson"
+    assert [
+        jenkins_log["parsed_log_data"][0]["test_name"] for jenkins_log in jenkins_logs
+    ] == ["test_first", "test_second"]
+
+
+@pytest.mark.asyncio
+async def test_get_jenkins_log_summaries(async_client: AsyncClient):
+    response_user = await async_client.post("/users", json=test_user_data)
+    hashed_credentials = response_user.json()["hashed_credentials"]
+
+    response_upload = await async_client.post(
+        "/jenkins-logs/me/upload",
+        content=build_jenkins_log(
+            [("test_login", "Pass", None), ("test_logout", "Fail", "AssertionError")]
+        ),
+        headers=get_headers(hashed_credentials),
+    )
+
+    response_get = await async_client.get(
+        "/jenkins-logs/me/summary", headers=get_headers(hashed_credentials)
+    )
+
+    assert response_get.status_code == status.HTTP_200_OK
+    assert response_get.json() == [
+        {
+            key: value
+            for key, value in response_upload.json().items()
+            if key != "parsed_log_data"
+        }
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_jenkins_log_diff(async_client: AsyncClient):
+    response_user = await async_client.post("/users", json=test_user_data)
+    hashed_credentials = response_user.json()["hashed_credentials"]
+
+    jenkins_log_ids = []
+    for test_results in (
+        [
+            ("test_login", "Pass", None),
+            ("test_logout", "Fail", "AssertionError"),
+            ("test_upload", "Pass", None),
+            ("test_download", "Pass", None),
+            ("test_delete", "Error", "KeyError"),
+            ("test_search", "Pass", None),
+            ("test_rename", "Fail", "KeyError"),
+        ],
+        [
+            ("test_login", "Fail", "AssertionError"),
+            ("test_logout", "Pass", None),
+            ("test_upload", "Pass", None),
+            ("test_share", "Pass", None),
+            ("test_delete", "Error", "TimeoutError"),
+            ("test_search", "Skipped", None),
+            ("test_rename", "Error", "KeyError"),
+        ],
+    ):
+        response_upload = await async_client.post(
+            "/jenkins-logs/me/upload",
+            content=build_jenkins_log(test_results),
+            headers=get_headers(hashed_credentials),
+        )
+        jenkins_log_ids.append(response_upload.json()["id"])
+
+    response_diff = await async_client.get(
+        f"/jenkins-logs/me/{jenkins_log_ids[0]}/diff/{jenkins_log_ids[1]}",
+        headers=get_headers(hashed_credentials),
+    )
+    jenkins_log_diff = response_diff.json()
+
+    assert response_diff.status_code == status.HTTP_200_OK
+    assert {
+        kind: [jenkins_test["test_name"] for jenkins_test in jenkins_tests]
+        for kind, jenkins_tests in jenkins_log_diff.items()
+        if isinstance(jenkins_tests, list)
+    } == {
+        "newly_failing": ["test_login"],
+        "newly_passing": ["test_logout"],
+        "added": ["test_share"],
+        "removed": ["test_download"],
+        "changed_reasons": ["test_delete"],
+        "changed_results": ["test_rename", "test_search"],
+    }
+    assert jenkins_log_diff["changed_reasons"][0]["head_test_reason"] == "TimeoutError"
+
+    # -> Negative scenario
+    response_diff = await async_client.get(
+        f"/jenkins-logs/me/{jenkins_log_ids[0]}/diff/000000000000000000000000",
+        headers=get_headers(hashed_credentials),
+    )
+
+    assert response_diff.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.asyncio
+async def test_get_jenkins_log_cache(async_client: AsyncClient):
+    response_user = await async_client.post("/users", json=test_user_data)
+    hashed_credentials = response_user.json()["hashed_credentials"]
+
+    for _ in range(2):
+        await async_client.post(
+            "/jenkins-logs/me",
+            json={"external_url": "http://192.168.0.112:8000/jenkins/101/log-file-txt"},
+            headers=get_headers(hashed_credentials),
+        )
+
+    response_get = await async_client.get(
+        "/jenkins-logs/cache", headers=get_headers(hashed_credentials)
+    )
+
+    assert response_get.status_code == status.HTTP_200_OK
+    assert response_get.json()["hits"] >= 1
+
+
 @pytest.mark.asyncio
 async def test_get_jenkins_logs(async_client: AsyncClient):
     response_user = await async_client.post("/users", json=test_user_data)
@@ -152,3 +539,183 @@ async def test_delete_jenkins_log_negative(async_client: AsyncClient):
     )
 
     assert response_delete.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.asyncio
+async def test_ingest_progressive_jenkins_log_complete(
+    async_client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+):
+    external_url = "http://192.168.0.112:8000/jenkins/job/101"
+    monkeypatch.setattr(LogStorage, "GRIDFS_THRESHOLD", 0)
+    monkeypatch.setattr(
+        jenkins_log,
+        "open_log_response",
+        get_open_log_response(
+            {
+                external_url: build_jenkins_log(
+                    [("test_login", "Pass", None), ("test_logout", "Fail", "Error")]
+                )
+            }
+        ),
+    )
+
+    response_user = await async_client.post("/users", json=test_user_data)
+    hashed_credentials = response_user.json()["hashed_credentials"]
+
+    # -> The second poll finds the finished build stored in GridFS
+    responses_ingest = [
+        await async_client.post(
+            "/jenkins-logs/me/progressive",
+            json={"external_url": external_url},
+            headers=get_headers(hashed_credentials),
+        )
+        for _ in range(2)
+    ]
+    response_get = await async_client.get(
+        f"/jenkins-logs/me/{responses_ingest[0].json()['id']}",
+        headers=get_headers(hashed_credentials),
+    )
+
+    assert [response.status_code for response in responses_ingest] == [
+        status.HTTP_200_OK,
+        status.HTTP_200_OK,
+    ]
+    assert responses_ingest[0].json()["is_complete"] is True
+    assert responses_ingest[1].json() == dict(
+        responses_ingest[0].json(), parsed_log_data=[]
+    )
+    assert response_get.json()["parsed_log_data"] == (
+        responses_ingest[0].json()["parsed_log_data"]
+    )
+
+
+@pytest.mark.asyncio
+async def test_ingest_progressive_jenkins_log_polls(
+    async_client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+):
+    external_url = "http://192.168.0.112:8000/jenkins/job/102"
+    test_names = [f"test_case_{index}" for index in range(6)]
+    monkeypatch.setattr(
+        jenkins_log,
+        "open_log_response",
+        get_open_progressive_log_response(
+            build_jenkins_log(
+                [(test_name, "Fail", "KeyError: 42") for test_name in test_names]
+            ),
+            poll_size=400,
+        ),
+    )
+
+    response_user = await async_client.post("/users", json=test_user_data)
+    hashed_credentials = response_user.json()["hashed_credentials"]
+
+    # -> Every poll returns only the tests appended since the previous one
+    polled_test_names = []
+    while True:
+        response_ingest = await async_client.post(
+            "/jenkins-logs/me/progressive",
+            json={"external_url": external_url},
+            headers=get_headers(hashed_credentials),
+        )
+        assert response_ingest.status_code == status.HTTP_200_OK
+        polled_test_names.append(
+            [test["test_name"] for test in response_ingest.json()["parsed_log_data"]]
+        )
+        if response_ingest.json()["is_complete"]:
+            break
+
+        response_get = await async_client.get(
+            f"/jenkins-logs/me/{response_ingest.json()['id']}",
+            headers=get_headers(hashed_credentials),
+        )
+        assert [
+            test["test_name"] for test in response_get.json()["parsed_log_data"]
+        ] == [test_name for test_names in polled_test_names for test_name in test_names]
+
+    response_get = await async_client.get(
+        f"/jenkins-logs/me/{response_ingest.json()['id']}",
+        headers=get_headers(hashed_credentials),
+    )
+    response_rollup = await async_client.get(
+        "/jenkins-rollups/me", headers=get_headers(hashed_credentials)
+    )
+    response_histories = await async_client.get(
+        "/jenkins-histories/me", headers=get_headers(hashed_credentials)
+    )
+
+    assert len(polled_test_names) > 2
+    assert sum(polled_test_names, []) == test_names
+    assert response_ingest.json()["chart_log_data"]["failed"] == len(test_names)
+    assert [test["test_name"] for test in response_get.json()["parsed_log_data"]] == (
+        test_names
+    )
+    assert response_rollup.json()["jenkins_logs"] == 1
+    assert response_rollup.json()["chart_log_data"]["failed"] == len(test_names)
+    assert len(response_histories.json()) == 1
+
+
+@pytest.mark.asyncio
+async def test_ingest_progressive_jenkins_log_negative(
+    async_client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(jenkins_log, "open_log_response", get_open_log_response({}))
+
+    response_user = await async_client.post("/users", json=test_user_data)
+    hashed_credentials = response_user.json()["hashed_credentials"]
+
+    response_ingest = await async_client.post(
+        "/jenkins-logs/me/progressive",
+        json={"external_url": "http://192.168.0.112:8000/jenkins/job/000"},
+        headers=get_headers(hashed_credentials),
+    )
+    response_summaries = await async_client.get(
+        "/jenkins-logs/me/summary", headers=get_headers(hashed_credentials)
+    )
+    response_rollup = await async_client.get(
+        "/jenkins-rollups/me", headers=get_headers(hashed_credentials)
+    )
+
+    assert response_ingest.status_code == status.HTTP_400_BAD_REQUEST
+    assert response_summaries.json() == []
+    assert response_rollup.json()["jenkins_logs"] == 0
+
+
+@pytest.mark.asyncio
+async def test_create_jenkins_logs_batch_malformed(
+    async_client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+):
+    external_urls = [
+        "http://192.168.0.112:8000/jenkins/201/log-file-txt",
+        "http://192.168.0.112:8000/jenkins/202/log-file-txt",
+        "http://192.168.0.112:8000/jenkins/000/log-file-txt",
+    ]
+    monkeypatch.setattr(
+        jenkins_log,
+        "open_log_response",
+        get_open_log_response(
+            {
+                external_urls[0]: build_jenkins_log([("test_login", "Pass", None)]),
+                external_urls[1]: malformed_jenkins_log,
+            }
+        ),
+    )
+
+    response_user = await async_client.post("/users", json=test_user_data)
+    hashed_credentials = response_user.json()["hashed_credentials"]
+
+    response_create = await async_client.post(
+        "/jenkins-logs/me/batch",
+        json={"external_urls": external_urls},
+        headers=get_headers(hashed_credentials),
+    )
+
+    assert response_create.status_code == status.HTTP_200_OK
+    assert [
+        jenkins_log_result["status_code"]
+        for jenkins_log_result in response_create.json()
+    ] == [
+        status.HTTP_200_OK,
+        status.HTTP_500_INTERNAL_SERVER_ERROR,
+        status.HTTP_400_BAD_REQUEST,
+    ]
+    assert response_create.json()[0]["jenkins_log"]["chart_log_data"]["passed"] == 1
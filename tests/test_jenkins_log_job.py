@@ -0,0 +1,201 @@
+import asyncio
+import pytest
+from datetime import datetime, timedelta, timezone
+from httpx import AsyncClient
+from fastapi import status
+from app.crud import jenkins_log_job
+from app.dependencies import jenkins_log_job_collection
+from app.utils.jobs import shutdown_background_jobs
+from tests.ancillary import get_headers
+
+
+test_user_data = {
+    "username": "juser",
+    "email": "juser@gmail.com",
+    "password": "Juser123_",
+    "is_active": True,
+}
+
+
+async def wait_for_jenkins_log_job(
+    async_client: AsyncClient, location: str, hashed_credentials: str
+) -> dict:
+    while True:
+        response_get = await async_client.get(
+            location, headers=get_headers(hashed_credentials)
+        )
+        if response_get.json()["status"] in ("completed", "failed"):
+            return response_get.json()
+        await asyncio.sleep(0.1)
+
+
+@pytest.mark.asyncio
+async def test_create_jenkins_log_job_positive(async_client: AsyncClient):
+    response_user = await async_client.post("/users", json=test_user_data)
+    hashed_credentials = response_user.json()["hashed_credentials"]
+
+    response_create = await async_client.post(
+        "/jenkins-logs/me",
+        params={"background": True},
+        json={"external_url": "http://192.168.0.112:8000/jenkins/101/log-file-txt"},
+        headers=get_headers(hashed_credentials),
+    )
+
+    assert response_create.status_code == status.HTTP_202_ACCEPTED
+    assert response_create.json()["status"] in ("queued", "running")
+
+    jenkins_log_job = await asyncio.wait_for(
+        wait_for_jenkins_log_job(
+            async_client, response_create.headers["Location"], hashed_credentials
+        ),
+        timeout=60,
+    )
+
+    assert jenkins_log_job["status"] == "completed"
+
+    response_get = await async_client.get(
+        f"/jenkins-logs/me/{jenkins_log_job['jenkins_log_id']}",
+        headers=get_headers(hashed_credentials),
+    )
+
+    assert response_get.status_code == status.HTTP_200_OK
+
+
+@pytest.mark.asyncio
+async def test_create_jenkins_log_job_negative(async_client: AsyncClient):
+    response_user = await async_client.post("/users", json=test_user_data)
+    hashed_credentials = response_user.json()["hashed_credentials"]
+
+    response_create = await async_client.post(
+        "/jenkins-logs/me",
+        params={"background": True},
+        json={"external_url": "http://192.168.0.112:8000/jenkins/000/log-file-txt"},
+        headers=get_headers(hashed_credentials),
+    )
+
+    jenkins_log_job = await asyncio.wait_for(
+        wait_for_jenkins_log_job(
+            async_client, response_create.headers["Location"], hashed_credentials
+        ),
+        timeout=60,
+    )
+
+    assert jenkins_log_job["status"] == "failed"
+    assert jenkins_log_job["status_code"] == status.HTTP_400_BAD_REQUEST
+
+    response_get = await async_client.get(
+        "/jenkins-log-jobs/me/000000000000000000000000",
+        headers=get_headers(hashed_credentials),
+    )
+
+    assert response_get.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.asyncio
+async def test_jenkins_log_job_cancelled_on_shutdown(
+    async_client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+):
+    running = asyncio.Event()
+
+    async def create_jenkins_log_forever(*_: object) -> dict:
+        running.set()
+        await asyncio.sleep(60)
+
+    monkeypatch.setattr(
+        jenkins_log_job, "create_jenkins_log", create_jenkins_log_forever
+    )
+
+    response_user = await async_client.post("/users", json=test_user_data)
+    hashed_credentials = response_user.json()["hashed_credentials"]
+
+    response_create = await async_client.post(
+        "/jenkins-logs/me",
+        params={"background": True},
+        json={"external_url": "http://192.168.0.112:8000/jenkins/101/log-file-txt"},
+        headers=get_headers(hashed_credentials),
+    )
+    await asyncio.wait_for(running.wait(), timeout=10)
+    await shutdown_background_jobs()
+
+    response_get = await async_client.get(
+        response_create.headers["Location"], headers=get_headers(hashed_credentials)
+    )
+
+    assert response_get.json()["status"] == "failed"
+    assert response_get.json()["status_code"] == status.HTTP_503_SERVICE_UNAVAILABLE
+
+
+@pytest.mark.asyncio
+async def test_renew_jenkins_log_job_leases(
+    async_client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+):
+    # -> The jobs are left queued, as if their instances had not run them yet
+    monkeypatch.setattr(jenkins_log_job, "run_in_background", lambda job: job.close())
+
+    response_user = await async_client.post("/users", json=test_user_data)
+    hashed_credentials = response_user.json()["hashed_credentials"]
+
+    locations = {}
+    for job_instance_id in ("stopped", "alive", jenkins_log_job.instance_id):
+        monkeypatch.setattr(jenkins_log_job, "instance_id", job_instance_id)
+        response_create = await async_client.post(
+            "/jenkins-logs/me",
+            params={"background": True},
+            json={"external_url": "http://192.168.0.112:8000/jenkins/101/log-file-txt"},
+            headers=get_headers(hashed_credentials),
+        )
+        locations[job_instance_id] = response_create.headers["Location"]
+
+    # -> Only the lease of the stopped instance has expired, the other
+    #    instance is still renewing its own
+    await jenkins_log_job_collection.update_one(
+        {"instance_id": "stopped"},
+        {"$set": {"lease_expires": datetime.now(timezone.utc) - timedelta(1)}},
+    )
+    await jenkins_log_job.renew_jenkins_log_job_leases()
+
+    responses_get = {
+        job_instance_id: await async_client.get(
+            location, headers=get_headers(hashed_credentials)
+        )
+        for job_instance_id, location in locations.items()
+    }
+
+    assert responses_get["stopped"].json()["status"] == "failed"
+    assert responses_get["stopped"].json()["status_code"] == (
+        status.HTTP_503_SERVICE_UNAVAILABLE
+    )
+    assert responses_get["alive"].json()["status"] == "queued"
+    assert responses_get[jenkins_log_job.instance_id].json()["status"] == "queued"
+
+
+@pytest.mark.asyncio
+async def test_fail_instance_jenkins_log_jobs(
+    async_client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(jenkins_log_job, "run_in_background", lambda job: job.close())
+
+    response_user = await async_client.post("/users", json=test_user_data)
+    hashed_credentials = response_user.json()["hashed_credentials"]
+
+    locations = {}
+    for job_instance_id in ("alive", jenkins_log_job.instance_id):
+        monkeypatch.setattr(jenkins_log_job, "instance_id", job_instance_id)
+        response_create = await async_client.post(
+            "/jenkins-logs/me",
+            params={"background": True},
+            json={"external_url": "http://192.168.0.112:8000/jenkins/101/log-file-txt"},
+            headers=get_headers(hashed_credentials),
+        )
+        locations[job_instance_id] = response_create.headers["Location"]
+    await jenkins_log_job.fail_instance_jenkins_log_jobs()
+
+    responses_get = {
+        job_instance_id: await async_client.get(
+            location, headers=get_headers(hashed_credentials)
+        )
+        for job_instance_id, location in locations.items()
+    }
+
+    assert responses_get["alive"].json()["status"] == "queued"
+    assert responses_get[jenkins_log_job.instance_id].json()["status"] == "failed"
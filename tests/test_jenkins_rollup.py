@@ -0,0 +1,76 @@
+import pytest
+from httpx import AsyncClient
+from fastapi import status
+from app.crud.jenkins_rollup import rebuild_jenkins_rollups
+from app.dependencies import jenkins_rollup_collection
+from tests.ancillary import get_headers, build_jenkins_log
+
+
+test_user_data = {
+    "username": "ouser",
+    "email": "ouser@gmail.com",
+    "password": "Ouser123_",
+    "is_active": True,
+}
+
+
+@pytest.mark.asyncio
+async def test_get_jenkins_rollup(async_client: AsyncClient):
+    response_user = await async_client.post("/users", json=test_user_data)
+    hashed_credentials = response_user.json()["hashed_credentials"]
+
+    jenkins_log_ids = []
+    for test_results in (
+        [("test_login", "Pass", None), ("test_logout", "Fail", "AssertionError")],
+        [("test_login", "Error", "KeyError"), ("test_logout", "Pass", None)],
+    ):
+        response_upload = await async_client.post(
+            "/jenkins-logs/me/upload",
+            content=build_jenkins_log(test_results),
+            headers=get_headers(hashed_credentials),
+        )
+        jenkins_log_ids.append(response_upload.json()["id"])
+
+    await async_client.delete(
+        f"/jenkins-logs/me/{jenkins_log_ids[0]}",
+        headers=get_headers(hashed_credentials),
+    )
+
+    response_get = await async_client.get(
+        "/jenkins-rollups/me", headers=get_headers(hashed_credentials)
+    )
+    expected_chart_log_data = {
+        "passed": 1,
+        "failed": 0,
+        "errored": 1,
+        "skipped": 0,
+        "blocked": 0,
+    }
+
+    assert response_get.status_code == status.HTTP_200_OK
+    assert response_get.json()["chart_log_data"] == expected_chart_log_data
+    assert response_get.json()["jenkins_logs"] == 1
+    assert response_get.json()["daily"][0]["chart_log_data"] == expected_chart_log_data
+
+    # -> A bucket no log belongs to anymore is deleted by the rebuild
+    await jenkins_rollup_collection.insert_one(
+        dict(
+            user_id=response_user.json()["id"],
+            day="2000-01-01",
+            chart_log_data=expected_chart_log_data,
+            jenkins_logs=1,
+        )
+    )
+    response_rebuild = await async_client.post(
+        "/jenkins-rollups/me/rebuild", headers=get_headers(hashed_credentials)
+    )
+
+    assert response_rebuild.status_code == status.HTTP_200_OK
+    assert response_rebuild.json() == response_get.json()
+
+    await rebuild_jenkins_rollups()
+    response_get_rebuilt = await async_client.get(
+        "/jenkins-rollups/me", headers=get_headers(hashed_credentials)
+    )
+
+    assert response_get_rebuilt.json() == response_get.json()
@@ -0,0 +1,134 @@
+import pytest
+from httpx import AsyncClient
+from fastapi import status
+from app.dependencies import create_indexes
+from tests.ancillary import get_headers, build_jenkins_log
+
+
+test_user_data = {
+    "username": "tuser",
+    "email": "tuser@gmail.com",
+    "password": "Tuser123_",
+    "is_active": True,
+}
+
+
+@pytest.mark.asyncio
+async def test_get_jenkins_tests(async_client: AsyncClient):
+    response_user = await async_client.post("/users", json=test_user_data)
+    hashed_credentials = response_user.json()["hashed_credentials"]
+
+    response_upload = await async_client.post(
+        "/jenkins-logs/me/upload",
+        content=build_jenkins_log(
+            [
+                ("test_login", "Pass", None),
+                ("test_logout", "Fail", "AssertionError"),
+            ]
+        ),
+        headers=get_headers(hashed_credentials),
+    )
+    jenkins_log_id = response_upload.json()["id"]
+
+    response_get = await async_client.get(
+        "/jenkins-tests/me",
+        params={"test_name": "test_logout", "test_result": "Fail"},
+        headers=get_headers(hashed_credentials),
+    )
+
+    assert response_get.status_code == status.HTTP_200_OK
+    assert [
+        (test["test_name"], test["test_result"], test["jenkins_log_id"])
+        for test in response_get.json()
+    ] == [("test_logout", "Fail", jenkins_log_id)]
+
+
+@pytest.mark.asyncio
+async def test_get_flaky_jenkins_tests(async_client: AsyncClient):
+    response_user = await async_client.post("/users", json=test_user_data)
+    hashed_credentials = response_user.json()["hashed_credentials"]
+
+    for test_login, test_logout, test_upload in (
+        ("Pass", "Fail", "Pass"),
+        ("Fail", "Fail", "Pass"),
+        ("Pass", "Pass", "Pass"),
+    ):
+        await async_client.post(
+            "/jenkins-logs/me/upload",
+            content=build_jenkins_log(
+                [
+                    (test_name, test_result, test_result == "Fail" and "Error")
+                    for test_name, test_result in (
+                        ("test_login", test_login),
+                        ("test_logout", test_logout),
+                        ("test_upload", test_upload),
+                    )
+                ]
+            ),
+            headers=get_headers(hashed_credentials),
+        )
+
+    response_get = await async_client.get(
+        "/jenkins-tests/me/flaky", headers=get_headers(hashed_credentials)
+    )
+
+    assert response_get.status_code == status.HTTP_200_OK
+    assert response_get.json() == [
+        {
+            "test_name": "test_login",
+            "runs": 3,
+            "failures": 1,
+            "flips": 2,
+            "failure_rate": 1 / 3,
+            "flip_rate": 1.0,
+        },
+        {
+            "test_name": "test_logout",
+            "runs": 3,
+            "failures": 2,
+            "flips": 1,
+            "failure_rate": 2 / 3,
+            "flip_rate": 0.5,
+        },
+    ]
+
+
+@pytest.mark.asyncio
+async def test_search_jenkins_tests(async_client: AsyncClient):
+    await create_indexes()
+
+    response_user = await async_client.post("/users", json=test_user_data)
+    hashed_credentials = response_user.json()["hashed_credentials"]
+
+    await async_client.post(
+        "/jenkins-logs/me/upload",
+        content=build_jenkins_log(
+            [
+                ("test_login", "Fail", "ConnectionRefusedError: Connection refused"),
+                ("test_logout", "Fail", "AssertionError: 1 != 2"),
+                ("test_upload", "Pass", None),
+            ]
+        ),
+        headers=get_headers(hashed_credentials),
+    )
+
+    response_search = await async_client.get(
+        "/jenkins-tests/me/search",
+        params={"search": "refused"},
+        headers=get_headers(hashed_credentials),
+    )
+
+    assert response_search.status_code == status.HTTP_200_OK
+    assert [
+        (jenkins_test["test_name"], jenkins_test["snippet"])
+        for jenkins_test in response_search.json()
+    ] == [("test_login", "ConnectionRefusedError: Connection refused")]
+
+    # -> Negative scenario
+    response_search = await async_client.get(
+        "/jenkins-tests/me/search",
+        params={"search": "refused", "test_result": "Error"},
+        headers=get_headers(hashed_credentials),
+    )
+
+    assert response_search.json() == []
@@ -0,0 +1,229 @@
+import re
+import pytest
+from typing import Iterator
+from app.utils import executor
+from app.utils.codec import encode_parsed_log_data, decode_parsed_log_data
+from app.utils.constants import TestResult, RegexString, LogParser
+from app.utils.parser import (
+    ParsedLogColumns,
+    LogStreamSplitter,
+    normalize_failure_reason,
+    parse_log_segment,
+    shard_log_segment,
+    TEST_SEPARATOR,
+    TEST_RESULT_CODES,
+)
+from tests.ancillary import build_jenkins_log
+
+
+test_log_data = [
+    ("test_login", TestResult.PASS, None),
+    ("test_logout", TestResult.FAIL, "Traceback\n12:00:02 AssertionError: 1 != 2"),
+    ("test_upload_ünïcode", TestResult.ERROR, "ConnectionError: refused\non 10.0.0.1"),
+    ("test_digits", TestResult.FAIL, "Timeout at ١٢:٣٤:٥٦\n12:00:09 after 30s"),
+    ("test_skipped", TestResult.SKIPPED, None),
+    ("test_blocked", TestResult.BLOCKED, None),
+    ("test_last", TestResult.PASS, None),
+]
+
+
+def get_reference_log_results(content: bytes) -> list[tuple[str, str, str]]:
+    log_results = []
+
+    for content_data in content.decode("utf-8").split(RegexString.TEST_SEPARATOR)[1:]:
+        test_name = re.search(r"tid: (.*)\u001b", content_data).group(1)
+        test_result = re.search(
+            r"res: (Pass|Fail|Error|Blocked|Skipped)\u001b", content_data
+        ).group(1)
+
+        if test_result in (TestResult.FAIL, TestResult.ERROR):
+            test_reason = re.sub(
+                r"\n|\d{2}:\d{2}:\d{2}",
+                "",
+                re.search(RegexString.TEST_FAIL, content_data, re.DOTALL).group(1),
+            )
+        else:
+            test_reason = f"There are no reason (res: {test_result})"
+
+        log_results.append((test_name, test_result, test_reason))
+
+    return log_results
+
+
+def to_chunks(content: bytes, chunk_size: int) -> list[bytes]:
+    return [content[i : i + chunk_size] for i in range(0, len(content), chunk_size)]
+
+
+def iter_log_results(chunks: list[bytes]) -> Iterator[tuple[str, str, str]]:
+    splitter = LogStreamSplitter()
+    segments = [splitter.feed(chunk) for chunk in chunks] + [splitter.close()]
+
+    for segment in segments:
+        if segment is not None:
+            yield from parse_log_segment(segment)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 13, 64, 1024 * 1024])
+def test_iter_log_results_chunked(chunk_size: int):
+    content = build_jenkins_log(test_log_data)
+
+    actual_log_results = list(iter_log_results(to_chunks(content, chunk_size)))
+
+    assert actual_log_results == get_reference_log_results(content)
+    assert len(actual_log_results) == len(test_log_data)
+
+
+def test_iter_log_results_without_tests():
+    content = b"Started by user admin\nFinished: SUCCESS\n"
+
+    assert list(iter_log_results(to_chunks(content, 4))) == []
+
+
+def test_parse_log_segment_memoryview():
+    content = build_jenkins_log(test_log_data)
+    segment_start = content.index(TEST_SEPARATOR) + len(TEST_SEPARATOR)
+
+    actual_log_results = list(parse_log_segment(memoryview(content), segment_start))
+
+    assert actual_log_results == get_reference_log_results(content)
+
+
+def test_log_stream_splitter_batch_size():
+    content = build_jenkins_log(test_log_data)
+    splitter = LogStreamSplitter(batch_size=300)
+
+    segments = [splitter.feed(chunk) for chunk in to_chunks(content, 64)]
+    segments = [segment for segment in (*segments, splitter.close()) if segment]
+
+    assert all(len(segment) >= 300 for segment in segments[:-1])
+    assert [
+        test_data for segment in segments for test_data in parse_log_segment(segment)
+    ] == get_reference_log_results(content)
+
+
+@pytest.mark.parametrize("poll_size", [10, 100, 333])
+def test_log_stream_splitter_restored(poll_size: int):
+    content = build_jenkins_log(test_log_data)
+    tail, is_header, segments = b"", True, []
+
+    for poll in to_chunks(content, poll_size):
+        splitter = LogStreamSplitter(batch_size=50, tail=tail, is_header=is_header)
+        segments.append(splitter.feed(poll[: poll_size // 2]))
+        segments.append(splitter.feed(poll[poll_size // 2 :]))
+        segments.append(splitter.flush())
+        tail, is_header = splitter.tail, splitter.is_header
+
+    segments.append(LogStreamSplitter(tail=tail, is_header=is_header).close())
+
+    assert [
+        test_data
+        for segment in segments
+        if segment is not None
+        for test_data in parse_log_segment(segment)
+    ] == get_reference_log_results(content)
+
+
+@pytest.mark.parametrize("shards", [1, 2, 3, 5, 50])
+def test_shard_log_segment(shards: int):
+    content = build_jenkins_log(test_log_data)
+    segment = content[content.index(TEST_SEPARATOR) + len(TEST_SEPARATOR) :]
+
+    ranges = shard_log_segment(segment, shards)
+
+    assert 1 <= len(ranges) <= shards
+    assert [
+        test_data
+        for shard_start, shard_end in ranges
+        for test_data in parse_log_segment(segment, shard_start, shard_end)
+    ] == get_reference_log_results(content)
+
+
+@pytest.mark.asyncio
+async def test_run_parse_log_segment_offloaded(monkeypatch: pytest.MonkeyPatch):
+    content = build_jenkins_log(test_log_data)
+    segment = content[content.index(TEST_SEPARATOR) + len(TEST_SEPARATOR) :]
+
+    monkeypatch.setattr(LogParser, "OFFLOAD_THRESHOLD", 0)
+    monkeypatch.setattr(LogParser, "MAX_WORKERS", 2)
+    monkeypatch.setattr(LogParser, "SHARDS", 3)
+
+    executor.start_parser_executor()
+    try:
+        actual_log_results = list(await executor.run_parse_log_segment(segment))
+    finally:
+        executor.shutdown_parser_executor()
+
+    assert actual_log_results == get_reference_log_results(content)
+
+
+def test_parsed_log_columns():
+    content = build_jenkins_log(test_log_data)
+    segment = content[content.index(TEST_SEPARATOR) + len(TEST_SEPARATOR) :]
+
+    parsed_log_columns = parse_log_segment(segment)
+    documents = parsed_log_columns.to_documents()
+
+    assert [tuple(document.values()) for document in documents] == (
+        get_reference_log_results(content)
+    )
+    assert parsed_log_columns.get_chart_log_data() == {
+        "passed": 2,
+        "failed": 2,
+        "errored": 1,
+        "skipped": 1,
+        "blocked": 1,
+    }
+    assert list(ParsedLogColumns.from_documents(documents)) == list(parsed_log_columns)
+
+
+def test_parsed_log_data_codec():
+    content = build_jenkins_log(test_log_data * 100)
+    segment = content[content.index(TEST_SEPARATOR) + len(TEST_SEPARATOR) :]
+    parsed_log_columns = parse_log_segment(segment)
+
+    parsed_log_data_encoded = encode_parsed_log_data(parsed_log_columns)
+
+    assert list(decode_parsed_log_data(parsed_log_data_encoded)) == list(
+        parsed_log_columns
+    )
+    assert len(parsed_log_data_encoded) < len(segment) // 10
+
+
+@pytest.mark.parametrize(
+    "failure_reason, normalized_failure_reason",
+    [
+        ("Timeout after 30s on 10.0.0.12:8080", "Timeout after <n>s on <address>"),
+        ("Object at 0x7f3a2b1c was freed", "Object at <address> was freed"),
+        ("Build 5f3e2a1b9c8d7e6f missing", "Build <id> missing"),
+        (
+            "Request 123e4567-e89b-12d3-a456-426614174000  failed",
+            "Request <id> failed",
+        ),
+        ("AssertionError: deadbeef != 2", "AssertionError: deadbeef != <n>"),
+    ],
+)
+def test_normalize_failure_reason(failure_reason: str, normalized_failure_reason: str):
+    assert normalize_failure_reason(failure_reason) == normalized_failure_reason
+
+
+def test_parsed_log_failure_signatures():
+    parsed_log_columns = ParsedLogColumns()
+    for test_name, test_result, test_reason in [
+        ("test_login", TestResult.FAIL, "Timeout after 30s on 10.0.0.1"),
+        ("test_logout", TestResult.ERROR, "Timeout after 45s on 10.0.0.2"),
+        ("test_upload", TestResult.FAIL, "AssertionError: 1 != 2"),
+        ("test_skipped", TestResult.SKIPPED, "Skipped after 30s on 10.0.0.1"),
+    ]:
+        parsed_log_columns.append(
+            test_name, TEST_RESULT_CODES.index(test_result), test_reason
+        )
+
+    failure_signatures = parsed_log_columns.get_failure_signatures()
+
+    assert sorted(
+        (failure_signature["failure_reason"], failure_signature["test_names"])
+        for failure_signature in failure_signatures.values()
+    ) == [
+        ("AssertionError: <n> != <n>", ["test_upload"]),
+        ("Timeout after <n>s on <address>", ["test_login", "test_logout"]),
+    ]
@@ -0,0 +1,114 @@
+import pytest
+from httpx import AsyncClient
+from fastapi import status
+from app.utils.monitoring import count_commands
+from tests.ancillary import get_headers, build_jenkins_log
+
+
+test_user_data = {
+    "username": "ruser",
+    "email": "ruser@gmail.com",
+    "password": "Ruser123_",
+    "is_active": True,
+}
+
+updated_user_data = {
+    "username": "ruser_updated",
+    "email": "ruser_updated@gmail.com",
+    "password": "Ruser123_updated",
+    "is_active": True,
+}
+
+
+@pytest.mark.asyncio
+async def test_user_round_trips(async_client: AsyncClient):
+    with count_commands() as commands:
+        response_create = await async_client.post("/users", json=test_user_data)
+    hashed_credentials = response_create.json()["hashed_credentials"]
+
+    assert response_create.status_code == status.HTTP_200_OK
+    assert commands == ["find", "insert"]
+
+    with count_commands() as commands:
+        response_get = await async_client.get(
+            "/users/me", headers=get_headers(hashed_credentials)
+        )
+
+    assert response_get.status_code == status.HTTP_200_OK
+    assert commands == ["find", "find"]
+
+    with count_commands() as commands:
+        response_update = await async_client.put(
+            "/users/me",
+            json=updated_user_data,
+            headers=get_headers(hashed_credentials),
+        )
+    hashed_credentials = response_update.json()["hashed_credentials"]
+
+    assert response_update.status_code == status.HTTP_200_OK
+    assert commands == ["find", "find", "findAndModify"]
+
+    with count_commands() as commands:
+        response_delete = await async_client.delete(
+            "/users/me", headers=get_headers(hashed_credentials)
+        )
+
+    assert response_delete.status_code == status.HTTP_200_OK
+    assert commands == ["find", "delete"]
+
+
+@pytest.mark.asyncio
+async def test_jenkins_log_round_trips(async_client: AsyncClient):
+    response_user = await async_client.post("/users", json=test_user_data)
+    hashed_credentials = response_user.json()["hashed_credentials"]
+
+    with count_commands() as commands:
+        response_upload = await async_client.post(
+            "/jenkins-logs/me/upload",
+            content=build_jenkins_log(
+                [("test_login", "Pass", None), ("test_logout", "Fail", "Error")]
+            ),
+            headers=get_headers(hashed_credentials),
+        )
+    jenkins_log_id = response_upload.json()["id"]
+
+    assert response_upload.status_code == status.HTTP_200_OK
+    assert commands == ["find", "insert", "insert", "update", "update", "insert"]
+
+    with count_commands() as commands:
+        response_delete = await async_client.delete(
+            f"/jenkins-logs/me/{jenkins_log_id}",
+            headers=get_headers(hashed_credentials),
+        )
+
+    assert response_delete.status_code == status.HTTP_200_OK
+    assert commands == [
+        "find",
+        "findAndModify",
+        "update",
+        "update",
+        "delete",
+        "delete",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_session_token_round_trips(async_client: AsyncClient):
+    await async_client.post("/users", json=test_user_data)
+    response_login = await async_client.post(
+        "/login",
+        json={
+            "username": test_user_data["username"],
+            "password": test_user_data["password"],
+        },
+    )
+    access_token = response_login.json()["access_token"]
+
+    with count_commands() as commands:
+        response_get = await async_client.get(
+            "/jenkins-histories/me",
+            headers={"Authorization": f"Bearer {access_token}"},
+        )
+
+    assert response_get.status_code == status.HTTP_200_OK
+    assert commands == ["find"]
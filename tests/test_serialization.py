@@ -0,0 +1,79 @@
+import json
+import pytest
+from httpx import AsyncClient
+from fastapi import status
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from app.utils.constants import Serialization
+from app.utils.serialization import FastJSONResponse
+from benchmarks.serialization import get_route, get_benchmark_jenkins_log
+from tests.ancillary import get_headers, build_jenkins_log
+
+
+test_user_data = {
+    "username": "juser",
+    "email": "juser@gmail.com",
+    "password": "Juser123_",
+    "is_active": True,
+}
+
+
+@pytest.mark.asyncio
+async def test_get_jenkins_log_fast_json(
+    async_client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+):
+    response_user = await async_client.post("/users", json=test_user_data)
+    hashed_credentials = response_user.json()["hashed_credentials"]
+
+    for test_results in (
+        [("test_login", "Pass", None), ("test_ünïcode", "Fail", "AssertionError")],
+        [("test_logout", "Error", "KeyError")],
+    ):
+        await async_client.post(
+            "/jenkins-logs/me/upload",
+            content=build_jenkins_log(test_results),
+            headers=get_headers(hashed_credentials),
+        )
+
+    responses = {}
+    for fast_json in (False, True):
+        monkeypatch.setattr(Serialization, "FAST_JSON", fast_json)
+        response_list = await async_client.get(
+            "/jenkins-logs/me",
+            params={"limit": 1},
+            headers=get_headers(hashed_credentials),
+        )
+        response_get = await async_client.get(
+            f"/jenkins-logs/me/{response_list.json()[0]['id']}",
+            headers=get_headers(hashed_credentials),
+        )
+        responses[fast_json] = response_list, response_get
+
+    for response_default, response_fast in zip(responses[False], responses[True]):
+        assert response_fast.status_code == status.HTTP_200_OK
+        assert response_fast.headers["content-type"] == "application/json"
+        assert response_fast.json() == response_default.json()
+    assert responses[True][0].headers["X-Next-Cursor"] == (
+        responses[False][0].headers["X-Next-Cursor"]
+    )
+
+    response_openapi = await async_client.get("/openapi.json")
+    assert response_openapi.json()["paths"]["/jenkins-logs/me/{id}"]["get"][
+        "responses"
+    ]["200"]["content"]["application/json"]["schema"] == {
+        "$ref": "#/components/schemas/JenkinsLogResponse"
+    }
+
+
+@pytest.mark.asyncio
+async def test_fast_json_response_body():
+    jenkins_log = get_benchmark_jenkins_log(1_000)
+    response_field = get_route("/jenkins-logs/me/{id}", "GET").response_field
+
+    response_default = JSONResponse(
+        await serialize_response(field=response_field, response_content=jenkins_log)
+    )
+
+    assert json.loads(FastJSONResponse(jenkins_log).body) == json.loads(
+        response_default.body
+    )
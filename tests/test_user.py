@@ -1,6 +1,8 @@
 import pytest
 from httpx import AsyncClient
 from fastapi import status
+from app.main import startup_db_client
+from app.utils.constants import Authentication
 from tests.ancillary import get_headers, swapped_in_half
 
 
@@ -27,6 +29,42 @@ async def test_login_positive(async_client: AsyncClient):
     assert response_login.status_code == status.HTTP_200_OK
 
 
+@pytest.mark.asyncio
+async def test_login_session_token(async_client: AsyncClient, monkeypatch):
+    await async_client.post("/users", json=test_user_data)
+    response_login = await async_client.post(
+        "/login",
+        json={
+            "username": test_user_data["username"],
+            "password": test_user_data["password"],
+        },
+    )
+    access_token = response_login.json()["access_token"]
+
+    response_get = await async_client.get(
+        "/users/me", headers={"Authorization": f"Bearer {access_token}"}
+    )
+    assert response_get.status_code == status.HTTP_200_OK
+    assert response_get.json()["username"] == test_user_data["username"]
+
+    # -> Negative scenario
+    response_get = await async_client.get(
+        "/users/me",
+        headers={"Authorization": f"Bearer {swapped_in_half(access_token)}"},
+    )
+    assert response_get.status_code == status.HTTP_401_UNAUTHORIZED
+
+    # -> Revoked token is rejected once it is checked against the database
+    monkeypatch.setattr(Authentication, "TOKEN_REVALIDATION_WINDOW", float("inf"))
+    await async_client.post(
+        "/logout", headers={"Authorization": f"Bearer {access_token}"}
+    )
+    response_get = await async_client.get(
+        "/users/me", headers={"Authorization": f"Bearer {access_token}"}
+    )
+    assert response_get.status_code == status.HTTP_401_UNAUTHORIZED
+
+
 @pytest.mark.asyncio
 async def test_login_negative(async_client: AsyncClient):
     response = await async_client.post(
@@ -253,3 +291,11 @@ async def test_delete_user_negative(async_client: AsyncClient):
     await async_client.post("/users", json=test_user_data)
     response_delete = await async_client.delete("/users/me")
     assert response_delete.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.asyncio
+async def test_startup_without_secret_key(monkeypatch):
+    monkeypatch.setattr(Authentication, "SECRET_KEY", None)
+
+    with pytest.raises(RuntimeError):
+        await startup_db_client()